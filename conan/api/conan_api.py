@@ -16,6 +16,7 @@ from conan.api.subapi.remotes import RemotesAPI
 from conan.api.subapi.remove import RemoveAPI
 from conan.api.subapi.search import SearchAPI
 from conan.api.subapi.upload import UploadAPI
+from conan.internal.conan_app import ConanAppCache
 from conans.client.conf.required_version import check_required_conan_version
 from conans.client.migrations import ClientMigrator
 from conans.client.userio import init_colorama
@@ -39,6 +40,8 @@ class ConanAPI(object):
         migrator = ClientMigrator(self.cache_folder, Version(client_version))
         migrator.migrate()
         check_required_conan_version(self.cache_folder)
+        # The ConanApp state is reused among calls, as long as the home files don't change
+        self.app_cache = ConanAppCache(self.cache_folder)
 
         self.remotes = RemotesAPI(self)
         # Search recipes by wildcard and packages filtering by configuracion
@@ -57,3 +60,17 @@ class ConanAPI(object):
         self.cache = CacheAPI(self)
         self.lockfile = LockfileAPI(self)
         self.local = LocalAPI(self)
+
+    def reinit(self):
+        """ Discard the loaded configuration, plugins, http sessions, etc. so they are loaded
+        again in the next calls. Changes in the Conan home files are automatically detected, this
+        is only necessary for other changes, like environment variables used in global.conf
+        """
+        self.app_cache.invalidate()
+
+    def close(self):
+        """ Release the http sessions and the cache database connections of all the threads, for
+        example before removing the Conan home, that is not possible in Windows with open files.
+        The ConanAPI can still be used later, they are opened again
+        """
+        self.app_cache.invalidate()
@@ -13,15 +13,18 @@ class ConfigAPI:
                 source_folder=None, target_folder=None):
         # TODO: We probably want to split this into git-folder-http cases?
         from conans.client.conf.config_installer import configuration_install
-        app = ConanApp(self.conan_api.cache_folder)
-        return configuration_install(app, path_or_url, verify_ssl,
-                                     config_type=config_type, args=args,
-                                     source_folder=source_folder, target_folder=target_folder)
+        app = ConanApp(self.conan_api)
+        try:
+            return configuration_install(app, path_or_url, verify_ssl,
+                                         config_type=config_type, args=args,
+                                         source_folder=source_folder, target_folder=target_folder)
+        finally:
+            self.conan_api.reinit()  # The installed files can have kept the same timestamps
 
     def get(self, name, default=None, check_type=None):
-        app = ConanApp(self.conan_api.cache_folder)
+        app = ConanApp(self.conan_api)
         return app.cache.new_config.get(name, default=default, check_type=check_type)
 
     def show(self, pattern):
-        app = ConanApp(self.conan_api.cache_folder)
+        app = ConanApp(self.conan_api)
         return app.cache.new_config.show(pattern)
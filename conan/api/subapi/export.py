@@ -12,12 +12,12 @@ class ExportAPI:
 
     def export(self, path, name, version, user, channel, lockfile=None, remotes=None):
         ConanOutput().title("Exporting recipe to the cache")
-        app = ConanApp(self.conan_api.cache_folder)
+        app = ConanApp(self.conan_api)
         return cmd_export(app, path, name, version, user, channel, graph_lock=lockfile,
                           remotes=remotes)
 
     def export_pkg(self, deps_graph, source_folder, output_folder):
-        app = ConanApp(self.conan_api.cache_folder)
+        app = ConanApp(self.conan_api)
         cache, hook_manager = app.cache, app.hook_manager
 
         # The graph has to be loaded with build_mode=[ref.name], so that node is not tried
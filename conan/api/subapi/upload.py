@@ -19,7 +19,7 @@ class UploadAPI:
     def check_upstream(self, package_list, remote, enabled_remotes, force=False):
         """Check if the artifacts are already in the specified remote, skipping them from
         the package_list in that case"""
-        app = ConanApp(self.conan_api.cache_folder)
+        app = ConanApp(self.conan_api)
         for ref, bundle in package_list.refs().items():
             layout = app.cache.recipe_layout(ref)
             conanfile_path = layout.conanfile()
@@ -31,7 +31,7 @@ class UploadAPI:
 
         UploadUpstreamChecker(app).check(package_list, remote, force)
 
-    def prepare(self, package_list, enabled_remotes, metadata=None):
+    def prepare(self, package_list, enabled_remotes, metadata=None, remote=None):
         """Compress the recipes and packages and fill the upload_data objects
         with the complete information. It doesn't perform the upload nor checks upstream to see
         if the recipe is still there
@@ -39,12 +39,14 @@ class UploadAPI:
         :param enabled_remotes:
         :param metadata: A list of patterns of metadata that should be uploaded. Default None
         means all metadata will be uploaded together with the pkg artifacts. If metadata is empty
-        string (""), it means that no metadata files should be uploaded."""
+        string (""), it means that no metadata files should be uploaded.
+        :param remote: The remote the artifacts will be uploaded to. If defined, the
+        "core.upload:compression_format=zstd" is only used if the remote can store zstd files"""
         if metadata and metadata != [''] and '' in metadata:
             raise ConanException("Empty string and patterns can not be mixed for metadata.")
-        app = ConanApp(self.conan_api.cache_folder)
+        app = ConanApp(self.conan_api)
         preparator = PackagePreparator(app)
-        preparator.prepare(package_list, enabled_remotes)
+        preparator.prepare(package_list, enabled_remotes, remote)
         if metadata != ['']:
             gather_metadata(package_list, app.cache, metadata)
         signer = PkgSignaturesPlugin(app.cache)
@@ -52,13 +54,13 @@ class UploadAPI:
         signer.sign(package_list)
 
     def upload(self, package_list, remote):
-        app = ConanApp(self.conan_api.cache_folder)
+        app = ConanApp(self.conan_api)
         app.remote_manager.check_credentials(remote)
         executor = UploadExecutor(app)
         executor.upload(package_list, remote)
 
     def upload_backup_sources(self, package_list):
-        app = ConanApp(self.conan_api.cache_folder)
+        app = ConanApp(self.conan_api)
         config = app.cache.new_config
         url = config.get("core.sources:upload_url")
         if url is None:
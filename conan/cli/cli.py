@@ -33,12 +33,16 @@ class Cli:
         self._conan_api = conan_api
         self._groups = defaultdict(list)
         self._commands = {}
+        self._registry = {}  # {name: (import_path, method_name, package)} of not imported commands
 
     def _add_commands(self):
+        """ registers all the built-in and custom commands by their module names, without
+        importing them. Only the executed command is imported, or all of them for the help
+        """
         conan_commands_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "commands")
         for module in pkgutil.iter_modules([conan_commands_path]):
             module_name = module[1]
-            self._add_command("conan.cli.commands.{}".format(module_name), module_name)
+            self._register_command("conan.cli.commands.{}".format(module_name), module_name)
 
         custom_commands_path = HomePaths(self._conan_api.cache_folder).custom_commands_path
         if not os.path.isdir(custom_commands_path):
@@ -48,11 +52,7 @@ class Cli:
         for module in pkgutil.iter_modules([custom_commands_path]):
             module_name = module[1]
             if module_name.startswith("cmd_"):
-                try:
-                    self._add_command(module_name, module_name.replace("cmd_", ""))
-                except Exception as e:
-                    ConanOutput().error("Error loading custom command "
-                                        "'{}.py': {}".format(module_name, e))
+                self._register_command(module_name, module_name.replace("cmd_", ""))
         # layers
         for folder in os.listdir(custom_commands_path):
             layer_folder = os.path.join(custom_commands_path, folder)
@@ -63,11 +63,37 @@ class Cli:
                 module_name = module[1]
                 if module_name.startswith("cmd_"):
                     module_path = f"{folder}.{module_name}"
-                    try:
-                        self._add_command(module_path, module_name.replace("cmd_", ""),
-                                          package=folder)
-                    except Exception as e:
-                        ConanOutput().error(f"Error loading custom command {module_path}: {e}")
+                    self._register_command(module_path, module_name.replace("cmd_", ""),
+                                           package=folder)
+
+    def _register_command(self, import_path, method_name, package=None):
+        # The command name is the one of its method, that has to be the same as the module one
+        name = method_name.replace("_", "-")
+        name = f"{package}:{name}" if package else name
+        self._registry[name] = import_path, method_name, package
+
+    def _load_command(self, name):
+        """ imports the module of a registered command, returns None if there is no such command
+        """
+        registered = self._registry.pop(name, None)
+        if registered is not None:
+            import_path, method_name, package = registered
+            if import_path.startswith("conan.cli.commands."):
+                self._add_command(import_path, method_name)
+            else:
+                try:
+                    self._add_command(import_path, method_name, package)
+                except Exception as e:
+                    if package:
+                        ConanOutput().error(f"Error loading custom command {import_path}: {e}")
+                    else:
+                        ConanOutput().error("Error loading custom command "
+                                            "'{}.py': {}".format(import_path, e))
+        return self._commands.get(name)
+
+    def _load_commands(self):
+        for name in list(self._registry):
+            self._load_command(name)
 
     def _add_command(self, import_path, method_name, package=None):
         try:
@@ -93,6 +119,7 @@ class Cli:
         """ Looks for similar commands and prints them if found.
         """
         output = ConanOutput()
+        self._load_commands()
         matches = get_close_matches(
             word=command, possibilities=self._commands.keys(), n=5, cutoff=0.75)
 
@@ -113,6 +140,7 @@ class Cli:
         """
         Prints a summary of all commands.
         """
+        self._load_commands()
         max_len = max((len(c) for c in self._commands)) + 1
         line_format = '{{: <{}}}'.format(max_len)
 
@@ -152,9 +180,8 @@ class Cli:
         except IndexError:  # No parameters
             self._output_help_cli()
             return
-        try:
-            command = self._commands[command_argument]
-        except KeyError as exc:
+        command = self._load_command(command_argument)
+        if command is None:
             if command_argument in ["-v", "--version"]:
                 cli_out_write("Conan version %s" % client_version)
                 return
@@ -166,7 +193,7 @@ class Cli:
             output.info("'%s' is not a Conan command. See 'conan --help'." % command_argument)
             output.info("")
             self._print_similar(command_argument)
-            raise ConanException("Unknown command %s" % str(exc))
+            raise ConanException("Unknown command '%s'" % command_argument)
 
         try:
             command.run(self._conan_api, args[0][1:])
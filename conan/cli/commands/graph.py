@@ -124,12 +124,18 @@ def graph_info(conan_api, parser, subparser, *args):
                            help="Deployer output folder, base build folder by default if not set")
     subparser.add_argument("--build-require", action='store_true', default=False,
                            help='Whether the provided reference is a build-require')
+    subparser.add_argument("--compact", action='store_true', default=False,
+                           help="Write the repeated settings, options and conf blocks of the "
+                                "nodes once, in 'interned', and their index in the nodes. "
+                                "Only for the 'json' format")
     args = parser.parse_args(*args)
 
     # parameter validation
     validate_common_graph_args(args)
     if args.format in ("html", "dot") and args.filter:
         raise ConanException(f"Formatted output '{args.format}' cannot filter fields")
+    if args.compact and args.format != "json":
+        raise ConanException("The --compact output is only for the 'json' format")
 
     cwd = os.getcwd()
     path = conan_api.local.get_conanfile_path(args.path, cwd, py=None) if args.path else None
@@ -178,4 +184,5 @@ def graph_info(conan_api, parser, subparser, *args):
     return {"graph": deps_graph,
             "field_filter": args.filter,
             "package_filter": args.package_filter,
+            "compact": args.compact,
             "conan_api": conan_api}
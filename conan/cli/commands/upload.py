@@ -102,7 +102,7 @@ def upload(conan_api: ConanAPI, parser, *args):
             conan_api.cache.check_integrity(package_list)
         # Check if the recipes/packages are in the remote
         conan_api.upload.check_upstream(package_list, remote, enabled_remotes, args.force)
-        conan_api.upload.prepare(package_list, enabled_remotes, args.metadata)
+        conan_api.upload.prepare(package_list, enabled_remotes, args.metadata, remote)
 
         if not args.dry_run:
             conan_api.upload.upload(package_list, remote)
@@ -1,5 +1,6 @@
 import json
 import os
+from types import GeneratorType
 
 from jinja2 import Template, select_autoescape
 
@@ -138,9 +139,31 @@ def format_graph_json(result):
     graph = result["graph"]
     field_filter = result.get("field_filter")
     package_filter = result.get("package_filter")
-    serial = graph.serialize()
-    serial = filter_graph(serial, package_filter=package_filter, field_filter=field_filter)
-    json_result = json.dumps({"graph": serial}, indent=4)
-    cli_out_write(json_result)
+    compact = result.get("compact", False)
+    # The nodes are serialized and written one by one, not the whole serialized graph at once
+    items = graph.serialize_items(fields=field_filter, package_filter=package_filter,
+                                  compact=compact)
+    _write_json((("graph", items), ))
+    cli_out_write("")
     if graph.error:
         raise graph.error
+
+
+def _write_json(items, level=0):
+    """ writes the (key, value) items as a json object, the same as json.dumps(indent=4) would do.
+    The values that are generators are also (key, value) items, written as they are generated
+    """
+    indent = " " * 4 * (level + 1)
+    separator = "{"
+    for key, value in items:
+        cli_out_write(f"{separator}\n{indent}{json.dumps(key)}: ", endline="")
+        if isinstance(value, GeneratorType):
+            _write_json(value, level + 1)
+        else:
+            value = json.dumps(value, indent=4).replace("\n", "\n" + indent)
+            cli_out_write(value, endline="")
+        separator = ","
+    if separator == "{":
+        cli_out_write("{}", endline="")
+    else:
+        cli_out_write(f"\n{indent[4:]}}}", endline="")
@@ -29,8 +29,7 @@ def format_graph_info(result):
 
     out = ConanOutput()
     out.title("Basic graph information")
-    serial = graph.serialize()
-    serial = filter_graph(serial, package_filter, field_filter)
+    serial = graph.serialize(fields=field_filter, package_filter=package_filter)
     for n in serial["nodes"].values():
         out.writeln(f"{n['ref']}:")  # FIXME: This can be empty for consumers and it is ugly ":"
         _serial_pretty_printer(n, indent="  ")
@@ -17,9 +17,9 @@ from conans.util.files import rmdir, renamedir
 
 class DataCache:
 
-    def __init__(self, base_folder, db_filename):
+    def __init__(self, base_folder, db_filename, wal=False):
         self._base_folder = os.path.abspath(base_folder)
-        self._db = CacheDatabase(filename=db_filename)
+        self._db = CacheDatabase(filename=db_filename, wal=wal)
 
     def _create_path(self, relative_path, remove_contents=True):
         path = self._full_path(relative_path)
@@ -149,6 +149,9 @@ class DataCache:
     def list_references(self):
         return self._db.list_references()
 
+    def get_recipe_versions(self, name):
+        return self._db.get_recipe_versions(name)
+
     def exists_prev(self, pref):
         return self._db.exists_prev(pref)
 
@@ -244,3 +247,9 @@ class DataCache:
 
     def update_package_lru(self, pref):
         self._db.update_package_lru(pref)
+
+    def flush_lru(self):
+        self._db.flush_lru()
+
+    def close(self):
+        self._db.close()
@@ -3,7 +3,7 @@ from contextlib import contextmanager
 
 from conans.model.manifest import FileTreeManifest
 from conans.paths import CONANFILE, DATA_YML
-from conans.util.files import set_dirty, clean_dirty, is_dirty, rmdir
+from conans.util.files import set_dirty, clean_dirty, is_dirty, rmdir, remove
 
 
 # To be able to change them later to something shorter
@@ -14,6 +14,7 @@ EXPORT_FOLDER = "e"
 EXPORT_SRC_FOLDER = "es"
 DOWNLOAD_EXPORT_FOLDER = "d"
 METADATA = "metadata"
+MANIFEST_HASHES = "manifest_hashes.json"  # To not hash again the unchanged files
 
 
 class LayoutBase:
@@ -28,6 +29,14 @@ class LayoutBase:
     def remove(self):
         rmdir(self.base_folder)
 
+    def manifest_hashes(self):
+        return os.path.join(self.base_folder, MANIFEST_HASHES)
+
+    def _remove_manifest_hashes(self):
+        hashes = self.manifest_hashes()
+        if os.path.isfile(hashes):
+            remove(hashes)
+
 
 class RecipeLayout(LayoutBase):
     # TODO: cache2.0 fix this in the future when we only have to deal
@@ -70,7 +79,8 @@ class RecipeLayout(LayoutBase):
         export_folder = self.export()
         readed_manifest = FileTreeManifest.load(export_folder)
         exports_source_folder = self.export_sources()
-        expected_manifest = FileTreeManifest.create(export_folder, exports_source_folder)
+        expected_manifest = FileTreeManifest.create(export_folder, exports_source_folder,
+                                                    hashes_cache=self.manifest_hashes())
         return readed_manifest, expected_manifest
 
     def sources_remove(self):
@@ -84,6 +94,7 @@ class RecipeLayout(LayoutBase):
         rmdir(export_src_folder)
         download_export = self.download_export()
         rmdir(download_export)
+        self._remove_manifest_hashes()
 
 
 class PackageLayout(LayoutBase):
@@ -121,7 +132,8 @@ class PackageLayout(LayoutBase):
     def package_manifests(self):
         package_folder = self.package()
         readed_manifest = FileTreeManifest.load(package_folder)
-        expected_manifest = FileTreeManifest.create(package_folder)
+        expected_manifest = FileTreeManifest.create(package_folder,
+                                                    hashes_cache=self.manifest_hashes())
         return readed_manifest, expected_manifest
 
     @contextmanager
@@ -143,5 +155,6 @@ class PackageLayout(LayoutBase):
         tgz_folder = self.download_package()
         rmdir(tgz_folder)
         rmdir(self.package())
+        self._remove_manifest_hashes()
         if is_dirty(self.package()):
             clean_dirty(self.package())
@@ -1,5 +1,7 @@
 import os
 import sqlite3
+import threading
+import weakref
 
 from conan.api.output import ConanOutput
 from conan.internal.cache.db.packages_table import PackagesDBTable
@@ -11,20 +13,52 @@ from conans.model.version import Version
 
 class CacheDatabase:
 
-    def __init__(self, filename):
+    def __init__(self, filename, wal=False):
         version = sqlite3.sqlite_version
         if Version(version) < "3.7.11":  # Not an exception, in case some false positives
             ConanOutput().error(f"Your sqlite3 '{version} < 3.7.11' version is not supported")
-        self._recipes = RecipesDBTable(filename)
-        self._packages = PackagesDBTable(filename)
+        self._recipes = RecipesDBTable(filename, wal)
+        self._packages = PackagesDBTable(filename, wal)
         if not os.path.isfile(filename):
             self._recipes.create_table()
             self._packages.create_table()
+        # The LRU updates are very frequent (every node of every install), they are accumulated
+        # and written together in a single transaction with flush_lru()
+        self._lru_lock = threading.Lock()
+        self._lru_recipes = {}  # {repr(ref): ref}
+        self._lru_packages = {}  # {repr(pref): pref}
+        # Make sure they are written even if flush_lru() is never explicitly called. A process
+        # killed before (SIGKILL, os._exit()...) loses them, the LRU times will be a bit older
+        weakref.finalize(self, CacheDatabase._write_lru, self._recipes, self._packages,
+                         self._lru_lock, self._lru_recipes, self._lru_packages)
+
+    @staticmethod
+    def _write_lru(recipes, packages, lock, lru_recipes, lru_packages):
+        with lock:
+            if not os.path.isfile(recipes.filename):  # The cache was removed meanwhile
+                lru_recipes.clear()
+                lru_packages.clear()
+                return
+            if lru_recipes:
+                recipes.update_lru(lru_recipes.values())
+                lru_recipes.clear()
+            if lru_packages:
+                packages.update_lru(lru_packages.values())
+                lru_packages.clear()
+
+    def flush_lru(self):
+        self._write_lru(self._recipes, self._packages, self._lru_lock, self._lru_recipes,
+                        self._lru_packages)
+
+    def close(self):
+        """ writes the pending LRU updates and closes the connections of all the threads to the
+        database file. It is opened again if it is used later
+        """
+        self.flush_lru()
+        self._recipes.close()  # Both tables are in the same file
 
     def exists_prev(self, ref):
-        # TODO: This logic could be done directly against DB
-        matching_prevs = self.get_package_revisions_references(ref)
-        return len(matching_prevs) > 0
+        return self.get_latest_package_reference(ref) is not None
 
     def get_latest_package_reference(self, ref):
         prevs = self.get_package_revisions_references(ref, True)
@@ -37,23 +71,29 @@ class CacheDatabase:
         self._packages.update_timestamp(pref, path=path, build_id=build_id)
 
     def get_recipe_lru(self, ref):
+        self.flush_lru()
         return self._recipes.get_recipe(ref)["lru"]
 
     def get_package_lru(self, pref: PkgReference):
+        self.flush_lru()
         return self._packages.get(pref)["lru"]
 
     def update_recipe_lru(self, ref):
-        self._recipes.update_lru(ref)
+        with self._lru_lock:
+            self._lru_recipes[ref.repr_notime()] = ref
 
     def update_package_lru(self, pref):
-        self._packages.update_lru(pref)
+        with self._lru_lock:
+            self._lru_packages[pref.repr_notime()] = pref
 
     def remove_recipe(self, ref: RecipeReference):
+        self.flush_lru()
         # Removing the recipe must remove all the package binaries too from DB
         self._recipes.remove(ref)
         self._packages.remove_recipe(ref)
 
     def remove_package(self, ref: PkgReference):
+        self.flush_lru()
         # Removing the recipe must remove all the package binaries too from DB
         self._packages.remove(ref)
 
@@ -61,12 +101,7 @@ class CacheDatabase:
         self._packages.remove_build_id(pref)
 
     def get_matching_build_id(self, ref, build_id):
-        # TODO: This can also be done in a single query in DB
-        for d in self._packages.get_package_references(ref):
-            existing_build_id = d["build_id"]
-            if existing_build_id == build_id:
-                return d["pref"]
-        return None
+        return self._packages.get_matching_build_id(ref, build_id)
 
     def get_recipe(self, ref: RecipeReference):
         """ Returns the reference data as a dictionary (or fails) """
@@ -94,6 +129,9 @@ class CacheDatabase:
         return [d["ref"]
                 for d in self._recipes.all_references()]
 
+    def get_recipe_versions(self, name):
+        return sorted(self._recipes.get_recipe_versions(name))
+
     def get_package_revisions_references(self, pref: PkgReference, only_latest_prev=False):
         return [d["pref"]
                 for d in self._packages.get_package_revisions_references(pref, only_latest_prev)]
@@ -18,6 +18,8 @@ class PackagesDBTable(BaseDbTable):
                            ('build_id', str, True),
                            ('lru', int)]
     unique_together = ('reference', 'rrev', 'pkgid', 'prev')
+    indexes = [('reference', 'rrev', 'pkgid', 'timestamp'),
+               ('reference', 'rrev', 'build_id')]
 
     @staticmethod
     def _as_dict(row):
@@ -39,8 +41,9 @@ class PackagesDBTable(BaseDbTable):
             self.columns.prev: pref.revision,
         }
         where_expr = ' AND '.join(
-            [f'{k}="{v}" ' if v is not None else f'{k} IS NULL' for k, v in where_dict.items()])
-        return where_expr
+            [f'{k} = ?' if v is not None else f'{k} IS NULL' for k, v in where_dict.items()])
+        params = [v for v in where_dict.values() if v is not None]
+        return where_expr, params
 
     def _set_clause(self, pref: PkgReference, path=None, build_id=None):
         set_dict = {
@@ -52,17 +55,18 @@ class PackagesDBTable(BaseDbTable):
             self.columns.timestamp: pref.timestamp,
             self.columns.build_id: build_id,
         }
-        set_expr = ', '.join([f'{k} = "{v}"' for k, v in set_dict.items() if v is not None])
-        return set_expr
+        set_dict = {k: v for k, v in set_dict.items() if v is not None}
+        set_expr = ', '.join([f'{k} = ?' for k in set_dict])
+        return set_expr, list(set_dict.values())
 
     def get(self, pref: PkgReference):
         """ Returns the row matching the reference or fails """
-        where_clause = self._where_clause(pref)
+        where_clause, params = self._where_clause(pref)
         query = f'SELECT * FROM {self.table_name} ' \
                 f'WHERE {where_clause};'
 
         with self.db_connection() as conn:
-            r = conn.execute(query)
+            r = conn.execute(query, params)
             row = r.fetchone()
 
         if not row:
@@ -89,85 +93,80 @@ class PackagesDBTable(BaseDbTable):
     def update_timestamp(self, pref: PkgReference, path: str, build_id: str):
         assert pref.revision
         assert pref.timestamp
-        where_clause = self._where_clause(pref)
-        set_clause = self._set_clause(pref, path=path, build_id=build_id)
+        where_clause, where_params = self._where_clause(pref)
+        set_clause, set_params = self._set_clause(pref, path=path, build_id=build_id)
         query = f"UPDATE {self.table_name} " \
                 f"SET {set_clause} " \
                 f"WHERE {where_clause};"
         with self.db_connection() as conn:
             try:
-                conn.execute(query)
+                conn.execute(query, set_params + where_params)
             except sqlite3.IntegrityError:
                 raise ConanReferenceAlreadyExistsInDB(f"Reference '{repr(pref)}' already exists")
 
-    def update_lru(self, pref):
-        assert pref.revision is not None
-        # TODO: InstallGraph is dropping the pref.timestamp, cannot be checked here yet
-        # assert pref.timestamp is not None, f"PREF _TIMESSTAMP IS NONE {repr(pref)}"
-        where_clause = self._where_clause(pref)
+    def update_lru(self, prefs):
+        """ updates the LRU of many package references at once, in a single transaction
+        """
         lru = timestamp_now()
+        params = []
+        for pref in prefs:
+            assert pref.revision is not None
+            # TODO: InstallGraph is dropping the pref.timestamp, cannot be checked here yet
+            # assert pref.timestamp is not None, f"PREF _TIMESSTAMP IS NONE {repr(pref)}"
+            params.append((lru, str(pref.ref), pref.ref.revision, pref.package_id, pref.revision))
         query = f"UPDATE {self.table_name} " \
-                f'SET {self.columns.lru} = "{lru}" ' \
-                f"WHERE {where_clause};"
-        with self.db_connection() as conn:
-            conn.execute(query)
+                f"SET {self.columns.lru} = ? " \
+                f"WHERE {self.columns.reference} = ? AND {self.columns.rrev} = ? " \
+                f"AND {self.columns.pkgid} = ? AND {self.columns.prev} = ?;"
+        with self.db_transaction() as conn:
+            conn.executemany(query, params)
 
     def remove_build_id(self, pref):
-        where_clause = self._where_clause(pref)
+        where_clause, params = self._where_clause(pref)
         query = f"UPDATE {self.table_name} " \
-                f'SET {self.columns.build_id} = "null" ' \
+                f"SET {self.columns.build_id} = 'null' " \
                 f"WHERE {where_clause};"
         with self.db_connection() as conn:
             try:
-                conn.execute(query)
+                conn.execute(query, params)
             except sqlite3.IntegrityError:
                 raise ConanReferenceAlreadyExistsInDB(f"Reference '{repr(pref)}' already exists")
 
     def remove_recipe(self, ref: RecipeReference):
         # can't use the _where_clause, because that is an exact match on the package_id, etc
         query = f"DELETE FROM {self.table_name} " \
-                f'WHERE {self.columns.reference} = "{str(ref)}" ' \
-                f'AND {self.columns.rrev} = "{ref.revision}" '
+                f"WHERE {self.columns.reference} = ? " \
+                f"AND {self.columns.rrev} = ?;"
         with self.db_connection() as conn:
-            conn.execute(query)
+            conn.execute(query, (str(ref), ref.revision))
 
     def remove(self, pref: PkgReference):
-        where_clause = self._where_clause(pref)
+        where_clause, params = self._where_clause(pref)
         query = f"DELETE FROM {self.table_name} " \
                 f"WHERE {where_clause};"
         with self.db_connection() as conn:
-            conn.execute(query)
+            conn.execute(query, params)
 
     def get_package_revisions_references(self, pref: PkgReference, only_latest_prev=False):
         assert pref.ref.revision, "To search package revisions you must provide a recipe revision."
         assert pref.package_id, "To search package revisions you must provide a package id."
-        check_prev = f'AND {self.columns.prev} = "{pref.revision}" ' if pref.revision else ''
+        params = [str(pref.ref), pref.ref.revision, pref.package_id]
+        check_prev = ""
+        if pref.revision:
+            check_prev = f"AND {self.columns.prev} = ? "
+            params.append(pref.revision)
+        # The (reference, rrev, pkgid, timestamp) index returns them already sorted
+        query = f'SELECT * FROM {self.table_name} ' \
+                f'WHERE {self.columns.reference} = ? ' \
+                f'AND {self.columns.rrev} = ? ' \
+                f'AND {self.columns.pkgid} = ? ' \
+                f'{check_prev}' \
+                f'AND {self.columns.prev} IS NOT NULL ' \
+                f'ORDER BY {self.columns.timestamp} DESC'
         if only_latest_prev:
-            query = f'SELECT {self.columns.reference}, ' \
-                    f'{self.columns.rrev}, ' \
-                    f'{self.columns.pkgid}, ' \
-                    f'{self.columns.prev}, ' \
-                    f'{self.columns.path}, ' \
-                    f'MAX({self.columns.timestamp}), ' \
-                    f'{self.columns.build_id}, ' \
-                    f'{self.columns.lru} ' \
-                    f'FROM {self.table_name} ' \
-                    f'WHERE {self.columns.rrev} = "{pref.ref.revision}" ' \
-                    f'AND {self.columns.reference} = "{str(pref.ref)}" ' \
-                    f'AND {self.columns.pkgid} = "{pref.package_id}" ' \
-                    f'{check_prev} ' \
-                    f'AND {self.columns.prev} IS NOT NULL ' \
-                    f'GROUP BY {self.columns.pkgid} '
-        else:
-            query = f'SELECT * FROM {self.table_name} ' \
-                    f'WHERE {self.columns.rrev} = "{pref.ref.revision}" ' \
-                    f'AND {self.columns.reference} = "{str(pref.ref)}" ' \
-                    f'AND {self.columns.pkgid} = "{pref.package_id}" ' \
-                    f'{check_prev} ' \
-                    f'AND {self.columns.prev} IS NOT NULL ' \
-                    f'ORDER BY {self.columns.timestamp} DESC'
+            query += ' LIMIT 1'
         with self.db_connection() as conn:
-            r = conn.execute(query)
+            r = conn.execute(query, params)
             for row in r.fetchall():
                 yield self._as_dict(self.row_type(*row))
 
@@ -185,16 +184,36 @@ class PackagesDBTable(BaseDbTable):
                     f'{self.columns.build_id}, ' \
                     f'{self.columns.lru} ' \
                     f'FROM {self.table_name} ' \
-                    f'WHERE {self.columns.rrev} = "{ref.revision}" ' \
-                    f'AND {self.columns.reference} = "{str(ref)}" ' \
+                    f'WHERE {self.columns.reference} = ? ' \
+                    f'AND {self.columns.rrev} = ? ' \
                     f'GROUP BY {self.columns.pkgid} '
         else:
             query = f'SELECT * FROM {self.table_name} ' \
-                    f'WHERE {self.columns.rrev} = "{ref.revision}" ' \
-                    f'AND {self.columns.reference} = "{str(ref)}" ' \
+                    f'WHERE {self.columns.reference} = ? ' \
+                    f'AND {self.columns.rrev} = ? ' \
                     f'AND {self.columns.prev} IS NOT NULL ' \
                     f'ORDER BY {self.columns.timestamp} DESC'
         with self.db_connection() as conn:
-            r = conn.execute(query)
+            r = conn.execute(query, (str(ref), ref.revision))
             for row in r.fetchall():
                 yield self._as_dict(self.row_type(*row))
+
+    def get_matching_build_id(self, ref: RecipeReference, build_id):
+        """ the latest package revision of the first package_id whose latest package revision
+        was built with the given build_id, or None
+        """
+        query = f'SELECT * FROM {self.table_name} AS p ' \
+                f'WHERE {self.columns.reference} = ? ' \
+                f'AND {self.columns.rrev} = ? ' \
+                f'AND {self.columns.build_id} = ? ' \
+                f'AND {self.columns.timestamp} = (' \
+                f'SELECT MAX({self.columns.timestamp}) FROM {self.table_name} ' \
+                f'WHERE {self.columns.reference} = p.{self.columns.reference} ' \
+                f'AND {self.columns.rrev} = p.{self.columns.rrev} ' \
+                f'AND {self.columns.pkgid} = p.{self.columns.pkgid}) ' \
+                f'ORDER BY {self.columns.pkgid} ' \
+                f'LIMIT 1'
+        with self.db_connection() as conn:
+            r = conn.execute(query, (str(ref), ref.revision, build_id))
+            row = r.fetchone()
+        return self._as_dict(self.row_type(*row))["pref"] if row else None
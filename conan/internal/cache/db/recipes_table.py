@@ -14,6 +14,7 @@ class RecipesDBTable(BaseDbTable):
                            ('timestamp', float),
                            ('lru', int)]
     unique_together = ('reference', 'rrev')
+    indexes = [('reference', 'timestamp')]
 
     @staticmethod
     def _as_dict(row):
@@ -33,8 +34,9 @@ class RecipesDBTable(BaseDbTable):
             self.columns.rrev: ref.revision,
         }
         where_expr = ' AND '.join(
-            [f'{k}="{v}" ' if v is not None else f'{k} IS NULL' for k, v in where_dict.items()])
-        return where_expr
+            [f'{k} = ?' if v is not None else f'{k} IS NULL' for k, v in where_dict.items()])
+        params = [v for v in where_dict.values() if v is not None]
+        return where_expr, params
 
     def create(self, path, ref: RecipeReference):
         assert ref is not None
@@ -54,29 +56,33 @@ class RecipesDBTable(BaseDbTable):
         assert ref.revision is not None
         assert ref.timestamp is not None
         query = f"UPDATE {self.table_name} " \
-                f'SET {self.columns.timestamp} = "{ref.timestamp}" ' \
-                f'WHERE {self.columns.reference}="{str(ref)}" ' \
-                f'AND {self.columns.rrev} = "{ref.revision}" '
+                f"SET {self.columns.timestamp} = ? " \
+                f"WHERE {self.columns.reference} = ? " \
+                f"AND {self.columns.rrev} = ?;"
         with self.db_connection() as conn:
-            conn.execute(query)
+            conn.execute(query, (ref.timestamp, str(ref), ref.revision))
 
-    def update_lru(self, ref):
-        assert ref.revision is not None
-        assert ref.timestamp is not None
-        where_clause = self._where_clause(ref)
+    def update_lru(self, refs):
+        """ updates the LRU of many references at once, in a single transaction
+        """
         lru = timestamp_now()
+        params = []
+        for ref in refs:
+            assert ref.revision is not None
+            assert ref.timestamp is not None
+            params.append((lru, str(ref), ref.revision))
         query = f"UPDATE {self.table_name} " \
-                f'SET {self.columns.lru} = "{lru}" ' \
-                f"WHERE {where_clause};"
-        with self.db_connection() as conn:
-            conn.execute(query)
+                f"SET {self.columns.lru} = ? " \
+                f"WHERE {self.columns.reference} = ? AND {self.columns.rrev} = ?;"
+        with self.db_transaction() as conn:
+            conn.executemany(query, params)
 
     def remove(self, ref: RecipeReference):
-        where_clause = self._where_clause(ref)
+        where_clause, params = self._where_clause(ref)
         query = f"DELETE FROM {self.table_name} " \
                 f"WHERE {where_clause};"
         with self.db_connection() as conn:
-            conn.execute(query)
+            conn.execute(query, params)
 
     # returns all different conan references (name/version@user/channel)
     def all_references(self):
@@ -93,12 +99,25 @@ class RecipesDBTable(BaseDbTable):
             result = [self._as_dict(self.row_type(*row)) for row in r.fetchall()]
         return result
 
+    def get_recipe_versions(self, name):
+        """ all the references (name/version@user/channel, without revision) of a recipe name,
+        with a range lookup of the reference index, that starts with the name
+        """
+        # "/" is followed by "0" in ASCII, so this range contains exactly the "name/..." strings
+        query = f'SELECT DISTINCT {self.columns.reference} ' \
+                f'FROM {self.table_name} ' \
+                f'WHERE {self.columns.reference} >= ? AND {self.columns.reference} < ?'
+        with self.db_connection() as conn:
+            r = conn.execute(query, (f"{name}/", f"{name}0"))
+            ret = [RecipeReference.loads(row[0]) for row in r.fetchall()]
+        return ret
+
     def get_recipe(self, ref: RecipeReference):
         query = f'SELECT * FROM {self.table_name} ' \
-                f'WHERE {self.columns.reference}="{str(ref)}" ' \
-                f'AND {self.columns.rrev} = "{ref.revision}" '
+                f'WHERE {self.columns.reference} = ? ' \
+                f'AND {self.columns.rrev} = ?;'
         with self.db_connection() as conn:
-            r = conn.execute(query)
+            r = conn.execute(query, (str(ref), ref.revision))
             row = r.fetchone()
             if not row:
                 raise ConanReferenceDoesNotExistInDB(f"Recipe '{ref.repr_notime()}' not found")
@@ -112,11 +131,11 @@ class RecipesDBTable(BaseDbTable):
                 f'MAX({self.columns.timestamp}), ' \
                 f'{self.columns.lru} ' \
                 f'FROM {self.table_name} ' \
-                f'WHERE {self.columns.reference} = "{str(ref)}" ' \
+                f'WHERE {self.columns.reference} = ? ' \
                 f'GROUP BY {self.columns.reference} '  # OTHERWISE IT FAILS THE MAX()
 
         with self.db_connection() as conn:
-            r = conn.execute(query)
+            r = conn.execute(query, (str(ref),))
             row = r.fetchone()
             if row is None:
                 raise ConanReferenceDoesNotExistInDB(f"Recipe '{ref}' not found")
@@ -126,10 +145,10 @@ class RecipesDBTable(BaseDbTable):
     def get_recipe_revisions_references(self, ref: RecipeReference):
         assert ref.revision is None
         query = f'SELECT * FROM {self.table_name} ' \
-                f'WHERE {self.columns.reference} = "{str(ref)}" ' \
+                f'WHERE {self.columns.reference} = ? ' \
                 f'ORDER BY {self.columns.timestamp} DESC'
 
         with self.db_connection() as conn:
-            r = conn.execute(query)
+            r = conn.execute(query, (str(ref),))
             ret = [self._as_dict(self.row_type(*row))["ref"] for row in r.fetchall()]
         return ret
@@ -1,29 +1,123 @@
+import os
 import sqlite3
-from collections import namedtuple
+import threading
+from collections import namedtuple, OrderedDict
 from contextlib import contextmanager
 from typing import Tuple, List, Optional
 
 
+class _DbConnections(threading.local):
+    """ Per-thread (sqlite3 connections cannot be shared among threads) pool of open connections
+    to the database files, as opening and closing a connection for every query is expensive.
+    Connections are in autocommit mode, so keeping them open doesn't hold any lock.
+    The default rollback journal is kept unless wal=True, the WAL journal needs shared memory and
+    it doesn't work in network filesystems (NFS, SMB), where shared caches are often stored
+    """
+    max_connections = 8  # Opened db files (caches) per thread, the least recently used are closed
+    # The open connections of all the threads, so close() can close them all. Shared by all the
+    # threads, class attributes are not thread local. {id(connection): (filename, connection, pid)}
+    _opened = {}
+    _opened_lock = threading.Lock()
+
+    def __init__(self):
+        self._connections = OrderedDict()  # {filename: (connection, pid, file_id)}
+
+    @staticmethod
+    def _file_id(filename):
+        # To detect a database file that has been removed or replaced, the connection is stale
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return None
+        return stat.st_dev, stat.st_ino
+
+    def get(self, filename, wal=False):
+        existing = self._connections.pop(filename, None)
+        if existing is not None:
+            connection, pid, file_id = existing
+            # A closed connection is not in _opened, and while it is referenced here its id()
+            # cannot be reused by a new one
+            if pid == os.getpid() and file_id == self._file_id(filename) and \
+                    id(connection) in self._opened:
+                self._connections[filename] = existing
+                return connection
+            if pid == os.getpid():  # Never close in a forked process, it belongs to the parent
+                self._close(connection)
+
+        # check_same_thread=False only to be able to close() it from other threads, every
+        # connection is used only by the thread that opened it
+        connection = sqlite3.connect(filename, isolation_level=None, timeout=20,
+                                     check_same_thread=False)
+        if wal:
+            try:
+                connection.execute("PRAGMA journal_mode=WAL")
+            except sqlite3.OperationalError:  # Not all filesystems support it, keep the default
+                pass
+        with self._opened_lock:
+            self._opened[id(connection)] = filename, connection, os.getpid()
+        self._connections[filename] = connection, os.getpid(), self._file_id(filename)
+        while len(self._connections) > self.max_connections:
+            _, (old_connection, pid, _) = self._connections.popitem(last=False)
+            if pid == os.getpid():
+                self._close(old_connection)
+        return connection
+
+    def _close(self, connection):
+        with self._opened_lock:
+            self._opened.pop(id(connection), None)
+        connection.close()
+
+    def close(self, filename):
+        """ closes the connections of all the threads to the database file, so it can be removed
+        (Windows doesn't allow removing open files). The threads open a new one if they use it
+        again. It must not be called while other threads are using the database
+        """
+        with self._opened_lock:
+            opened = [(k, c) for k, (f, c, pid) in self._opened.items()
+                      if f == filename and pid == os.getpid()]
+            for key, connection in opened:
+                del self._opened[key]
+                connection.close()
+
+
+_db_connections = _DbConnections()
+
+
 class BaseDbTable:
     table_name: str = None
     columns_description: List[Tuple[str, type]] = None
     row_type: namedtuple = None
     columns: namedtuple = None
     unique_together: tuple = None
+    indexes: List[Tuple[str, ...]] = None
 
-    def __init__(self, filename):
+    def __init__(self, filename, wal=False):
         self.filename = filename
+        self._wal = wal
         column_names: List[str] = [it[0] for it in self.columns_description]
         self.row_type = namedtuple('_', column_names)
         self.columns = self.row_type(*column_names)
 
     @contextmanager
     def db_connection(self):
-        connection = sqlite3.connect(self.filename, isolation_level=None, timeout=20)
-        try:
-            yield connection
-        finally:
-            connection.close()
+        yield _db_connections.get(self.filename, self._wal)
+
+    def close(self):
+        _db_connections.close(self.filename)
+
+    @contextmanager
+    def db_transaction(self):
+        """ To execute many statements in a single transaction, much faster than doing each
+        one of them in its own autocommit transaction
+        """
+        with self.db_connection() as connection:
+            connection.execute("BEGIN")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
 
     def create_table(self):
         def field(name, typename, nullable=False, check_constraints: Optional[List] = None,
@@ -55,6 +149,16 @@ class BaseDbTable:
         table_checks = f", UNIQUE({', '.join(self.unique_together)})" if self.unique_together else ''
         with self.db_connection() as conn:
             conn.execute(f"CREATE TABLE {guard} {self.table_name} ({fields} {table_checks});")
+        self.create_indexes()
+
+    def create_indexes(self):
+        """ Also used by the migrations, to add the indexes to caches created by older versions
+        """
+        with self.db_connection() as conn:
+            for columns in self.indexes or []:
+                name = f"{self.table_name}_{'_'.join(columns)}_idx"
+                conn.execute(f"CREATE INDEX IF NOT EXISTS {name} "
+                             f"ON {self.table_name} ({', '.join(columns)});")
 
     def dump(self):
         print(f"********* BEGINTABLE {self.table_name}*************")
@@ -1,17 +1,24 @@
 import os
+import threading
+
+from jinja2 import Environment, TemplateSyntaxError, meta
 
 from conan.api.output import ConanOutput
 from conan.internal.cache.home_paths import HomePaths
 from conans.client.cache.cache import ClientCache
+from conans.client.cache.editable import EDITABLE_PACKAGES_FILE
+from conans.client.graph.compatibility import BinaryCompatibility
 from conans.client.graph.proxy import ConanProxy
 from conans.client.graph.python_requires import PyRequireLoader
 from conans.client.graph.range_resolver import RangeResolver
 from conans.client.hook_manager import HookManager
-from conans.client.loader import ConanFileLoader, load_python_file
+from conans.client.loader import ConanFileLoader, load_python_file, RecipeBytecodeCache
 from conans.client.remote_manager import RemoteManager
 from conans.client.rest.auth_manager import ConanApiAuthManager
 from conans.client.rest.conan_requester import ConanRequester
+from conans.client.rest.remote_metadata_cache import RemoteMetadataCache
 from conans.client.rest.rest_client import RestApiClientFactory
+from conans.util.files import load
 
 
 class CmdWrapper:
@@ -36,29 +43,170 @@ class ConanFileHelpers:
         self.cache = cache
 
 
-class ConanApp(object):
+class _ConanAppState:
+    """ The ConanApp components that are expensive to initialize and can be reused among different
+    ConanAPI calls: parsed global.conf, cache database, hooks, plugins, http sessions...
+    """
     def __init__(self, cache_folder):
+        self.cache = ClientCache(cache_folder)
 
-        self.cache_folder = cache_folder
-        self.cache = ClientCache(self.cache_folder)
-
-        home_paths = HomePaths(self.cache_folder)
+        home_paths = HomePaths(cache_folder)
         self.hook_manager = HookManager(home_paths.hooks_path)
         # Wraps an http_requester to inject proxies, certs, etc
         global_conf = self.cache.new_config
-        ConanOutput.define_silence_warnings(global_conf.get("core:skip_warnings", check_type=list))
         self.requester = ConanRequester(global_conf, cache_folder)
         # To handle remote connections
-        rest_client_factory = RestApiClientFactory(self.requester, global_conf)
+        metadata_ttl = global_conf.get("core.net.http:metadata_cache_ttl", check_type=int)
+        metadata_cache = None
+        if metadata_ttl is not None:
+            metadata_cache = RemoteMetadataCache(self.cache.remote_metadata_folder, metadata_ttl)
+        rest_client_factory = RestApiClientFactory(self.requester, global_conf, metadata_cache)
         # Wraps RestApiClient to add authentication support (same interface)
         auth_manager = ConanApiAuthManager(rest_client_factory, self.cache)
         # Handle remote connections
         self.remote_manager = RemoteManager(self.cache, auth_manager)
+        self.cmd_wrapper = CmdWrapper(home_paths.wrapper_path)
+        self._compatibility_path = home_paths.compatibility_plugin_path
+        self._binary_compatibility = None
+
+    def close(self, database=True):
+        """ releases the resources kept open for the next calls, like the http connections or
+        the cache database connections (of all the threads)
+        """
+        self.requester.close()
+        if database:
+            self.cache.close()
+
+    @property
+    def binary_compatibility(self):
+        if self._binary_compatibility is None:
+            self._binary_compatibility = BinaryCompatibility(self._compatibility_path)
+        return self._binary_compatibility
+
+
+class ConanAppCache:
+    """ Keeps the state of the ConanApp of a ConanAPI, so consecutive calls to the API reuse it.
+    It is initialized again if any of the home files it was loaded from changed, like global.conf,
+    the files it includes, remotes.json or the plugins, if the environment variables changed, or
+    after an explicit ``invalidate()``, that also releases the http sessions and the database
+    connections of the previous state.
+    Other inputs of the global.conf Jinja template are not detected, like includes with computed
+    names, files read with the "os" module or things found by "detect_api". ``invalidate()``
+    (ConanAPI.reinit()) is necessary after changing them
+    """
+    def __init__(self, cache_folder):
+        self._cache_folder = cache_folder
+        home_paths = HomePaths(cache_folder)
+        self._watched = [os.path.join(cache_folder, "global.conf"),
+                         home_paths.remotes_path,
+                         os.path.join(cache_folder, EDITABLE_PACKAGES_FILE),
+                         os.path.join(cache_folder, "source_credentials.json"),
+                         home_paths.wrapper_path,
+                         home_paths.hooks_path,
+                         home_paths.compatibility_plugin_path,
+                         os.path.dirname(home_paths.sign_plugin_path)]
+        self._lock = threading.Lock()
+        self._state = None
+        self._signature = None
+
+    def _files_signature(self):
+        """ the stat of the watched files, the python files inside the watched folders and the
+        templates included by global.conf, and the environment variables
+        """
+        result = {"": sorted(os.environ.items())}  # Can be used in the global.conf template
+        for path in self._watched + _global_conf_includes(self._cache_folder):
+            if os.path.isdir(path):
+                for root, _, files in os.walk(path):
+                    for f in files:
+                        if f.endswith(".py"):
+                            file_path = os.path.join(root, f)
+                            result[file_path] = _file_stat(file_path)
+            else:
+                result[path] = _file_stat(path)
+        return result
+
+    def invalidate(self):
+        with self._lock:
+            if self._state is not None:
+                self._state.close()
+                self._state = None
+
+    def get(self):
+        with self._lock:
+            if self._state is None or self._files_signature() != self._signature:
+                if self._state is not None:
+                    # Other threads could be using the database, the new state reuses the same
+                    # database connections
+                    self._state.close(database=False)
+                self._state = _ConanAppState(self._cache_folder)
+                # After the initialization, that can create some of the files, like global.conf
+                self._signature = self._files_signature()
+            return self._state
 
+
+def _global_conf_includes(cache_folder):
+    """ the files of the Conan home included, imported... by the global.conf Jinja template, and
+    recursively by them. Only the constant names, the computed ones can't be known
+    """
+    result = []
+    pending = [os.path.join(cache_folder, "global.conf")]
+    while pending:
+        path = pending.pop()
+        try:
+            text = load(path)
+        except (OSError, UnicodeDecodeError):
+            continue
+        if "{%" not in text:
+            continue
+        try:
+            names = meta.find_referenced_templates(Environment().parse(text))
+        except TemplateSyntaxError:
+            continue  # It will fail loading global.conf, with a better error
+        for name in names:
+            included = os.path.join(cache_folder, name) if name else None
+            if included is not None and included not in result:
+                result.append(included)
+                pending.append(included)
+    return result
+
+
+def _file_stat(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+class ConanApp(object):
+    def __init__(self, conan_api):
+        """ ``conan_api`` is the ConanAPI whose state is reused, or a Conan home folder, as in
+        previous versions, to load everything again, not reusing anything
+        """
+        if isinstance(conan_api, str):
+            self.cache_folder = conan_api
+            state = _ConanAppState(conan_api)
+        else:
+            self.cache_folder = conan_api.cache_folder
+            state = conan_api.app_cache.get()
+        self.cache = state.cache
+        self.hook_manager = state.hook_manager
+        global_conf = self.cache.new_config
+        ConanOutput.define_silence_warnings(global_conf.get("core:skip_warnings", check_type=list))
+        self.requester = state.requester
+        self.remote_manager = state.remote_manager
+        self._state = state
+
+        # These keep caches of the current command, like the loaded conanfiles or resolved ranges
         self.proxy = ConanProxy(self)
         self.range_resolver = RangeResolver(self)
 
         self.pyreq_loader = PyRequireLoader(self)
-        cmd_wrap = CmdWrapper(home_paths.wrapper_path)
-        conanfile_helpers = ConanFileHelpers(self.requester, cmd_wrap, global_conf, self.cache)
-        self.loader = ConanFileLoader(self.pyreq_loader, conanfile_helpers)
+        conanfile_helpers = ConanFileHelpers(self.requester, state.cmd_wrapper, global_conf,
+                                             self.cache)
+        bytecode_cache = RecipeBytecodeCache(self.cache.store, self.cache.bytecode_folder)
+        self.loader = ConanFileLoader(self.pyreq_loader, conanfile_helpers, bytecode_cache)
+
+    @property
+    def binary_compatibility(self):
+        return self._state.binary_compatibility
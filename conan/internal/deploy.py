@@ -5,7 +5,9 @@ from conan.internal.cache.home_paths import HomePaths
 from conan.api.output import ConanOutput
 from conans.client.loader import load_python_file
 from conans.errors import ConanException
-from conans.util.files import rmdir, mkdir
+from conans.model.manifest import FileTreeManifest
+from conans.paths import CONAN_MANIFEST
+from conans.util.files import rmdir, mkdir, copy_file, load, gather_files
 
 
 def _find_deployer(d, cache_deploy_folder):
@@ -70,10 +72,25 @@ def full_deploy(graph, output_folder):
 
 def _deploy_single(dep, conanfile, output_folder, folder_name):
     new_folder = os.path.join(output_folder, folder_name)
-    rmdir(new_folder)
     symlinks = conanfile.conf.get("tools.deployer:symlinks", check_type=bool, default=True)
+    mode = conanfile.conf.get("tools.deployer:mode", choices=["hardlink", "reflink", "symlink"])
+    if _deployed(dep.package_folder, new_folder, mode, symlinks):
+        conanfile.output.info(f"Deploy of '{dep}' to {new_folder} is up to date")
+        dep.set_deploy_folder(new_folder)
+        return
+
+    if os.path.islink(new_folder):
+        os.remove(new_folder)  # A previous "symlink" mode deploy, rmdir() can't remove it
+    rmdir(new_folder)
     try:
-        shutil.copytree(dep.package_folder, new_folder, symlinks=symlinks)
+        if mode == "symlink":
+            mkdir(os.path.dirname(new_folder))
+            os.symlink(dep.package_folder, new_folder, target_is_directory=True)
+        elif mode is None:
+            shutil.copytree(dep.package_folder, new_folder, symlinks=symlinks)
+        else:
+            shutil.copytree(dep.package_folder, new_folder, symlinks=symlinks,
+                            copy_function=lambda src, dst: copy_file(src, dst, mode))
     except Exception as e:
         if "WinError 1314" in str(e):
             ConanOutput().error("full_deploy: Symlinks in Windows require admin privileges "
@@ -83,6 +100,47 @@ def _deploy_single(dep, conanfile, output_folder, folder_name):
     dep.set_deploy_folder(new_folder)
 
 
+def _deployed(package_folder, deploy_folder, mode, symlinks):
+    """ the deploy_folder is already a deploy of the package_folder: it has the same manifest, the
+    same files, none more, and the files of the manifest with the same size and modification time,
+    that the copies, hardlinks and reflinks keep. Only the "hardlink" mode (that can fall back to copies) can reuse
+    the same files of the package, modifying the files of a copy must not modify the package
+    """
+    if mode == "symlink":
+        return os.path.islink(deploy_folder) and \
+            os.path.realpath(deploy_folder) == os.path.realpath(package_folder)
+    if os.path.islink(deploy_folder) or \
+            not os.path.isfile(os.path.join(deploy_folder, CONAN_MANIFEST)):
+        return False
+    try:
+        manifest = load(os.path.join(package_folder, CONAN_MANIFEST))
+        if load(os.path.join(deploy_folder, CONAN_MANIFEST)) != manifest:
+            return False
+        # The files added to the deploy folder after deploying it, must be removed
+        if _folder_files(deploy_folder) != _folder_files(package_folder):
+            return False
+        for f in FileTreeManifest.loads(manifest).files():
+            src = os.path.join(package_folder, f)
+            dst = os.path.join(deploy_folder, f)
+            if symlinks and os.path.islink(src):
+                if not os.path.islink(dst) or os.readlink(dst) != os.readlink(src):
+                    return False
+                continue
+            src_stat, dst_stat = os.stat(src), os.stat(dst)
+            if (src_stat.st_size, src_stat.st_mtime_ns) != (dst_stat.st_size, dst_stat.st_mtime_ns):
+                return False
+            if mode != "hardlink" and os.path.samestat(src_stat, dst_stat):
+                return False
+    except (OSError, ConanException):
+        return False
+    return True
+
+
+def _folder_files(folder):
+    files, symlinked_folders = gather_files(folder)
+    return set(files).union(symlinked_folders)
+
+
 def direct_deploy(graph, output_folder):
     """
     Deploys to output_folder a single package,
@@ -1,8 +1,31 @@
 import fnmatch
 import os
-import shutil
+import re
+import threading
+import time
+from contextlib import contextmanager
+from multiprocessing.pool import ThreadPool
 
-from conans.util.files import mkdir
+from conans.util.files import mkdir, copy_file
+
+# The listings of folders modified this close to the listing time are not reused, a change in the
+# same tick of the filesystem timestamps could not be detected
+_RACY_NS = 2 * 10 ** 9
+_listings = threading.local()
+
+
+@contextmanager
+def copy_listing_cache():
+    """ The copy() calls inside reuse the listings of the src folders, instead of walking the same
+    tree for every call, typically all the copy() of a package() method. A folder is listed again
+    if it has been modified since it was listed
+    """
+    previous = getattr(_listings, "folders", None)
+    _listings.folders = {} if previous is None else previous
+    try:
+        yield
+    finally:
+        _listings.folders = previous
 
 
 def copy(conanfile, pattern, src, dst, keep_path=True, excludes=None,
@@ -11,7 +34,8 @@ def copy(conanfile, pattern, src, dst, keep_path=True, excludes=None,
     Copy the files matching the pattern (fnmatch) at the src folder to a dst folder.
 
     :param conanfile: The current recipe object. Always use ``self``.
-    :param pattern: (Required) An fnmatch file pattern of the files that should be copied.
+    :param pattern: (Required) An fnmatch file pattern of the files that should be copied, or a
+           list of them, copying the files matching any of them with a single walk of ``src``.
            It must not start with ``..`` relative path or an exception will be raised.
     :param src: (Required) Source folder in which those files will be searched. This folder
            will be stripped from the dst parameter. E.g., lib/Debug/x86.
@@ -27,24 +51,113 @@ def copy(conanfile, pattern, src, dst, keep_path=True, excludes=None,
     :return: list of copied files
     """
     assert src != dst
-    assert not pattern.startswith("..")
+    patterns = [pattern] if isinstance(pattern, str) else list(pattern)
+    assert not any(p.startswith("..") for p in patterns)
 
     # This is necessary to add the trailing / so it is not reported as symlink
     src = os.path.join(src, "")
     excluded_folder = dst
-    files_to_copy, files_symlinked_to_folders = _filter_files(src, pattern, excludes, ignore_case,
+    files_to_copy, files_symlinked_to_folders = _filter_files(src, patterns, excludes, ignore_case,
                                                               excluded_folder)
 
-    copied_files = _copy_files(files_to_copy, src, dst, keep_path)
+    conf = getattr(conanfile, "conf", None)
+    parallel = conf.get("tools.files.copy:parallel", check_type=int) if conf is not None else None
+    link = _link_mode(conanfile, src, dst)
+    copied_files = _copy_files(files_to_copy, src, dst, keep_path, parallel, link)
     copied_files.extend(_copy_files_symlinked_to_folders(files_symlinked_to_folders, src, dst))
     return copied_files
 
 
-def _filter_files(src, pattern, excludes, ignore_case, excluded_folder):
+def _link_mode(conanfile, src, dst):
+    """ the tools.files.copy:link mode that can be used for this copy. A hardlinked file shares
+    its contents with the source one, writing it in place, like replace_in_file() or save() do,
+    would also modify the source, so only the files packaged from the build folder to the package
+    folder are hardlinked. The reflinks are copy-on-write, they can be used for any copy
+    """
+    conf = getattr(conanfile, "conf", None)
+    link = conf.get("tools.files.copy:link", choices=["hardlink", "reflink"]) \
+        if conf is not None else None
+    if link == "hardlink":
+        build_folder = conanfile.build_folder
+        package_folder = conanfile.package_folder
+        if not build_folder or not package_folder or \
+                not _is_subfolder(src, build_folder) or not _is_subfolder(dst, package_folder):
+            return None
+    return link
+
+
+def _is_subfolder(folder, parent):
+    folder, parent = os.path.abspath(folder), os.path.abspath(parent)
+    return folder == parent or folder.startswith(os.path.join(parent, ""))
+
+
+def _matcher(patterns, case_sensitive):
+    """ A single compiled regex for all the patterns, the same as checking every pattern with
+    fnmatch.fnmatchcase() (case_sensitive) or fnmatch.fnmatch()
+    """
+    if not patterns:
+        return lambda name: False
+    if not case_sensitive:
+        patterns = [os.path.normcase(p) for p in patterns]
+    regex = re.compile("|".join(fnmatch.translate(p) for p in patterns))
+    if case_sensitive:
+        return lambda name: regex.match(name) is not None
+    return lambda name: regex.match(os.path.normcase(name)) is not None
+
+
+def _scan_folder(folder):
+    """ (modified time, [(subfolder, is_symlink)], [files]) as os.walk() classifies them, the
+    symlinks to folders are folders, or None if it can't be listed
+    """
+    try:
+        mtime = os.stat(folder).st_mtime_ns
+        subfolders, files = [], []
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    subfolders.append((entry.name, entry.is_symlink()))
+                else:
+                    files.append(entry.name)
+    except OSError:
+        return None
+    return mtime, subfolders, files
+
+
+def _list_folder(folder):
+    """ ([(subfolder, is_symlink)], [files]) of the folder, reused from the listings cache if the
+    folder has not been modified since it was listed
+    """
+    cache = getattr(_listings, "folders", None)
+    if cache is None:
+        listing = _scan_folder(folder)
+        return listing[1:] if listing is not None else None
+    cached = cache.get(folder)
+    if cached is not None:
+        listing_time, mtime, subfolders, files = cached
+        try:
+            if os.stat(folder).st_mtime_ns == mtime and listing_time - mtime > _RACY_NS:
+                return subfolders, files
+        except OSError:
+            pass
+    listing_time = int(time.time() * 10 ** 9)
+    listing = _scan_folder(folder)
+    if listing is None:
+        cache.pop(folder, None)
+        return None
+    mtime, subfolders, files = listing
+    cache[folder] = listing_time, mtime, subfolders, files
+    return subfolders, files
+
+
+def _filter_files(src, patterns, excludes, ignore_case, excluded_folder):
     """ return a list of the files matching the patterns
     The list will be relative path names wrt to the root src folder
     """
-    filenames = []
+    files_to_copy = []
     files_symlinked_to_folders = []
 
     if excludes:
@@ -55,59 +168,62 @@ def _filter_files(src, pattern, excludes, ignore_case, excluded_folder):
     else:
         excludes = []
 
-    for root, subfolders, files in os.walk(src):
+    symlink_match = _matcher(patterns, case_sensitive=False)
+    if ignore_case:
+        file_match = _matcher([p.lower() for p in patterns], case_sensitive=False)
+    else:
+        file_match = _matcher(patterns, case_sensitive=True)
+    folder_exclude = _matcher(excludes, case_sensitive=False)
+    file_exclude = _matcher(excludes, case_sensitive=not ignore_case)
+
+    # A single walk, in the same order as os.walk() top-down, not following symlinks
+    pending = [(src, ".")]
+    while pending:
+        root, relative_path = pending.pop()
         if root == excluded_folder:
-            subfolders[:] = []
             continue
+        listing = _list_folder(root)
+        if listing is None:
+            continue
+        subfolders, files = listing
 
         # Check if any of the subfolders is a symlink
-        for subfolder in subfolders:
-            relative_path = os.path.relpath(os.path.join(root, subfolder), src)
-            if os.path.islink(os.path.join(root, subfolder)):
-                if fnmatch.fnmatch(os.path.normpath(relative_path.lower()), pattern):
-                    files_symlinked_to_folders.append(relative_path)
+        for subfolder, is_symlink in subfolders:
+            if is_symlink:
+                relative_subfolder = os.path.relpath(os.path.join(root, subfolder), src)
+                if symlink_match(os.path.normpath(relative_subfolder.lower())):
+                    files_symlinked_to_folders.append(relative_subfolder)
 
-        relative_path = os.path.relpath(root, src)
         compare_relative_path = relative_path.lower() if ignore_case else relative_path
-        for exclude in excludes:
-            if fnmatch.fnmatch(compare_relative_path, exclude):
-                subfolders[:] = []
-                files = []
-                break
+        if folder_exclude(compare_relative_path):
+            continue
         for f in files:
             relative_name = os.path.normpath(os.path.join(relative_path, f))
-            filenames.append(relative_name)
+            compare_name = relative_name.lower() if ignore_case else relative_name
+            if file_match(compare_name) and not file_exclude(compare_name):
+                files_to_copy.append(relative_name)
 
-    if ignore_case:
-        pattern = pattern.lower()
-        files_to_copy = [n for n in filenames if fnmatch.fnmatch(os.path.normpath(n.lower()),
-                                                                 pattern)]
-    else:
-        files_to_copy = [n for n in filenames if fnmatch.fnmatchcase(os.path.normpath(n),
-                                                                     pattern)]
-
-    for exclude in excludes:
-        if ignore_case:
-            files_to_copy = [f for f in files_to_copy if not fnmatch.fnmatch(f.lower(), exclude)]
-        else:
-            files_to_copy = [f for f in files_to_copy if not fnmatch.fnmatchcase(f, exclude)]
+        for subfolder, is_symlink in reversed(subfolders):
+            if not is_symlink:
+                pending.append((os.path.join(root, subfolder),
+                                os.path.normpath(os.path.join(relative_path, subfolder))))
 
     return files_to_copy, files_symlinked_to_folders
 
 
-def _copy_files(files, src, dst, keep_path):
+def _copy_files(files, src, dst, keep_path, parallel=None, link=None):
     """ executes a multiple file copy from [(src_file, dst_file), (..)]
     managing symlinks if necessary
     """
-    copied_files = []
+    copies = []
     for filename in files:
         abs_src_name = os.path.join(src, filename)
         filename = filename if keep_path else os.path.basename(filename)
         abs_dst_name = os.path.normpath(os.path.join(dst, filename))
-        try:
-            os.makedirs(os.path.dirname(abs_dst_name))
-        except Exception:
-            pass
+        copies.append((abs_src_name, abs_dst_name))
+    copied_files = [abs_dst_name for _, abs_dst_name in copies]
+
+    def _copy(abs_src_name, abs_dst_name):
         if os.path.islink(abs_src_name):
             linkto = os.readlink(abs_src_name)  # @UndefinedVariable
             try:
@@ -116,8 +232,31 @@ def _copy_files(files, src, dst, keep_path):
                 pass
             os.symlink(linkto, abs_dst_name)  # @UndefinedVariable
         else:
-            shutil.copy2(abs_src_name, abs_dst_name)
-        copied_files.append(abs_dst_name)
+            copy_file(abs_src_name, abs_dst_name, link)
+
+    if parallel is None or parallel <= 1 or len(copies) < 2:
+        for abs_src_name, abs_dst_name in copies:
+            try:
+                os.makedirs(os.path.dirname(abs_dst_name))
+            except Exception:
+                pass
+            _copy(abs_src_name, abs_dst_name)
+        return copied_files
+
+    # Without keep_path, the last of the files with the same name is the one copied
+    copies = list({abs_dst_name: (abs_src_name, abs_dst_name)
+                   for abs_src_name, abs_dst_name in copies}.values())
+    for folder in {os.path.dirname(abs_dst_name) for _, abs_dst_name in copies}:
+        try:
+            os.makedirs(folder)
+        except Exception:
+            pass
+    thread_pool = ThreadPool(parallel)
+    try:
+        thread_pool.starmap(_copy, copies)
+    finally:
+        thread_pool.terminate()
+        thread_pool.join()
     return copied_files
 
 
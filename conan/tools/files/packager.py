@@ -95,5 +95,5 @@ class AutoPackager(object):
             from conan.tools.files import copy
             for d in origin_paths:
                 src_folder = os.path.join(base_folder, d)
-                for pattern in patterns:
-                    copy(self._conanfile, pattern, src_folder, dst_folder)
+                if patterns:
+                    copy(self._conanfile, patterns, src_folder, dst_folder)
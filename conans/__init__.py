@@ -1,5 +1,8 @@
 CHECKSUM_DEPLOY = "checksum_deploy"  # Only when v2
 REVISIONS = "revisions"  # Only when enabled in config, not by default look at server_launcher.py
 OAUTH_TOKEN = "oauth_token"
+BULK_PACKAGES_LATEST = "bulk_packages_latest"  # Latest revisions of many packages in 1 request
+RECIPE_VERSIONS = "recipe_versions"  # All the references of a recipe name in 1 request
+ZSTD_ARCHIVES = "zstd_archives"  # Stores the conan_export.tzst and conan_package.tzst files
 
 __version__ = '2.0.14-dev'
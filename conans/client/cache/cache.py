@@ -38,7 +38,8 @@ class ClientCache(object):
         try:
             mkdir(self._store_folder)
             db_filename = os.path.join(self._store_folder, 'cache.sqlite3')
-            self._data_cache = DataCache(self._store_folder, db_filename)
+            wal = self.new_config.get("core.cache:db_wal", check_type=bool, default=False)
+            self._data_cache = DataCache(self._store_folder, db_filename, wal)
         except Exception as e:
             raise ConanException(f"Couldn't initialize storage in {self._store_folder}: {e}")
 
@@ -53,6 +54,16 @@ class ClientCache(object):
     def builds_folder(self):
         return os.path.join(self.cache_folder, "p", "b")
 
+    @property
+    def bytecode_folder(self):
+        """ compiled code of the recipes in the cache, not to compile them in every command """
+        return os.path.join(self._store_folder, "pyc")
+
+    @property
+    def remote_metadata_folder(self):
+        """ cached revisions listings and search results of the remotes """
+        return os.path.join(self._store_folder, "remotes")
+
     def create_export_recipe_layout(self, ref: RecipeReference):
         return self._data_cache.create_export_recipe_layout(ref)
 
@@ -105,6 +116,10 @@ class ClientCache(object):
     def all_refs(self):
         return self._data_cache.list_references()
 
+    def get_recipe_versions(self, name):
+        """ sorted references (without revision) of all the versions of a recipe name """
+        return self._data_cache.get_recipe_versions(name)
+
     def exists_prev(self, pref):
         # Used just by download to skip downloads if prev already exists in cache
         return self._data_cache.exists_prev(pref)
@@ -135,6 +150,16 @@ class ClientCache(object):
     def update_package_lru(self, pref):
         self._data_cache.update_package_lru(pref)
 
+    def flush_lru(self):
+        """ The LRU updates are accumulated and written to the DB together
+        """
+        self._data_cache.flush_lru()
+
+    def close(self):
+        """ closes the connections to the DB, they are opened again if the cache is used later
+        """
+        self._data_cache.close()
+
     @property
     def store(self):
         return self._store_folder
@@ -1,15 +1,18 @@
 import os
 import shutil
 import time
+from multiprocessing.pool import ThreadPool
 
 from conan.internal.conan_app import ConanApp
 from conan.api.output import ConanOutput
 from conans.client.source import retrieve_exports_sources
 from conans.errors import ConanException, NotFoundException
 from conans.paths import (CONAN_MANIFEST, CONANFILE, EXPORT_SOURCES_TGZ_NAME,
-                          EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME, CONANINFO)
+                          EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME, CONANINFO, EXPORT_TZST_NAME,
+                          PACKAGE_TZST_NAME)
 from conans.util.files import (clean_dirty, is_dirty, gather_files,
-                               gzopen_without_timestamps, set_dirty_context_manager, mkdir)
+                               gzopen_without_timestamps, set_dirty_context_manager, mkdir,
+                               zstd_available, archive_compression, zstdopen_without_timestamps)
 
 UPLOAD_POLICY_FORCE = "force-upload"
 UPLOAD_POLICY_SKIP = "skip-upload"
@@ -26,6 +29,22 @@ class UploadUpstreamChecker:
 
     def check(self, upload_bundle, remote, force):
         ConanOutput().subtitle("Checking server existing packages")
+        parallel = self._app.cache.new_config.get("core.upload:parallel", check_type=int)
+        if parallel is not None and parallel > 1:
+            # Every check only modifies its own bundle, they are independent
+            checks = []
+            for ref, recipe_bundle in upload_bundle.refs().items():
+                checks.append((self._check_upstream_recipe, ref, recipe_bundle))
+                for pref, prev_bundle in upload_bundle.prefs(ref, recipe_bundle).items():
+                    checks.append((self._check_upstream_package, pref, prev_bundle))
+            thread_pool = ThreadPool(parallel)
+            try:
+                thread_pool.map(lambda check: check[0](check[1], check[2], remote, force), checks)
+            finally:
+                # An error interrupts the checks that haven't finished yet
+                thread_pool.terminate()
+                thread_pool.join()
+            return
         for ref, recipe_bundle in upload_bundle.refs().items():
             self._check_upstream_recipe(ref, recipe_bundle, remote, force)
             for pref, prev_bundle in upload_bundle.prefs(ref, recipe_bundle).items():
@@ -78,9 +97,18 @@ class UploadUpstreamChecker:
 class PackagePreparator:
     def __init__(self, app: ConanApp):
         self._app = app
+        self._zstd = False  # conan_export.tzst and conan_package.tzst instead of .tgz
 
-    def prepare(self, upload_bundle, enabled_remotes):
+    def prepare(self, upload_bundle, enabled_remotes, remote=None):
+        """ if the ``remote`` the artifacts are prepared for is known, the zstd compression is
+        only used if it declares that it can store the .tzst files
+        """
         ConanOutput().subtitle("Preparing artifacts for upload")
+        self._zstd = self._use_zstd(remote)
+        parallel = self._app.cache.new_config.get("core.gzip:parallel", check_type=int)
+        if parallel is not None and parallel > 1:
+            self._prepare_parallel(upload_bundle, enabled_remotes, parallel)
+            return
         for ref, bundle in upload_bundle.refs().items():
             layout = self._app.cache.recipe_layout(ref)
             conanfile_path = layout.conanfile()
@@ -92,7 +120,47 @@ class PackagePreparator:
                 if prev_bundle.get("upload"):
                     self._prepare_package(pref, prev_bundle)
 
-    def _prepare_recipe(self, ref, ref_bundle, conanfile, remotes):
+    def _use_zstd(self, remote):
+        compression = self._app.cache.new_config.get("core.upload:compression_format",
+                                                      default="gzip", choices=["gzip", "zstd"])
+        if compression != "zstd":
+            return False
+        if not zstd_available():
+            ConanOutput().warning("The 'zstandard' Python package is not installed, "
+                                  "the artifacts will be compressed with gzip")
+            return False
+        if remote is not None and not self._app.remote_manager.accepts_zstd(remote):
+            ConanOutput().warning(f"The remote '{remote.name}' doesn't accept zstd compressed "
+                                  "files, the artifacts will be compressed with gzip")
+            return False
+        return True
+
+    def _prepare_parallel(self, upload_bundle, enabled_remotes, parallel):
+        """ the recipes are prepared first, as they might need to retrieve the exports_sources
+        from the remotes, then the packages are compressed concurrently. Every .tgz is also
+        compressed with several threads
+        """
+        ConanOutput().info(f"Compressing artifacts in {parallel} parallel threads")
+        compress_pool = ThreadPool(parallel)
+        package_pool = ThreadPool(parallel)
+        try:
+            packages = []
+            for ref, bundle in upload_bundle.refs().items():
+                if bundle.get("upload"):
+                    layout = self._app.cache.recipe_layout(ref)
+                    conanfile = self._app.loader.load_basic(layout.conanfile())
+                    self._prepare_recipe(ref, bundle, conanfile, enabled_remotes, compress_pool)
+                for pref, prev_bundle in upload_bundle.prefs(ref, bundle).items():
+                    if prev_bundle.get("upload"):
+                        packages.append((pref, prev_bundle))
+            package_pool.map(lambda p: self._prepare_package(*p, thread_pool=compress_pool),
+                             packages)
+        finally:
+            for pool in (package_pool, compress_pool):
+                pool.close()
+                pool.join()
+
+    def _prepare_recipe(self, ref, ref_bundle, conanfile, remotes, thread_pool=None):
         """ do a bunch of things that are necessary before actually executing the upload:
         - retrieve exports_sources to complete the recipe if necessary
         - compress the artifacts in conan_export.tgz and conan_export_sources.tgz
@@ -101,16 +169,17 @@ class PackagePreparator:
             recipe_layout = self._app.cache.recipe_layout(ref)
             retrieve_exports_sources(self._app.remote_manager, recipe_layout, conanfile, ref,
                                      remotes)
-            cache_files = self._compress_recipe_files(recipe_layout, ref)
+            cache_files = self._compress_recipe_files(recipe_layout, ref, thread_pool)
             ref_bundle["files"] = cache_files
         except Exception as e:
             raise ConanException(f"{ref} Error while compressing: {e}")
 
-    def _compress_recipe_files(self, layout, ref):
+    def _compress_recipe_files(self, layout, ref, thread_pool=None):
         download_export_folder = layout.download_export()
 
         output = ConanOutput(scope=str(ref))
-        for f in (EXPORT_TGZ_NAME, EXPORT_SOURCES_TGZ_NAME):
+        export_tgz_name = EXPORT_TZST_NAME if self._zstd else EXPORT_TGZ_NAME
+        for f in (export_tgz_name, EXPORT_SOURCES_TGZ_NAME):
             tgz_path = os.path.join(download_export_folder, f)
             if is_dirty(tgz_path):
                 output.warning("Removing %s, marked as dirty" % f)
@@ -148,27 +217,29 @@ class PackagePreparator:
                 compresslevel = self._app.cache.new_config.get("core.gzip:compresslevel",
                                                                check_type=int)
                 tgz = compress_files(tgz_files, tgz_name, download_export_folder,
-                                     compresslevel=compresslevel, ref=ref)
+                                     compresslevel=compresslevel, ref=ref,
+                                     thread_pool=thread_pool)
                 result[tgz_name] = tgz
 
-        add_tgz(EXPORT_TGZ_NAME, files)
+        add_tgz(export_tgz_name, files)
         add_tgz(EXPORT_SOURCES_TGZ_NAME, src_files)
         return result
 
-    def _prepare_package(self, pref, prev_bundle):
+    def _prepare_package(self, pref, prev_bundle, thread_pool=None):
         pkg_layout = self._app.cache.pkg_layout(pref)
         if pkg_layout.package_is_dirty():
             raise ConanException(f"Package {pref} is corrupted, aborting upload.\n"
                                  f"Remove it with 'conan remove {pref}'")
-        cache_files = self._compress_package_files(pkg_layout, pref)
+        cache_files = self._compress_package_files(pkg_layout, pref, thread_pool)
         prev_bundle["files"] = cache_files
 
-    def _compress_package_files(self, layout, pref):
+    def _compress_package_files(self, layout, pref, thread_pool=None):
         output = ConanOutput(scope=str(pref))
         download_pkg_folder = layout.download_package()
-        package_tgz = os.path.join(download_pkg_folder, PACKAGE_TGZ_NAME)
+        package_tgz_name = PACKAGE_TZST_NAME if self._zstd else PACKAGE_TGZ_NAME
+        package_tgz = os.path.join(download_pkg_folder, package_tgz_name)
         if is_dirty(package_tgz):
-            output.warning("Removing %s, marked as dirty" % PACKAGE_TGZ_NAME)
+            output.warning("Removing %s, marked as dirty" % package_tgz_name)
             os.remove(package_tgz)
             clean_dirty(package_tgz)
 
@@ -194,12 +265,13 @@ class PackagePreparator:
         if not os.path.isfile(package_tgz):
             tgz_files = {f: path for f, path in files.items()}
             compresslevel = self._app.cache.new_config.get("core.gzip:compresslevel", check_type=int)
-            tgz_path = compress_files(tgz_files, PACKAGE_TGZ_NAME, download_pkg_folder,
-                                      compresslevel=compresslevel, ref=pref)
+            tgz_path = compress_files(tgz_files, package_tgz_name, download_pkg_folder,
+                                      compresslevel=compresslevel, ref=pref,
+                                      thread_pool=thread_pool)
             assert tgz_path == package_tgz
             assert os.path.exists(package_tgz)
 
-        return {PACKAGE_TGZ_NAME: package_tgz,
+        return {package_tgz_name: package_tgz,
                 CONANINFO: os.path.join(download_pkg_folder, CONANINFO),
                 CONAN_MANIFEST: os.path.join(download_pkg_folder, CONAN_MANIFEST)}
 
@@ -215,13 +287,43 @@ class UploadExecutor:
 
     def upload(self, upload_data, remote):
         ConanOutput().subtitle("Uploading artifacts")
-        for ref, bundle in upload_data.refs().items():
+        parallel = self._app.cache.new_config.get("core.upload:parallel", check_type=int)
+        if parallel is not None and parallel > 1:
+            self._upload_parallel(upload_data, remote, parallel)
+        else:
+            for ref, bundle in upload_data.refs().items():
+                if bundle.get("upload"):
+                    self.upload_recipe(ref, bundle, remote)
+                for pref, prev_bundle in upload_data.prefs(ref, bundle).items():
+                    if prev_bundle.get("upload"):
+                        self.upload_package(pref, prev_bundle, remote)
+        self._app.requester.output_connections_stats()
+        ConanOutput().success("Upload complete\n")
+
+    def _upload_parallel(self, upload_data, remote, parallel):
+        """ The recipes are uploaded concurrently, and the packages of every recipe are
+        queued as soon as their recipe is uploaded, as the recipe must exist in the server first
+        """
+        self._output.info(f"Uploading artifacts in {parallel} parallel threads")
+        thread_pool = ThreadPool(parallel)
+
+        def _upload_ref(ref, bundle):
             if bundle.get("upload"):
                 self.upload_recipe(ref, bundle, remote)
-            for pref, prev_bundle in upload_data.prefs(ref, bundle).items():
-                if prev_bundle.get("upload"):
-                    self.upload_package(pref, prev_bundle, remote)
-        ConanOutput().success("Upload complete\n")
+            return [thread_pool.apply_async(self.upload_package, (pref, prev_bundle, remote))
+                    for pref, prev_bundle in upload_data.prefs(ref, bundle).items()
+                    if prev_bundle.get("upload")]
+
+        try:
+            recipes = [thread_pool.apply_async(_upload_ref, (ref, bundle))
+                       for ref, bundle in upload_data.refs().items()]
+            packages = [package for recipe in recipes for package in recipe.get()]
+            for package in packages:
+                package.get()  # raises the upload error, if any
+        finally:
+            # At this point all the uploads are finished, unless there was an error
+            thread_pool.terminate()
+            thread_pool.join()
 
     def upload_recipe(self, ref, bundle, remote):
         self._output.info(f"Uploading recipe '{ref.repr_notime()}'")
@@ -246,14 +348,17 @@ class UploadExecutor:
         self._output.debug(f"Upload {pref} in {duration} time")
 
 
-def compress_files(files, name, dest_dir, compresslevel=None, ref=None):
+def compress_files(files, name, dest_dir, compresslevel=None, ref=None, thread_pool=None):
     t1 = time.time()
     # FIXME, better write to disk sequentially and not keep tgz contents in memory
     tgz_path = os.path.join(dest_dir, name)
     ConanOutput(scope=str(ref)).info(f"Compressing {name}")
     with set_dirty_context_manager(tgz_path), open(tgz_path, "wb") as tgz_handle:
-        tgz = gzopen_without_timestamps(name, mode="w", fileobj=tgz_handle,
-                                        compresslevel=compresslevel)
+        if archive_compression(name) == "zstd":
+            tgz = zstdopen_without_timestamps(name, fileobj=tgz_handle)
+        else:
+            tgz = gzopen_without_timestamps(name, mode="w", fileobj=tgz_handle,
+                                            compresslevel=compresslevel, thread_pool=thread_pool)
         for filename, abs_path in sorted(files.items()):
             # recursive is False in case it is a symlink to a folder
             tgz.add(abs_path, filename, recursive=False)
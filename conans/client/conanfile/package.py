@@ -1,6 +1,7 @@
 import os
 
 from conan.api.output import ConanOutput
+from conan.tools.files.copy_pattern import copy_listing_cache
 from conans.errors import ConanException, conanfile_exception_formatter, conanfile_remove_attr
 from conans.model.manifest import FileTreeManifest
 from conans.model.package_ref import PkgReference
@@ -30,7 +31,8 @@ def run_package_method(conanfile, package_id, hook_manager, ref):
         with conanfile_exception_formatter(conanfile, "package"):
             with chdir(conanfile.build_folder):
                 with conanfile_remove_attr(conanfile, ['info'], "package"):
-                    conanfile.package()
+                    with copy_listing_cache():  # The copy() calls do not walk again the folders
+                        conanfile.package()
     hook_manager.execute("post_package", conanfile=conanfile)
 
     save(os.path.join(conanfile.package_folder, CONANINFO), conanfile.info.dumps())
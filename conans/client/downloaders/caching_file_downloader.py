@@ -159,13 +159,19 @@ class ConanInternalCacheDownloader:
         self._download_cache = config.get("core.download:download_cache")
         if self._download_cache and not os.path.isabs(self._download_cache):
             raise ConanException("core.download:download_cache must be an absolute path")
-        self._file_downloader = FileDownloader(requester, scope=scope)
+        chunked_threshold = config.get("core.download:chunked_threshold", check_type=int)
+        chunked_parallel = config.get("core.download:chunked_parallel", check_type=int)
+        self._file_downloader = FileDownloader(requester, scope=scope,
+                                               chunked_threshold=chunked_threshold,
+                                               chunked_parallel=chunked_parallel)
         self._scope = scope
 
-    def download(self, url, file_path, auth, verify_ssl, retry, retry_wait, metadata=False):
+    def download(self, url, file_path, auth, verify_ssl, retry, retry_wait, metadata=False,
+                 extraction=None):
         if not self._download_cache or metadata:  # Metadata not cached and can be overwritten
             self._file_downloader.download(url, file_path, retry=retry, retry_wait=retry_wait,
-                                           verify_ssl=verify_ssl, auth=auth, overwrite=metadata)
+                                           verify_ssl=verify_ssl, auth=auth, overwrite=metadata,
+                                           extraction=extraction)
             return
 
         download_cache = DownloadCache(self._download_cache)
@@ -177,7 +183,8 @@ class ConanInternalCacheDownloader:
                 with set_dirty_context_manager(cached_path):
                     self._file_downloader.download(url, cached_path, retry=retry,
                                                    retry_wait=retry_wait, verify_ssl=verify_ssl,
-                                                   auth=auth, overwrite=False)
+                                                   auth=auth, overwrite=False,
+                                                   extraction=extraction)
             else:  # Found in cache!
                 total_length = os.path.getsize(cached_path)
                 is_large_file = total_length > 10000000  # 10 MB
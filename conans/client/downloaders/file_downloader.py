@@ -1,25 +1,88 @@
+import hashlib
 import os
 import re
 import time
-
+from multiprocessing.pool import ThreadPool
 
 from conan.api.output import ConanOutput
 from conans.client.rest import response_to_str
 from conans.errors import ConanException, NotFoundException, AuthenticationException, \
     ForbiddenException, ConanConnectionError, RequestErrorException
-from conans.util.files import human_size
-from conans.util.sha import check_with_algorithm_sum
+from conans.util.files import human_size, rmdir, tar_extract, archive_compression
+from conans.util.sha import check_with_algorithm_sum, check_signature
+
+
+class _ChunksReader:
+    """ file-like object to read the chunks of a download while they are received
+    """
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._buffer = b""
+        self._pos = 0
+        self.error = None  # The download error, if any, not the reader (extraction) one
+
+    def read(self, size=-1):
+        read_all = size is None or size < 0
+        while read_all or len(self._buffer) - self._pos < size:
+            try:
+                chunk = next(self._chunks, None)
+            except Exception as e:
+                self.error = e
+                raise
+            if chunk is None:
+                break
+            self._buffer = self._buffer[self._pos:] + chunk
+            self._pos = 0
+        end = len(self._buffer) if read_all else self._pos + size
+        data = self._buffer[self._pos:end]
+        self._pos = end
+        return data
+
+
+class StreamExtraction:
+    """ Extracts a tgz file while it is being downloaded, instead of reading it again from disk
+    after the download. If it was not possible (resumed downloads, download cache, corrupted
+    files...), ``file_sums`` is None and the downloaded file must be extracted as usual
+    """
+    def __init__(self, destination_folder, data_filter=False):
+        self.destination_folder = destination_folder
+        self.data_filter = data_filter
+        self.file_sums = None  # {filename: md5} of the extracted files, like FileTreeManifest
+
+    def extract(self, chunks, compression=None):
+        self.file_sums = None
+        rmdir(self.destination_folder)  # Clean, this download could be a retry
+        reader = _ChunksReader(chunks)
+        file_sums = {}
+        try:
+            tar_extract(reader, self.destination_folder, file_sums=file_sums,
+                        compression=compression, stream=True, data_filter=self.data_filter)
+        except Exception:
+            rmdir(self.destination_folder)
+            if reader.error is not None:
+                raise reader.error
+            # A broken file will be extracted again from disk, to report the error as usual
+        else:
+            self.file_sums = file_sums
 
 
 class FileDownloader:
 
-    def __init__(self, requester, scope=None):
+    def __init__(self, requester, scope=None, chunked_threshold=None, chunked_parallel=None):
+        """
+        :param chunked_threshold: files of this size or larger are downloaded in
+            ``chunked_parallel`` concurrent byte ranges, if the server accepts ranges
+        """
         self._output = ConanOutput(scope=scope)
         self._requester = requester
+        self._chunked_threshold = chunked_threshold
+        self._chunked_parallel = chunked_parallel or 4
 
     def download(self, url, file_path, retry=2, retry_wait=0, verify_ssl=True, auth=None,
-                 overwrite=False, headers=None, md5=None, sha1=None, sha256=None):
+                 overwrite=False, headers=None, md5=None, sha1=None, sha256=None,
+                 extraction=None):
         """ in order to make the download concurrent, the folder for file_path MUST exist
+        :param extraction: optional StreamExtraction to extract the file while downloading it
         """
         assert file_path, "Conan 2.0 always downloads files to disk, not to memory"
         assert os.path.isabs(file_path), "Target file_path must be absolute"
@@ -32,10 +95,15 @@ class FileDownloader:
                 # the dest folder before
                 raise ConanException("Error, the file to download already exists: '%s'" % file_path)
 
+        checksums = {"md5": md5, "sha1": sha1, "sha256": sha256}
+        checksums = {k: v for k, v in checksums.items() if v is not None}
         try:
             for counter in range(retry + 1):
                 try:
-                    self._download_file(url, auth, headers, file_path, verify_ssl)
+                    # The checksums are computed while downloading, not reading the file again
+                    hashes = {k: _new_hash(k) for k in checksums}
+                    resumed = self._download_file(url, auth, headers, file_path, verify_ssl,
+                                                  hashes=hashes, extraction=extraction)
                     break
                 except (NotFoundException, ForbiddenException, AuthenticationException,
                         RequestErrorException):
@@ -48,7 +116,12 @@ class FileDownloader:
                         self._output.info(f"Waiting {retry_wait} seconds to retry...")
                         time.sleep(retry_wait)
 
-            self.check_checksum(file_path, md5, sha1, sha256)
+            if resumed:  # The computed checksums are not complete, from the beginning of file
+                self.check_checksum(file_path, md5, sha1, sha256)
+            else:
+                for algorithm, signature in checksums.items():
+                    check_signature(algorithm, file_path, signature,
+                                    hashes[algorithm].hexdigest())
         except Exception:
             if os.path.exists(file_path):
                 os.remove(file_path)
@@ -63,7 +136,11 @@ class FileDownloader:
         if sha256 is not None:
             check_with_algorithm_sum("sha256", file_path, sha256)
 
-    def _download_file(self, url, auth, headers, file_path, verify_ssl, try_resume=False):
+    def _download_file(self, url, auth, headers, file_path, verify_ssl, try_resume=False,
+                       hashes=None, extraction=None):
+        """ returns True if the download was resumed or chunked, so it was not received in order
+        by this call and it was not possible to compute the ``hashes`` or do the ``extraction``
+        """
         if try_resume and os.path.exists(file_path):
             range_start = os.path.getsize(file_path)
             headers = headers.copy() if headers else {}
@@ -112,11 +189,25 @@ class FileDownloader:
                 self._output.info(f"{action} {hs} {base_name}")
 
             chunk_size = 1024 * 100
+            if (not range_start and self._chunked_threshold is not None
+                    and self._chunked_parallel > 1 and total_length >= self._chunked_threshold
+                    and response.headers.get("Accept-Ranges") == "bytes"
+                    and response.headers.get("content-encoding") != "gzip"):
+                self._download_ranges(url, auth, headers, file_path, verify_ssl, response,
+                                      total_length, chunk_size)
+                if extraction is not None:
+                    extraction.file_sums = None  # Not received in order, extract later from disk
+                return True
+
             total_downloaded_size = range_start
             mode = "ab" if range_start else "wb"
-            with open(file_path, mode) as file_handler:
+
+            def download_chunks():
+                nonlocal total_downloaded_size, t_start
                 for chunk in response.iter_content(chunk_size):
                     file_handler.write(chunk)
+                    for h in (hashes or {}).values():
+                        h.update(chunk)
                     total_downloaded_size += len(chunk)
                     if is_large_file:
                         t = time.time()
@@ -125,6 +216,14 @@ class FileDownloader:
                             perc = int(total_downloaded_size*100/total_length)
                             self._output.info(f"Downloaded {hs} {perc}% {base_name}")
                             t_start = t
+                    yield chunk
+
+            with open(file_path, mode) as file_handler:
+                chunks = download_chunks()
+                if extraction is not None and not range_start:
+                    extraction.extract(chunks, compression=archive_compression(file_path))
+                for _ in chunks:  # Whatever remains after the extraction, or everything
+                    pass
 
             gzip = (response.headers.get("content-encoding") == "gzip")
             response.close()
@@ -132,11 +231,86 @@ class FileDownloader:
             if total_downloaded_size != total_length and not gzip:
                 if (total_length > total_downloaded_size > range_start
                         and response.headers.get("Accept-Ranges") == "bytes"):
+                    if extraction is not None:
+                        extraction.file_sums = None  # Incomplete, extract later from disk
                     self._download_file(url, auth, headers, file_path, verify_ssl, try_resume=True)
+                    return True
                 else:
                     raise ConanException("Transfer interrupted before complete: %s < %s"
                                          % (total_downloaded_size, total_length))
+            return bool(range_start)
         except Exception as e:
             # If this part failed, it means problems with the connection to server
             raise ConanConnectionError("Download failed, check server, possibly try again\n%s"
                                        % str(e))
+
+    def _download_ranges(self, url, auth, headers, file_path, verify_ssl, response, total_length,
+                         chunk_size):
+        """ downloads the file in concurrent byte ranges, written at their offsets in the
+        preallocated file. The first range is read from the already open ``response``
+        """
+        range_size = -(-total_length // self._chunked_parallel)  # ceil division
+        ranges = [(start, min(start + range_size, total_length))
+                  for start in range(0, total_length, range_size)]
+        hs = human_size(total_length)
+        self._output.info(f"Downloading {hs} {os.path.basename(file_path)} in {len(ranges)} "
+                          f"parallel ranges")
+        with open(file_path, "wb") as file_handler:
+            file_handler.truncate(total_length)
+
+        def write_range(start, end, chunks):
+            pending = end - start
+            with open(file_path, "r+b") as range_handler:
+                range_handler.seek(start)
+                for chunk in chunks:
+                    chunk = chunk[:pending]
+                    range_handler.write(chunk)
+                    pending -= len(chunk)
+                    if not pending:
+                        break
+            if pending:
+                raise ConanException("Transfer interrupted before complete: range %s-%s"
+                                     % (start, end))
+            return end - start
+
+        def download_range(start, end):
+            range_headers = headers.copy() if headers else {}
+            range_headers["range"] = "bytes={}-{}".format(start, end - 1)
+            range_response = self._requester.get(url, stream=True, verify=verify_ssl, auth=auth,
+                                                 headers=range_headers)
+            try:
+                content_range = range_response.headers.get("Content-Range", "")
+                match = re.match(r"^bytes (\d+)-(\d+)/(\d+)", content_range)
+                # A different total length means that the file changed in the server
+                if range_response.status_code != 206 or not match or int(match.group(1)) != start \
+                        or int(match.group(3)) != total_length:
+                    raise ConanException("Error %d downloading range %s-%s of %s, Content-Range %s"
+                                         % (range_response.status_code, start, end, url,
+                                            content_range))
+                return write_range(start, end, range_response.iter_content(chunk_size))
+            finally:
+                range_response.close()
+
+        thread_pool = ThreadPool(max(1, len(ranges) - 1))
+        try:
+            results = [thread_pool.apply_async(download_range, r) for r in ranges[1:]]
+            try:
+                downloaded = write_range(*ranges[0], response.iter_content(chunk_size))
+            finally:
+                response.close()
+            downloaded += sum(result.get() for result in results)
+        finally:
+            thread_pool.terminate()
+            thread_pool.join()
+        # Not all the files are downloaded with checksums, the assembled size is always checked
+        file_size = os.path.getsize(file_path)
+        if downloaded != total_length or file_size != total_length:
+            raise ConanException("Transfer interrupted before complete: %s of %s bytes, file "
+                                 "size %s" % (downloaded, total_length, file_size))
+
+
+def _new_hash(algorithm_name):
+    try:
+        return hashlib.new(algorithm_name)
+    except ValueError:  # FIPS error https://github.com/conan-io/conan/issues/7800
+        return hashlib.new(algorithm_name, usedforsecurity=False)
@@ -1,3 +1,5 @@
+import fnmatch
+import json
 from collections import OrderedDict
 
 from conans.model.package_ref import PkgReference
@@ -32,6 +34,8 @@ CONTEXT_BUILD = "build"
 
 
 class TransitiveRequirement:
+    __slots__ = ("require", "node")
+
     def __init__(self, require, node):
         self.require = require
         self.node = node
@@ -41,6 +45,12 @@ class TransitiveRequirement:
 
 
 class Node(object):
+    # There are many nodes in big graphs, without a __dict__ per node they take much less memory
+    __slots__ = ("ref", "path", "_package_id", "prev", "pref_timestamp", "conanfile", "binary",
+                 "recipe", "remote", "binary_remote", "context", "test", "transitive_deps",
+                 "dependencies", "dependants", "error", "cant_build", "should_build",
+                 "id")  # id is only assigned by DepsGraph.serialize()
+
     def __init__(self, ref, conanfile, context, recipe=None, path=None, test=False):
         self.ref = ref
         self.path = path  # path to the consumer conanfile.xx for consumer, None otherwise
@@ -59,7 +69,7 @@ class Node(object):
         self.test = test
 
         # real graph model
-        self.transitive_deps = OrderedDict()  # of _TransitiveRequirement
+        self.transitive_deps = {}  # of TransitiveRequirement, insertion ordered
         self.dependencies = []  # Ordered Edges
         self.dependants = []  # Edges
         self.error = None
@@ -205,31 +215,52 @@ class Node(object):
     def __repr__(self):
         return repr(self.conanfile)
 
-    def serialize(self):
+    def serialize(self, fields=None):
+        """ fields: if defined, only these fields are computed, besides the "ref"
+        """
+        def wanted(field):
+            return fields is None or field in fields
+
         result = OrderedDict()
         result["ref"] = self.ref.repr_notime() if self.ref is not None else "conanfile"
-        result["id"] = getattr(self, "id")  # Must be assigned by graph.serialize()
-        result["recipe"] = self.recipe
-        result["package_id"] = self.package_id
-        result["prev"] = self.prev
-        result["rrev"] = self.ref.revision if self.ref is not None else None
-        result["rrev_timestamp"] = self.ref.timestamp if self.ref is not None else None
-        result["prev_timestamp"] = self.pref_timestamp
-        result["remote"] = self.remote.name if self.remote else None
-        result["binary_remote"] = self.binary_remote.name if self.binary_remote else None
-        from conans.client.installer import build_id
-        result["build_id"] = build_id(self.conanfile)
-        result["binary"] = self.binary
+        if wanted("id"):
+            result["id"] = getattr(self, "id")  # Must be assigned by graph.serialize()
+        if wanted("recipe"):
+            result["recipe"] = self.recipe
+        if wanted("package_id"):
+            result["package_id"] = self.package_id
+        if wanted("prev"):
+            result["prev"] = self.prev
+        if wanted("rrev"):
+            result["rrev"] = self.ref.revision if self.ref is not None else None
+        if wanted("rrev_timestamp"):
+            result["rrev_timestamp"] = self.ref.timestamp if self.ref is not None else None
+        if wanted("prev_timestamp"):
+            result["prev_timestamp"] = self.pref_timestamp
+        if wanted("remote"):
+            result["remote"] = self.remote.name if self.remote else None
+        if wanted("binary_remote"):
+            result["binary_remote"] = self.binary_remote.name if self.binary_remote else None
+        if wanted("build_id"):
+            from conans.client.installer import build_id
+            result["build_id"] = build_id(self.conanfile)
+        if wanted("binary"):
+            result["binary"] = self.binary
         # TODO: This doesn't match the model, check it
-        result["invalid_build"] = self.cant_build
-        result["info_invalid"] = getattr(getattr(self.conanfile, "info", None), "invalid", None)
+        if wanted("invalid_build"):
+            result["invalid_build"] = self.cant_build
+        if wanted("info_invalid"):
+            result["info_invalid"] = getattr(getattr(self.conanfile, "info", None), "invalid", None)
         # Adding the conanfile information: settings, options, etc
-        result.update(self.conanfile.serialize())
+        result.update(self.conanfile.serialize(fields))
         result.pop("requires", None)  # superseded by "dependencies" (graph.transitive_deps)
-        result["dependencies"] = {d.node.id: d.require.serialize()
-                                  for d in self.transitive_deps.values() if d.node is not None}
-        result["context"] = self.context
-        result["test"] = self.test
+        if wanted("dependencies"):
+            result["dependencies"] = {d.node.id: d.require.serialize()
+                                      for d in self.transitive_deps.values() if d.node is not None}
+        if wanted("context"):
+            result["context"] = self.context
+        if wanted("test"):
+            result["test"] = self.test
         return result
 
     def overrides(self):
@@ -251,6 +282,8 @@ class Node(object):
 
 
 class Edge(object):
+    __slots__ = ("src", "dst", "require")
+
     def __init__(self, src, dst, require):
         self.src = src
         self.dst = dst
@@ -351,23 +384,31 @@ class DepsGraph(object):
         first level nodes, and so on
         return [[node1, node34], [node3], [node23, node8],...]
         """
-        result = []
-        # We make it a dict to preserve insertion order and be deterministic, s
-        # sets are not deterministic order. dict is fast for look up operations
-        opened = dict.fromkeys(self.nodes)
-        while opened:
-            current_level = []
-            for o in opened:
-                o_neighs = o.neighbors()
-                if not any(n in opened for n in o_neighs):
-                    current_level.append(o)
+        # Kahn algorithm: every node counts its dependencies not yet in a level, and it goes to
+        # the next level when its last dependency is placed, without rescanning all the open nodes
+        pending = {}
+        dependants = {node: [] for node in self.nodes}
+        current_level = []
+        for node in self.nodes:
+            neighbors = set(node.neighbors())
+            pending[node] = len(neighbors)
+            for neighbor in neighbors:
+                dependants[neighbor].append(node)
+            if not neighbors:
+                current_level.append(node)
 
+        result = []
+        while current_level:
             # TODO: SORTING seems only necessary for test order
             current_level.sort()
             result.append(current_level)
-            # now start new level, removing the current level items
-            for item in current_level:
-                opened.pop(item)
+            next_level = []
+            for node in current_level:
+                for dependant in dependants[node]:
+                    pending[dependant] -= 1
+                    if not pending[dependant]:
+                        next_level.append(dependant)
+            current_level = next_level
 
         return result
 
@@ -382,12 +423,64 @@ class DepsGraph(object):
         if self.error:
             raise self.error
 
-    def serialize(self):
+    def serialize(self, fields=None, package_filter=None, compact=False):
+        """ fields: if defined, only these fields of the nodes are computed, besides the "ref"
+        package_filter: if defined, only the nodes with a "ref" matching any of these fnmatch
+            patterns are serialized
+        compact: the repeated blocks of the nodes, like the settings or options, are serialized
+            once in "interned", and the nodes have their index instead
+        """
+        return OrderedDict((k, OrderedDict(v) if k == "nodes" else v)
+                           for k, v in self.serialize_items(fields, package_filter, compact))
+
+    def serialize_items(self, fields=None, package_filter=None, compact=False):
+        """ the (key, value) items of serialize(), so they can be streamed. The "nodes" value is a
+        generator of the (id, node) items, that must be consumed before the next items
+        """
         for i, n in enumerate(self.nodes):
             n.id = str(i)
-        result = OrderedDict()
-        result["nodes"] = {n.id: n.serialize() for n in self.nodes}
-        result["root"] = {self.root.id: repr(self.root.ref)}  # TODO: ref of consumer/virtual
-        result["overrides"] = self.overrides().serialize()
-        result["resolved_ranges"] = {repr(r): s.repr_notime() for r, s in self.resolved_ranges.items()}
-        return result
+        interned = _InternedBlocks() if compact else None
+        yield "nodes", self._serialize_nodes(fields, package_filter, interned)
+        yield "root", {self.root.id: repr(self.root.ref)}  # TODO: ref of consumer/virtual
+        yield "overrides", self.overrides().serialize()
+        yield "resolved_ranges", {repr(r): s.repr_notime() for r, s in self.resolved_ranges.items()}
+        if interned is not None:
+            yield "interned", interned.serialize()
+
+    def _serialize_nodes(self, fields, package_filter, interned):
+        for n in self.nodes:
+            if package_filter is not None:
+                ref = n.ref.repr_notime() if n.ref is not None else "conanfile"
+                if not any(fnmatch.fnmatch(ref, p) for p in package_filter):
+                    continue
+            result = n.serialize(fields)
+            if interned is not None:
+                interned.intern(result)
+            yield n.id, result
+
+
+class _InternedBlocks:
+    """ The blocks of the serialized nodes that are repeated in many of them, stored only once.
+    The nodes have the index of their block in the list of that field instead
+    """
+    fields = "settings", "options", "options_definitions", "default_options", "conf_info"
+
+    def __init__(self):
+        self._blocks = {field: [] for field in self.fields}
+        self._indexes = {field: {} for field in self.fields}  # {field: {json of block: index}}
+
+    def intern(self, node):
+        for field in self.fields:
+            if field not in node:
+                continue
+            block = node[field]
+            key = json.dumps(block)
+            indexes = self._indexes[field]
+            index = indexes.get(key)
+            if index is None:
+                index = indexes[key] = len(self._blocks[field])
+                self._blocks[field].append(block)
+            node[field] = index
+
+    def serialize(self):
+        return OrderedDict((field, blocks) for field, blocks in self._blocks.items() if blocks)
@@ -1,15 +1,17 @@
+from multiprocessing.pool import ThreadPool
+
 from conan.api.output import ConanOutput
-from conan.internal.cache.home_paths import HomePaths
 from conans.client.graph.build_mode import BuildMode
-from conans.client.graph.compatibility import BinaryCompatibility
 from conans.client.graph.compute_pid import compute_package_id
 from conans.client.graph.graph import (BINARY_BUILD, BINARY_CACHE, BINARY_DOWNLOAD, BINARY_MISSING,
                                        BINARY_UPDATE, RECIPE_EDITABLE, BINARY_EDITABLE,
                                        RECIPE_CONSUMER, RECIPE_VIRTUAL, BINARY_SKIP,
                                        BINARY_INVALID, BINARY_EDITABLE_BUILD, RECIPE_SYSTEM_TOOL,
                                        BINARY_SYSTEM_TOOL)
-from conans.errors import NoRemoteAvailable, NotFoundException, \
+from conans.errors import NoRemoteAvailable, NotFoundException, ConanException, \
     PackageNotFoundException, conanfile_exception_formatter
+from conans.model.package_ref import PkgReference
+from conans.model.recipe_ref import ref_matches
 
 
 class GraphBinariesAnalyzer(object):
@@ -19,8 +21,10 @@ class GraphBinariesAnalyzer(object):
         self._remote_manager = conan_app.remote_manager
         # These are the nodes with pref (not including PREV) that have been evaluated
         self._evaluated = {}  # {pref: [nodes]}
-        compat_folder = HomePaths(self._cache.cache_folder).compatibility_plugin_path
-        self._compatibility = BinaryCompatibility(compat_folder)
+        self._compatibility = conan_app.binary_compatibility
+        self._parallel = self._cache.new_config.get("core.graph:parallel_fetch", check_type=int)
+        # Results of the remotes concurrent queries, pending to be used
+        self._remote_prefs = {}  # {(pref, remote_name): latest_pref or exception}
 
     @staticmethod
     def _evaluate_build(node, build_mode):
@@ -56,7 +60,7 @@ class GraphBinariesAnalyzer(object):
         for r in remotes:
             try:
                 info = node.conanfile.info
-                latest_pref = self._remote_manager.get_latest_package_reference(pref, r, info)
+                latest_pref = self._get_latest_package_reference(pref, r, info)
                 results.append({'pref': latest_pref, 'remote': r})
                 if len(results) > 0 and not update:
                     break
@@ -77,6 +81,66 @@ class GraphBinariesAnalyzer(object):
             node.prev = None
             raise PackageNotFoundException(pref)
 
+    def _get_latest_package_reference(self, pref, remote, info):
+        result = self._remote_prefs.pop((pref, remote.name), None)
+        if result is None:
+            return self._remote_manager.get_latest_package_reference(pref, remote, info)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def _prefetch_remote_packages(self, prefs, remotes, update):
+        """ Query the remotes for the latest revision of the given packages {pref: info}, with a
+        few bulk requests running concurrently, so the sequential evaluation of the nodes doesn't
+        need to wait for each request. As the sequential evaluation, without update the next
+        remotes are only queried for the packages not found in the previous ones. The packages
+        without an answer, because of an error of the request, are queried again sequentially
+        """
+        for remote in remotes:
+            pending = [p for p in prefs if (p, remote.name) not in self._remote_prefs]
+            chunks = [{p: prefs[p] for p in pending[i::self._parallel]}
+                      for i in range(self._parallel) if pending[i::self._parallel]]
+
+            def _query(chunk_prefs):
+                try:
+                    result = self._remote_manager.get_latest_packages_references(chunk_prefs,
+                                                                                 remote)
+                except ConanException:
+                    return  # Do not assign the error of the request to every package
+                for pref, latest in result.items():
+                    latest = latest if latest is not None else PackageNotFoundException(pref)
+                    self._remote_prefs[(pref, remote.name)] = latest
+
+            if chunks:
+                thread_pool = ThreadPool(self._parallel)
+                try:
+                    thread_pool.map(_query, chunks)
+                finally:
+                    thread_pool.terminate()
+                    thread_pool.join()
+            if not update:
+                prefs = {p: info for p, info in prefs.items()
+                         if isinstance(self._remote_prefs.get((p, remote.name)), NotFoundException)}
+
+    def _needs_remote_check(self, node, build_mode, lockfile, update):
+        """ Cheap anticipation of _process_node(), to know in advance if the binary of this node
+        will be looked for in the remotes. A wrong guess only costs an unneeded or a non
+        concurrent request, but never changes the result of the evaluation
+        """
+        conanfile = node.conanfile
+        if node.recipe in (RECIPE_EDITABLE, RECIPE_SYSTEM_TOOL) or conanfile.info.invalid:
+            return False
+        if node.pref in self._evaluated or conanfile.upload_policy == "skip":
+            return False
+        if lockfile and lockfile.resolve_prev(node):
+            return False
+        if any(ref_matches(node.ref, p, is_consumer=conanfile._conan_is_consumer)
+               for p in build_mode.patterns):
+            return False
+        if build_mode.cascade and any(d.dst.binary == BINARY_BUILD for d in node.dependencies):
+            return False
+        return update or self._cache.get_latest_package_reference(node.pref) is None
+
     def _evaluate_is_cached(self, node):
         """ Each pref has to be evaluated just once, and the action for all of them should be
         exactly the same
@@ -124,6 +188,10 @@ class GraphBinariesAnalyzer(object):
             conanfile.options.update_options(compatible_pkg.options)
 
         conanfile.output.info(f"Checking {len(compatibles)} compatible configurations")
+        # The servers are queried with the original configuration, as in _evaluate_download()
+        compatible_prefs = {PkgReference(node.ref, pid): conanfile.info for pid in compatibles}
+        if self._parallel and update:
+            self._prefetch_remote_packages(compatible_prefs, remotes, update)
         for package_id, compatible_package in compatibles.items():
             if update:
                 conanfile.output.info(f"'{package_id}': "
@@ -136,6 +204,8 @@ class GraphBinariesAnalyzer(object):
                 return
         if not update:
             conanfile.output.info(f"Compatible configurations not found in cache, checking servers")
+            if self._parallel:
+                self._prefetch_remote_packages(compatible_prefs, remotes, update)
             for package_id, compatible_package in compatibles.items():
                 conanfile.output.info(f"'{package_id}': "
                                       f"{conanfile.info.dump_diff(compatible_package)}")
@@ -326,6 +396,20 @@ class GraphBinariesAnalyzer(object):
             with conanfile_exception_formatter(conanfile, "layout"):
                 conanfile.layout()
 
+    def _evaluate_node_package_id(self, node):
+        if node.recipe in (RECIPE_CONSUMER, RECIPE_VIRTUAL):
+            if node.path is not None and node.path.endswith(".py"):
+                # For .py we keep evaluating the package_id, validate(), etc
+                self._evaluate_package_id(node)
+            elif node.path is not None and node.path.endswith(".txt"):
+                # To support the ``[layout]`` in conanfile.txt
+                # TODO: Refactorize this a bit, the call to ``layout()``
+                if hasattr(node.conanfile, "layout"):
+                    with conanfile_exception_formatter(node.conanfile, "layout"):
+                        node.conanfile.layout()
+        else:
+            self._evaluate_package_id(node)
+
     def evaluate_graph(self, deps_graph, build_mode, lockfile, remotes, update, build_mode_test=None,
                        tested_graph=None):
         if tested_graph is None:
@@ -342,27 +426,38 @@ class GraphBinariesAnalyzer(object):
             ConanOutput().warning("Using build-mode 'cascade' is generally inefficient and it "
                                   "shouldn't be used. Use 'package_id' and 'package_id_modes' for"
                                   "more efficient re-builds")
-        for node in deps_graph.ordered_iterate():
-            if node.recipe in (RECIPE_CONSUMER, RECIPE_VIRTUAL):
-                if node.path is not None and node.path.endswith(".py"):
-                    # For .py we keep evaluating the package_id, validate(), etc
-                    self._evaluate_package_id(node)
-                elif node.path is not None and node.path.endswith(".txt"):
-                    # To support the ``[layout]`` in conanfile.txt
-                    # TODO: Refactorize this a bit, the call to ``layout()``
-                    if hasattr(node.conanfile, "layout"):
-                        with conanfile_exception_formatter(node.conanfile, "layout"):
-                            node.conanfile.layout()
+
+        def _build_mode(n):
+            return main_mode if mainprefs is None or str(n.pref) in mainprefs else test_mode
+
+        def _evaluate_binary(n):
+            if n.recipe in (RECIPE_CONSUMER, RECIPE_VIRTUAL):
+                return
+            if lockfile:
+                locked_prev = lockfile.resolve_prev(n)
+                if locked_prev:
+                    self._process_locked_node(n, _build_mode(n), locked_prev)
+                    return
+            self._evaluate_node(n, _build_mode(n), remotes, update)
+
+        for level in deps_graph.by_levels():
+            if self._parallel and remotes:
+                # The nodes of the same level are independent, so their package_id can be
+                # computed first, and then all their binaries checked in the remotes concurrently
+                for node in level:
+                    self._evaluate_node_package_id(node)
+                prefs = {n.pref: n.conanfile.info for n in level
+                         if n.recipe not in (RECIPE_CONSUMER, RECIPE_VIRTUAL)
+                         and self._needs_remote_check(n, _build_mode(n), lockfile, update)}
+                self._prefetch_remote_packages(prefs, remotes, update)
+                for node in level:
+                    _evaluate_binary(node)
+                # The wrongly anticipated queries are not used by the next levels
+                self._remote_prefs.clear()
             else:
-                self._evaluate_package_id(node)
-                build_mode = main_mode if mainprefs is None or str(node.pref) in mainprefs \
-                    else test_mode
-                if lockfile:
-                    locked_prev = lockfile.resolve_prev(node)
-                    if locked_prev:
-                        self._process_locked_node(node, build_mode, locked_prev)
-                        continue
-                self._evaluate_node(node, build_mode, remotes, update)
+                for node in level:
+                    self._evaluate_node_package_id(node)
+                    _evaluate_binary(node)
 
         self._skip_binaries(deps_graph)
 
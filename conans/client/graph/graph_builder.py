@@ -1,6 +1,7 @@
 import copy
 import os
 from collections import deque
+from multiprocessing.pool import ThreadPool
 
 from conans.client.conanfile.configure import run_configure_method
 from conans.client.graph.graph import DepsGraph, Node, CONTEXT_HOST, \
@@ -28,6 +29,7 @@ class DepsGraphBuilder(object):
         self._update = update
         self._check_update = check_update
         self._resolve_prereleases = self._cache.new_config.get('core.version_ranges:resolve_prereleases')
+        self._parallel_fetch = self._cache.new_config.get('core.graph:parallel_fetch', check_type=int)
 
     def load_graph(self, root_node, profile_host, profile_build, graph_lock=None):
         assert profile_host is not None
@@ -41,8 +43,15 @@ class DepsGraphBuilder(object):
         self._initialize_requires(root_node, dep_graph, graph_lock)
         dep_graph.add_node(root_node)
 
+        # The expansion is always sequential and in the same order, so the resulting graph is
+        # deterministic, but recipes can be retrieved in the background in advance
+        thread_pool = None
+        if self._parallel_fetch and graph_lock is None:
+            thread_pool = ThreadPool(self._parallel_fetch)
+        system_tools = {d.name for d in profile_host.system_tools + profile_build.system_tools}
         open_requires = deque((r, root_node) for r in root_node.conanfile.requires.values())
         try:
+            self._prefetch_requires(root_node, system_tools, thread_pool)
             while open_requires:
                 # Fetch the first waiting to be expanded (depth-first)
                 (require, node) = open_requires.popleft()
@@ -52,15 +61,43 @@ class DepsGraphBuilder(object):
                                                 profile_build, graph_lock)
                 if new_node:
                     self._initialize_requires(new_node, dep_graph, graph_lock)
+                    self._prefetch_requires(new_node, system_tools, thread_pool)
                     open_requires.extendleft((r, new_node)
                                              for r in reversed(new_node.conanfile.requires.values()))
             self._remove_overrides(dep_graph)
             check_graph_provides(dep_graph)
         except GraphError as e:
             dep_graph.error = e
+        finally:
+            if thread_pool is not None:
+                # Do not leave recipes half-downloaded in the background
+                thread_pool.close()
+                thread_pool.join()
+                self._proxy.clear_prefetched()
+            self._cache.flush_lru()
         dep_graph.resolved_ranges = self._resolver.resolved_ranges
         return dep_graph
 
+    def _prefetch_requires(self, node, system_tools, thread_pool):
+        """ Start retrieving in the background the recipes of the requirements of this node that
+        are already fully defined (no version ranges, not system tools), so they are already
+        available when the expansion gets to them. It doesn't modify the requirements
+        """
+        if thread_pool is None:
+            return
+        for require in node.conanfile.requires.values():
+            ref = require.ref
+            if require.override or require.version_range or ref.version == "<host_version>":
+                continue
+            if ref.name in system_tools:
+                continue
+            # Downstream overrides, forces or existing nodes will replace or close this require
+            # in _expand_require(), so its recipe wouldn't be necessary
+            if node.check_downstream_exists(require) is not None:
+                continue
+            self._proxy.prefetch_recipe(ref, self._remotes, self._update, self._check_update,
+                                        thread_pool)
+
     def _expand_require(self, require, node, graph, profile_host, profile_build, graph_lock):
         # Handle a requirement of a node. There are 2 possibilities
         #    node -(require)-> new_node (creates a new node in the graph)
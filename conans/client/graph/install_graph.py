@@ -11,6 +11,42 @@ from conans.model.recipe_ref import RecipeReference
 from conans.util.files import load
 
 
+def _levels(nodes):
+    """ topological order by levels of {key: item}, the item.depends are the keys of other items,
+    the ones not in <nodes> are ignored. The items of every level keep the order of <nodes>
+    Kahn algorithm, linear in the number of items and dependencies
+    """
+    index = {key: i for i, key in enumerate(nodes)}
+    pending = {}
+    dependants = {key: [] for key in nodes}
+    current_level = []
+    for key, item in nodes.items():
+        depends = {d for d in item.depends if d in index}
+        pending[key] = len(depends)
+        for d in depends:
+            dependants[d].append(key)
+        if not depends:
+            current_level.append(key)
+
+    levels = []
+    while current_level:
+        current_level.sort(key=index.__getitem__)
+        levels.append([nodes[key] for key in current_level])
+        next_level = []
+        for key in current_level:
+            for dependant in dependants[key]:
+                pending[dependant] -= 1
+                if not pending[dependant]:
+                    next_level.append(dependant)
+        current_level = next_level
+    # The items never released have a loop in their depends, they cannot be installed in order
+    unplaced = [str(key) for key, count in pending.items() if count]
+    if unplaced:
+        raise ConanException("Cannot compute the install order, there is a loop in the "
+                             "dependencies of: {}".format(", ".join(unplaced)))
+    return levels
+
+
 class _InstallPackageReference:
     """ Represents a single, unique PackageReference to be downloaded, built, etc.
     Same PREF should only be built or downloaded once, but it is possible to have multiple
@@ -154,25 +190,8 @@ class _InstallRecipeReference:
                     self.depends.append(dep.dst.ref)
 
     def _install_order(self):
-        # TODO: Repeated, refactor
         # a topological order by levels, returns a list of list, in order of processing
-        levels = []
-        opened = self.packages
-        while opened:
-            current_level = []
-            closed = []
-            for o in opened.values():
-                requires = o.depends
-                if not any(n in opened for n in requires):
-                    current_level.append(o)
-                    closed.append(o)
-
-            if current_level:
-                levels.append(current_level)
-            # now initialize new level
-            opened = {k: v for k, v in opened.items() if v not in closed}
-
-        return levels
+        return _levels(self.packages)
 
     def serialize(self):
         return {"ref": self.ref.repr_notime(),
@@ -246,21 +265,7 @@ class InstallGraph:
 
     def install_order(self, flat=False):
         # a topological order by levels, returns a list of list, in order of processing
-        levels = []
-        opened = self._nodes
-        while opened:
-            current_level = []
-            closed = []
-            for o in opened.values():
-                requires = o.depends
-                if not any(n in opened for n in requires):
-                    current_level.append(o)
-                    closed.append(o)
-
-            if current_level:
-                levels.append(current_level)
-            # now initialize new level
-            opened = {k: v for k, v in opened.items() if v not in closed}
+        levels = _levels(self._nodes)
         if flat:
             return [r for level in levels for r in level]
         return levels
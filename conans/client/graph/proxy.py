@@ -1,3 +1,5 @@
+import copy
+
 from conan.api.output import ConanOutput
 from conans.client.graph.graph import (RECIPE_DOWNLOADED, RECIPE_INCACHE, RECIPE_NEWER,
                                        RECIPE_NOT_IN_REMOTE, RECIPE_UPDATED, RECIPE_EDITABLE,
@@ -11,6 +13,7 @@ class ConanProxy:
         self._cache = conan_app.cache
         self._remote_manager = conan_app.remote_manager
         self._resolved = {}  # Cache of the requested recipes to optimize calls
+        self._prefetched = {}  # {ref: (ref, AsyncResult)} of recipes retrieved in background
 
     def get_recipe(self, ref, remotes, update, check_update):
         """
@@ -20,10 +23,34 @@ class ConanProxy:
         # with layout.conanfile_write_lock(self._out):
         resolved = self._resolved.get(ref)
         if resolved is None:
-            resolved = self._get_recipe(ref, remotes, update, check_update)
+            prefetched = self._prefetched.pop(ref, None)
+            if prefetched is not None:
+                prefetched_ref, result = prefetched
+                result.wait()  # Never retrieve the same recipe concurrently
+                # Only if exactly the same, a ref without revision is "equal" to any revision
+                if prefetched_ref.revision == ref.revision:
+                    resolved = result.get()  # Re-raises the prefetch errors, if any
+            if resolved is None:
+                resolved = self._get_recipe(ref, remotes, update, check_update)
             self._resolved[ref] = resolved
         return resolved
 
+    def prefetch_recipe(self, ref, remotes, update, check_update, thread_pool):
+        """ starts retrieving the recipe in the given thread_pool, so a later get_recipe() for the
+        same reference doesn't need to wait for the remotes. Errors are only raised if and when
+        the recipe is requested with get_recipe()
+        """
+        if ref in self._resolved or ref in self._prefetched:
+            return
+        ref = copy.copy(ref)  # The requirement ref can be modified later
+        result = thread_pool.apply_async(self._get_recipe, (ref, remotes, update, check_update))
+        self._prefetched[ref] = ref, result
+
+    def clear_prefetched(self):
+        """ discard the background results that were never requested with get_recipe()
+        """
+        self._prefetched.clear()
+
     # return the remote where the recipe was found or None if the recipe was not found
     def _get_recipe(self, reference, remotes, update, check_update):
         output = ConanOutput(scope=str(reference))
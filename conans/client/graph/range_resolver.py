@@ -1,7 +1,6 @@
 from conans.errors import ConanException
 from conans.model.recipe_ref import RecipeReference
 from conans.model.version_range import VersionRange
-from conans.search.search import search_recipes
 
 
 class RangeResolver:
@@ -10,7 +9,9 @@ class RangeResolver:
         self._cache = conan_app.cache
         self._remote_manager = conan_app.remote_manager
         self._cached_cache = {}  # Cache caching of search result, so invariant wrt installations
-        self._cached_remote_found = {}  # dict {ref (pkg/*): {remote_name: results (pkg/1, pkg/2)}}
+        self._cached_remote_found = {}  # dict {name (pkg): {remote_name: results (pkg/1, pkg/2)}}
+        self._cached_versions = {}  # {name: all the references of that name in the cache}
+        self._cached_remote_candidates = {}  # {(pattern, remote_name): _Candidates}
         self.resolved_ranges = {}
         self._resolve_prereleases = self._cache.new_config.get('core.version_ranges:resolve_prereleases')
 
@@ -49,29 +50,33 @@ class RangeResolver:
         pattern = str(search_ref)
         local_found = self._cached_cache.get(pattern)
         if local_found is None:
-            # This local_found is weird, it contains multiple revisions, not just latest
-            local_found = search_recipes(self._cache, pattern)
-            # TODO: This is still necessary to filter user/channel, until search_recipes is fixed
-            local_found = [ref for ref in local_found if ref.user == search_ref.user
+            versions = self._cached_versions.get(search_ref.name)
+            if versions is None:
+                # Indexed lookup of the name in the cache database, not a search of all the refs
+                versions = self._cache.get_recipe_versions(search_ref.name)
+                self._cached_versions[search_ref.name] = versions
+            local_found = [ref for ref in versions if ref.user == search_ref.user
                            and ref.channel == search_ref.channel]
             local_found.extend(r for r in self._cache.editable_packages.edited_refs
                                if r.name == search_ref.name and r.user == search_ref.user
                                and r.channel == search_ref.channel)
+            local_found = _Candidates(local_found)
             self._cached_cache[pattern] = local_found
-        if local_found:
-            return self._resolve_version(version_range, local_found, self._resolve_prereleases)
+        return self._resolve_version(version_range, local_found, self._resolve_prereleases)
 
     def _search_remote_recipes(self, remote, search_ref):
-        pattern = str(search_ref)
-        pattern_cached = self._cached_remote_found.setdefault(pattern, {})
-        results = pattern_cached.get(remote.name)
+        name_cached = self._cached_remote_found.setdefault(search_ref.name, {})
+        results = name_cached.get(remote.name)
         if results is None:
-            results = self._remote_manager.search_recipes(remote, pattern)
-            # TODO: This is still necessary to filter user/channel, until search_recipes is fixed
-            results = [ref for ref in results if ref.user == search_ref.user
-                       and ref.channel == search_ref.channel]
-            pattern_cached.update({remote.name: results})
-        return results
+            results = self._remote_manager.get_recipe_versions(search_ref.name, remote)
+            name_cached[remote.name] = results
+        key = str(search_ref), remote.name
+        candidates = self._cached_remote_candidates.get(key)
+        if candidates is None:
+            candidates = _Candidates([ref for ref in results if ref.user == search_ref.user
+                                      and ref.channel == search_ref.channel])
+            self._cached_remote_candidates[key] = candidates
+        return candidates
 
     def _resolve_remote(self, search_ref, version_range, remotes, update):
         update_candidates = []
@@ -85,12 +90,23 @@ class RangeResolver:
                 else:
                     update_candidates.append(resolved_version)
         if len(update_candidates) > 0:  # pick latest from already resolved candidates
-            resolved_version = self._resolve_version(version_range, update_candidates,
+            resolved_version = self._resolve_version(version_range, _Candidates(update_candidates),
                                                      self._resolve_prereleases)
             return resolved_version
 
     @staticmethod
-    def _resolve_version(version_range, refs_found, resolve_prereleases):
-        for ref in reversed(sorted(refs_found)):
-            if version_range.contains(ref.version, resolve_prereleases):
-                return ref
+    def _resolve_version(version_range, candidates, resolve_prereleases):
+        index = version_range.latest_index(candidates.versions, resolve_prereleases,
+                                           candidates.ordered)
+        if index is not None:
+            return candidates.refs[index]
+
+
+class _Candidates:
+    """ The references found for a name/user/channel, sorted once for all the ranges resolved
+    against them, with the parallel list of versions to bisect
+    """
+    def __init__(self, refs):
+        self.refs = sorted(refs)
+        self.versions = [ref.version for ref in self.refs]
+        self.ordered = all(v.ordered for v in self.versions)
@@ -1,5 +1,13 @@
+import json
 import os
+import platform
 import shutil
+import select
+import signal
+import sys
+import tempfile
+import threading
+import traceback
 from multiprocessing.pool import ThreadPool
 
 from conan.api.output import ConanOutput
@@ -14,7 +22,7 @@ from conans.errors import (ConanException, conanfile_exception_formatter, conanf
 from conans.model.build_info import CppInfo, MockInfoProperty
 from conans.model.package_ref import PkgReference
 from conans.paths import CONANINFO
-from conans.util.files import clean_dirty, is_dirty, mkdir, rmdir, save, set_dirty, chdir
+from conans.util.files import clean_dirty, is_dirty, mkdir, rmdir, save, set_dirty, chdir, load
 
 
 def build_id(conan_file):
@@ -163,6 +171,44 @@ class _PackageBuilder(object):
         return node.pref
 
 
+def _wait_any(pids):
+    """ blocks until any of the pids child processes finishes, and reaps it. Other children of this
+    process are not waited for. The pidfd of a child process is readable when it finishes
+    """
+    if not hasattr(os, "pidfd_open"):  # Python < 3.9, other children finishing are discarded
+        while True:
+            pid, _ = os.wait()
+            if pid in pids:
+                return pid
+    fds = {os.pidfd_open(pid): pid for pid in pids}
+    try:
+        ready, _, _ = select.select(list(fds), [], [])
+    finally:
+        for fd in fds:
+            os.close(fd)
+    pid = fds[ready[0]]
+    os.waitpid(pid, 0)
+    return pid
+
+
+def _json_attrs(conanfile):
+    """ the attributes of the conanfile instance that can be passed from the build job to the
+    parent process, to be available in package_info() as in a sequential build
+    """
+    result = {}
+    for name, value in vars(conanfile).items():
+        try:
+            result[name] = json.loads(json.dumps(value))
+        except (TypeError, ValueError):
+            pass
+    return result
+
+
+def _fork_available():
+    # fork() is not available in Windows, and not safe in macOS system frameworks
+    return hasattr(os, "fork") and platform.system() not in ("Windows", "Darwin")
+
+
 class BinaryInstaller:
     """ main responsible of retrieving binary packages or building them from source
     locally in case they are not found in remotes
@@ -173,6 +219,8 @@ class BinaryInstaller:
         self._cache = app.cache
         self._remote_manager = app.remote_manager
         self._hook_manager = app.hook_manager
+        self._downloads = {}  # {package: AsyncResult} of the packages downloading in background
+        self._download_pool = None
 
     def _install_source(self, node, remotes):
         conanfile = node.conanfile
@@ -247,21 +295,210 @@ class BinaryInstaller:
         package_count = sum([sum(len(install_reference.packages.values())
                                  for level in install_order
                                  for install_reference in level)])
-        handled_count = 1
 
-        self._download_bulk(install_order)
+        parallel = self._parallel_builds(install_order)
+        try:
+            self._download_bulk(install_order)
+            if parallel:
+                self._install_parallel(install_order, remotes, package_count, parallel)
+            else:
+                self._install_sequential(install_order, remotes, package_count)
+        finally:
+            self._cancel_downloads()
+            self._cache.flush_lru()
+            self._app.requester.output_connections_stats()
+
+        MockInfoProperty.message()
+
+    def _install_sequential(self, install_order, remotes, total_count):
+        handled_count = 1
         for level in install_order:
             for install_reference in level:
                 for package in install_reference.packages.values():
                     self._install_source(package.nodes[0], remotes)
-                    self._handle_package(package, install_reference, handled_count, package_count)
+                    self._handle_package(package, install_reference, handled_count, total_count)
                     handled_count += 1
 
-        MockInfoProperty.message()
+    def _parallel_builds(self, install_order):
+        """ the number of parallel jobs to build packages, None if they are built sequentially
+        """
+        parallel = self._cache.new_config.get("core.build:parallel_jobs", check_type=int)
+        if parallel is None or parallel < 2:
+            return None
+        if not any(package.binary == BINARY_BUILD
+                   for level in install_order
+                   for install_reference in level
+                   for package in install_reference.packages.values()):
+            return None
+        if not _fork_available():
+            ConanOutput().warning("'core.build:parallel_jobs' is not supported in this platform, "
+                                  "the packages will be built sequentially")
+            return None
+        return parallel
+
+    def _install_parallel(self, install_order, remotes, total_count, parallel):
+        """ The recipes with packages to build from source are built in forked child processes,
+        up to "parallel" at the same time. A recipe starts as soon as all its dependencies are
+        installed, not waiting for the whole level. The output of every child is buffered in a
+        file, and printed when it finishes, so the output of different packages is not mixed.
+        fork() is only safe if no other thread is running, otherwise it is built sequentially
+        """
+        # Never fork while there are threads running, the children could inherit their locks
+        self._wait_downloads()
+        if threading.active_count() > 1:
+            # Conan used as a library by a multithreaded application, or by several threads
+            ConanOutput().warning("'core.build:parallel_jobs' can't be used while other threads "
+                                  "are running, the packages will be built sequentially")
+            self._install_sequential(install_order, remotes, total_count)
+            return
+        ConanOutput().info(f"Building packages in {parallel} parallel jobs")
+        pending = [r for level in install_order for r in level]
+        done = set()  # recipe references already installed
+        running = {}  # {pid: (install_reference, log_file, result_file)}
+        errors = []
+        handled_count = 1
+        tmp_folder = tempfile.mkdtemp(prefix="conan_build_")
+        try:
+            while pending or running:
+                for install_reference in list(pending):
+                    if errors or len(running) >= parallel:
+                        break
+                    if any(d not in done for d in install_reference.depends):
+                        continue
+                    pending.remove(install_reference)
+                    packages = list(install_reference.packages.values())
+                    # The packages depending on other packages of the same recipe need their
+                    # package_info(), that only runs in this process, they are built here
+                    if not any(p.binary == BINARY_BUILD for p in packages) or \
+                            any(p.depends for p in packages):
+                        for package in packages:
+                            self._install_source(package.nodes[0], remotes)
+                            self._handle_package(package, install_reference, handled_count,
+                                                 total_count)
+                            handled_count += 1
+                        done.add(install_reference.ref)
+                        continue
+                    log_file = os.path.join(tmp_folder, f"{handled_count}.log")
+                    result_file = os.path.join(tmp_folder, f"{handled_count}.json")
+                    ConanOutput(scope=str(install_reference.ref))\
+                        .highlight("Building from source in a parallel job")
+                    pid = self._fork_build(install_reference, remotes, handled_count, total_count,
+                                           log_file, result_file)
+                    handled_count += len(packages)
+                    running[pid] = install_reference, log_file, result_file
+
+                if not running:
+                    assert errors or not pending, "Recipes waiting for dependencies never installed"
+                    break  # After errors, the rest of recipes are never started
+                pid = _wait_any(running)
+                install_reference, log_file, result_file = running.pop(pid)
+                out = ConanOutput()
+                if os.path.exists(log_file):
+                    out.stream.write(load(log_file))
+                    out.stream.flush()
+                result = json.loads(load(result_file)) if os.path.exists(result_file) else {}
+                if "packages" not in result:
+                    errors.append(result.get("error") or
+                                  f"Unexpected failure building {install_reference.ref}")
+                    continue
+                for i, package in enumerate(install_reference.packages.values()):
+                    if package.binary == BINARY_SYSTEM_TOOL:
+                        continue
+                    folders = result["packages"].get(str(i))
+                    if folders is None:
+                        raise ConanException(f"The parallel job of {install_reference.ref} didn't "
+                                             f"install the package {package.package_id}")
+                    self._handle_package_built(package, folders)
+                done.add(install_reference.ref)
+        finally:
+            # Interrupted or failed, the children still running are stopped before removing their
+            # logs and results folder
+            for pid in running:
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                    os.waitpid(pid, 0)
+                except OSError:
+                    pass
+            rmdir(tmp_folder)
+
+        if errors:
+            raise ConanException("\n".join(errors))
+
+    def _fork_build(self, install_reference, remotes, handled_count, total_count, log_file,
+                    result_file):
+        """ installs all the packages of a recipe in a child process, exactly as the sequential
+        install, but without their package_info(), that runs in the parent. Saves the resulting
+        package_id and folders of every package, by their position, in the result_file json, and
+        the JSON serializable attributes that build() and package() set in the conanfile
+        """
+        pid = os.fork()
+        if pid:
+            return pid
+        status = 1
+        try:
+            log = open(log_file, "a", buffering=1, encoding="utf-8")
+            # also the output of subprocesses, not only the Python one
+            os.dup2(log.fileno(), 1)
+            os.dup2(log.fileno(), 2)
+            sys.stdout = sys.stderr = log
+            try:
+                result = {}
+                for i, package in enumerate(install_reference.packages.values()):
+                    conanfile = package.nodes[0].conanfile
+                    attrs = _json_attrs(conanfile)
+                    self._install_source(package.nodes[0], remotes)
+                    pkg_folders = self._handle_package(package, install_reference, handled_count,
+                                                       total_count, package_info=False)
+                    handled_count += 1
+                    if pkg_folders is None:  # system tools
+                        continue
+                    pkg_folder, pkg_metadata = pkg_folders
+                    folders = conanfile.folders
+                    state = {k: v for k, v in _json_attrs(conanfile).items()
+                             if k not in attrs or attrs[k] != v}
+                    result[str(i)] = {"package_id": package.package_id,
+                                      "prev": package.prev,
+                                      "source": folders.base_source,
+                                      "build": folders.base_build,
+                                      "package": pkg_folder,
+                                      "metadata": pkg_metadata,
+                                      "state": state}
+                self._cache.flush_lru()
+                save(result_file, json.dumps({"packages": result}))
+                status = 0
+            except BaseException as e:
+                if isinstance(e, ConanException):
+                    error = str(e)
+                else:
+                    ConanOutput().debug(traceback.format_exc())
+                    error = f"{install_reference.ref}: {type(e).__name__}: {e}"
+                save(result_file, json.dumps({"error": error}))
+            log.flush()
+        finally:
+            os._exit(status)  # Never return to the caller, nor run any cleanup of the parent
+
+    def _handle_package_built(self, package, folders):
+        """ updates the nodes of a package installed in a child process, with the package_id and
+        folders computed there, and runs the package_info() of all the nodes in this process
+        """
+        node = package.nodes[0]
+        if node.binary == BINARY_BUILD:
+            package.package_id = folders["package_id"]  # Just in case it was recomputed
+            package.prev = folders["prev"]
+            node.prev = package.prev
+            conanfile = node.conanfile
+            conanfile.folders.set_base_source(folders["source"])
+            conanfile.folders.set_base_build(folders["build"])
+            conanfile.folders.set_base_generators(folders["build"])
+            for name, value in folders["state"].items():  # What build() left for package_info()
+                setattr(conanfile, name, value)
+        pref = PkgReference(node.ref, package.package_id, folders["prev"])
+        self._package_info(package, pref, folders["package"], folders["metadata"])
 
     def _download_bulk(self, install_order):
         """ executes the download of packages (both download and update), only once for a given
-        PREF
+        PREF. With "core.download:parallel" the downloads run in background threads, in the
+        install order, and the install of every package only waits for its own download
         """
         downloads = []
         for level in install_order:
@@ -279,23 +516,53 @@ class BinaryInstaller:
         if parallel is not None:
             ConanOutput().info("Downloading binary packages in %s parallel threads" % parallel)
             thread_pool = ThreadPool(parallel)
-            thread_pool.map(self._download_pkg, downloads)
+            # The pool runs the tasks in the order they are submitted, the install order
+            for package in downloads:
+                self._downloads[package] = thread_pool.apply_async(self._download_pkg, (package,))
             thread_pool.close()
-            thread_pool.join()
+            self._download_pool = thread_pool
         else:
             for node in downloads:
                 self._download_pkg(node)
 
+    def _wait_download(self, package):
+        download = self._downloads.pop(package, None)
+        if download is not None:
+            download.get()  # raises the exception of the download, if any
+
+    def _wait_downloads(self):
+        for package in list(self._downloads):
+            self._wait_download(package)
+        if self._download_pool is not None:
+            self._download_pool.join()  # also the threads of the pool are finished
+            self._download_pool = None
+
+    def _cancel_downloads(self):
+        """ stops the download threads. In case of errors the downloads not started yet are
+        discarded, and the running ones finish
+        """
+        self._downloads.clear()
+        if self._download_pool is not None:
+            self._download_pool.terminate()
+            self._download_pool.join()
+            self._download_pool = None
+
     def _download_pkg(self, package):
         node = package.nodes[0]
         assert node.pref.revision is not None
         assert node.pref.timestamp is not None
         self._remote_manager.get_package(node.pref, node.binary_remote)
 
-    def _handle_package(self, package, install_reference, handled_count, total_count):
+    def _handle_package(self, package, install_reference, handled_count, total_count,
+                        package_info=True):
+        """ with package_info=False, the package_info() is not called, the caller is responsible
+        of calling it, and it returns the (package folder, metadata folder) of the package
+        """
         if package.binary == BINARY_SYSTEM_TOOL:
             return
 
+        self._wait_download(package)
+
         if package.binary in (BINARY_EDITABLE, BINARY_EDITABLE_BUILD):
             self._handle_node_editable(package)
             return
@@ -330,9 +597,12 @@ class BinaryInstaller:
             assert node.prev, "PREV for %s is None" % str(pref)
             node.conanfile.output.success(f'Already installed! ({handled_count} of {total_count})')
 
+        if not package_info:
+            return package_layout.package(), package_layout.metadata()
+        self._package_info(package, pref, package_layout.package(), package_layout.metadata())
+
+    def _package_info(self, package, pref, pkg_folder, pkg_metadata):
         # Make sure that all nodes with same pref compute package_info()
-        pkg_folder = package_layout.package()
-        pkg_metadata = package_layout.metadata()
         assert os.path.isdir(pkg_folder), "Pkg '%s' folder must exist: %s" % (str(pref), pkg_folder)
         for n in package.nodes:
             n.prev = pref.revision  # Make sure the prev is assigned
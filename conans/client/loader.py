@@ -1,5 +1,7 @@
 from importlib import invalidate_caches, util as imp_util
+from importlib.machinery import PathFinder, SourceFileLoader
 import inspect
+import marshal
 import os
 import re
 import sys
@@ -20,15 +22,16 @@ from conans.model.conan_file import ConanFile
 from conans.model.options import Options
 from conans.model.recipe_ref import RecipeReference
 from conans.paths import DATA_YML
-from conans.util.files import load, chdir, load_user_encoded
+from conans.util.files import load, chdir, load_user_encoded, md5, mkdir
 
 
 class ConanFileLoader:
 
-    def __init__(self, pyreq_loader=None, conanfile_helpers=None):
+    def __init__(self, pyreq_loader=None, conanfile_helpers=None, bytecode_cache=None):
         self._pyreq_loader = pyreq_loader
         self._cached_conanfile_classes = {}
         self._conanfile_helpers = conanfile_helpers
+        self._bytecode_cache = bytecode_cache
         invalidate_caches()
 
     def load_basic(self, conanfile_path, graph_lock=None, display="", remotes=None,
@@ -52,7 +55,7 @@ class ConanFileLoader:
             return conanfile, cached[1]
 
         try:
-            module, conanfile = parse_conanfile(conanfile_path)
+            module, conanfile = parse_conanfile(conanfile_path, self._bytecode_cache)
             if tested_python_requires:
                 conanfile.python_requires = tested_python_requires
 
@@ -293,8 +296,8 @@ def _parse_module(conanfile_module, module_id):
     return result
 
 
-def parse_conanfile(conanfile_path):
-    module, filename = load_python_file(conanfile_path)
+def parse_conanfile(conanfile_path, bytecode_cache=None):
+    module, filename = load_python_file(conanfile_path, bytecode_cache)
     try:
         conanfile = _parse_module(module, filename)
         return module, conanfile
@@ -302,7 +305,70 @@ def parse_conanfile(conanfile_path):
         raise ConanException("%s: %s" % (conanfile_path, str(e)))
 
 
-def load_python_file(conan_file_path):
+class RecipeBytecodeCache:
+    """ The compiled code of the python files of the recipes stored in the Conan cache, that are
+    immutable for a given revision, so they are not compiled again in every command. The files
+    are keyed by the hash of their path, that contains the recipe revision, and their contents.
+    The recipes out of the cache, like consumer or editable conanfiles, are never cached
+    """
+
+    def __init__(self, store_folder, bytecode_folder):
+        self._store_folder = os.path.join(os.path.normcase(os.path.abspath(store_folder)), "")
+        self._bytecode_folder = bytecode_folder
+
+    def applies(self, path):
+        return os.path.normcase(os.path.abspath(path)).startswith(self._store_folder)
+
+    def get_code(self, path, source):
+        key = md5(imp_util.MAGIC_NUMBER + path.encode("utf-8") + b"\0" + source)
+        bytecode_path = os.path.join(self._bytecode_folder, key[:2], key + ".pyc")
+        try:
+            with open(bytecode_path, "rb") as f:
+                return marshal.loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError):  # Not there or corrupted
+            pass
+        code = compile(source, path, "exec", dont_inherit=True)
+        try:
+            mkdir(os.path.dirname(bytecode_path))
+            tmp_path = "{}.{}".format(bytecode_path, uuid.uuid4().hex)
+            with open(tmp_path, "wb") as f:
+                f.write(marshal.dumps(code))
+            os.replace(tmp_path, bytecode_path)  # Atomic, concurrent processes can read it
+        except OSError:  # A read-only cache, for example, it is just not cached
+            pass
+        return code
+
+
+class _BytecodeCacheLoader(SourceFileLoader):
+    def __init__(self, fullname, path, bytecode_cache):
+        super().__init__(fullname, path)
+        self._bytecode_cache = bytecode_cache
+
+    def get_code(self, fullname):
+        path = self.get_filename(fullname)
+        return self._bytecode_cache.get_code(path, self.get_data(path))
+
+
+class _BytecodeCacheFinder:
+    """ Finds the modules that a cached recipe imports from its own folder (exported with it) to
+    load them with the bytecode cache too
+    """
+
+    def __init__(self, folder, bytecode_cache):
+        self._folder = folder
+        self._prefix = os.path.join(folder, "")
+        self._bytecode_cache = bytecode_cache
+
+    def find_spec(self, fullname, path=None, target=None):
+        spec = PathFinder.find_spec(fullname, path or [self._folder], target)
+        if spec is None or not isinstance(spec.loader, SourceFileLoader) or \
+                not spec.origin.startswith(self._prefix):
+            return None
+        spec.loader = _BytecodeCacheLoader(spec.name, spec.origin, self._bytecode_cache)
+        return spec
+
+
+def load_python_file(conan_file_path, bytecode_cache=None):
     """ From a given path, obtain the in memory python import module
     """
 
@@ -311,14 +377,25 @@ def load_python_file(conan_file_path):
 
     module_id = str(uuid.uuid1())
     current_dir = os.path.dirname(conan_file_path)
+    if bytecode_cache is not None and not bytecode_cache.applies(conan_file_path):
+        bytecode_cache = None
     sys.path.insert(0, current_dir)
+    finder = None
+    if bytecode_cache is not None:
+        finder = _BytecodeCacheFinder(current_dir, bytecode_cache)
+        sys.meta_path.insert(0, finder)
     try:
         old_modules = list(sys.modules.keys())
         with chdir(current_dir):
             old_dont_write_bytecode = sys.dont_write_bytecode
             try:
                 sys.dont_write_bytecode = True
-                spec = imp_util.spec_from_file_location(module_id, conan_file_path)
+                if bytecode_cache is not None:
+                    loader = _BytecodeCacheLoader(module_id, conan_file_path, bytecode_cache)
+                else:
+                    loader = None
+                spec = imp_util.spec_from_file_location(module_id, conan_file_path,
+                                                        loader=loader)
                 loaded = imp_util.module_from_spec(spec)
                 spec.loader.exec_module(loaded)
                 sys.dont_write_bytecode = old_dont_write_bytecode
@@ -361,6 +438,8 @@ def load_python_file(conan_file_path):
                                                                      '\n'.join(trace[3:])))
     finally:
         sys.path.pop(0)
+        if finder is not None:
+            sys.meta_path.remove(finder)
 
     return loaded, module_id
 
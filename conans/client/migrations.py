@@ -54,6 +54,7 @@ class ClientMigrator(Migrator):
 
         if old_version and old_version < "2.0.14":
             _migrate_pkg_db_lru(self.cache_folder, old_version)
+            _migrate_db_indexes(self.cache_folder)
 
 
 def _migrate_pkg_db_lru(cache_folder, old_version):
@@ -94,3 +95,37 @@ def _migrate_pkg_db_lru(cache_folder, old_version):
         save(path, undo_lru)
     finally:
         connection.close()
+
+
+def _migrate_db_indexes(cache_folder):
+    ConanOutput().warning("Running 2.0.14 Cache DB migration to add indexes")
+    db_filename = os.path.join(cache_folder, 'p', 'cache.sqlite3')
+    if not os.path.isfile(db_filename):
+        return
+    from conan.internal.cache.db.packages_table import PackagesDBTable
+    from conan.internal.cache.db.recipes_table import RecipesDBTable
+    try:
+        for table in (RecipesDBTable(db_filename), PackagesDBTable(db_filename)):
+            table.create_indexes()
+    except Exception:
+        ConanOutput().error(f"Could not complete the 2.0.14 DB indexes migration."
+                            " Please manually remove your .conan2 cache and reinstall packages")
+        raise
+    else:  # generate the back-migration script
+        undo_indexes = textwrap.dedent("""\
+            import os
+            import sqlite3
+            def migrate(cache_folder):
+                db = os.path.join(cache_folder, 'p', 'cache.sqlite3')
+                connection = sqlite3.connect(db, isolation_level=None, timeout=1,
+                                             check_same_thread=False)
+                try:
+                    for index in ("recipes_reference_timestamp_idx",
+                                  "packages_reference_rrev_pkgid_timestamp_idx",
+                                  "packages_reference_rrev_build_id_idx"):
+                        connection.execute(f"DROP INDEX IF EXISTS {index};")
+                finally:
+                    connection.close()
+            """)
+        path = os.path.join(cache_folder, "migrations", "2.0.14_2-migrate.py")
+        save(path, undo_indexes)
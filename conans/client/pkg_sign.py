@@ -18,6 +18,11 @@ class PkgSignaturesPlugin:
         else:
             self._plugin_sign_function = self._plugin_verify_function = None
 
+    @property
+    def verifies(self):
+        """ True if the plugin has to verify the downloaded files """
+        return self._plugin_verify_function is not None
+
     def sign(self, upload_data):
         if self._plugin_sign_function is None:
             return
@@ -7,15 +7,18 @@ from requests.exceptions import ConnectionError
 from conan.api.output import ConanOutput
 from conan.internal.cache.conan_reference_layout import METADATA
 from conans.client.cache.remote_registry import Remote
+from conans.client.downloaders.file_downloader import StreamExtraction
 from conans.client.pkg_sign import PkgSignaturesPlugin
 from conans.errors import ConanConnectionError, ConanException, NotFoundException, \
     PackageNotFoundException
 from conans.model.info import load_binary_info
+from conans.model.manifest import FileTreeManifest
 from conans.model.package_ref import PkgReference
 from conans.model.recipe_ref import RecipeReference
 from conans.util.files import rmdir, human_size
-from conans.paths import EXPORT_SOURCES_TGZ_NAME, EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME
-from conans.util.files import mkdir, tar_extract
+from conans.paths import EXPORT_SOURCES_TGZ_NAME, EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME, \
+    CONAN_MANIFEST, EXPORT_TZST_NAME, PACKAGE_TZST_NAME, CONANINFO
+from conans.util.files import load, mkdir, tar_extract, archive_compression, md5sum
 
 
 class RemoteManager(object):
@@ -29,6 +32,11 @@ class RemoteManager(object):
     def check_credentials(self, remote):
         self._call_remote(remote, "check_credentials")
 
+    def accepts_zstd(self, remote):
+        """ if the remote can store the zstd compressed .tzst archives, older servers can't
+        """
+        return self._call_remote(remote, "accepts_zstd")
+
     def upload_recipe(self, ref, files_to_upload, remote):
         assert isinstance(ref, RecipeReference)
         assert ref.revision, "upload_recipe requires RREV"
@@ -67,10 +75,11 @@ class RemoteManager(object):
             self._cache.remove_recipe_layout(layout)
             raise
         export_folder = layout.export()
-        tgz_file = zipped_files.pop(EXPORT_TGZ_NAME, None)
+        tgz_file = _pop_archive(zipped_files, EXPORT_TGZ_NAME, EXPORT_TZST_NAME)
 
         if tgz_file:
-            uncompress_file(tgz_file, export_folder, scope=str(ref))
+            uncompress_file(tgz_file, export_folder, scope=str(ref),
+                            data_filter=self._data_filter())
         mkdir(export_folder)
         for file_name, file_path in zipped_files.items():  # copy CONANFILE
             shutil.move(file_path, os.path.join(export_folder, file_name))
@@ -94,6 +103,11 @@ class RemoteManager(object):
             output.error(f"Error downloading metadata from remote '{remote.name}'")
             raise
 
+    def _data_filter(self):
+        # Opt-in, the packages already in the servers could contain members that it rejects
+        return self._cache.new_config.get("core.download:tar_data_filter", check_type=bool,
+                                          default=False)
+
     def get_recipe_sources(self, ref, layout, remote):
         assert ref.revision, "get_recipe_sources requires RREV"
 
@@ -106,7 +120,8 @@ class RemoteManager(object):
 
         self._signer.verify(ref, download_folder, files=zipped_files)
         tgz_file = zipped_files[EXPORT_SOURCES_TGZ_NAME]
-        uncompress_file(tgz_file, export_sources_folder, scope=str(ref))
+        uncompress_file(tgz_file, export_sources_folder, scope=str(ref),
+                        data_filter=self._data_filter())
 
     def get_package(self, pref, remote, metadata=None):
         output = ConanOutput(scope=str(pref.ref))
@@ -143,19 +158,38 @@ class RemoteManager(object):
             assert pref.revision is not None
 
             download_pkg_folder = layout.download_package()
+            package_folder = layout.package()
+            # The conan_package.tgz/tzst is extracted while downloading, not reading it again later
+            # But not if it has to be verified first, it can't be extracted before the verification
+            data_filter = self._data_filter()
+            extraction = StreamExtraction(package_folder, data_filter) \
+                if not self._signer.verifies else None
             # Download files to the pkg_tgz folder, not to the final one
             zipped_files = self._call_remote(remote, "get_package", pref, download_pkg_folder,
-                                             metadata, only_metadata=False)
+                                             metadata, only_metadata=False,
+                                             extraction=extraction)
             zipped_files = {k: v for k, v in zipped_files.items() if not k.startswith(METADATA)}
             # quick server package integrity check:
-            for f in ("conaninfo.txt", "conanmanifest.txt", "conan_package.tgz"):
+            for f in ("conaninfo.txt", "conanmanifest.txt"):
                 if f not in zipped_files:
                     raise ConanException(f"Corrupted {pref} in '{remote.name}' remote: no {f}")
+            if PACKAGE_TGZ_NAME not in zipped_files and PACKAGE_TZST_NAME not in zipped_files:
+                raise ConanException(f"Corrupted {pref} in '{remote.name}' remote: "
+                                     f"no {PACKAGE_TGZ_NAME}")
             self._signer.verify(pref, download_pkg_folder, zipped_files)
 
-            tgz_file = zipped_files.pop(PACKAGE_TGZ_NAME, None)
-            package_folder = layout.package()
-            uncompress_file(tgz_file, package_folder, scope=str(pref.ref))
+            tgz_file = _pop_archive(zipped_files, PACKAGE_TGZ_NAME, PACKAGE_TZST_NAME)
+            file_sums = extraction.file_sums if extraction is not None else None
+            if file_sums is None:  # Not possible while downloading, extract the downloaded file
+                file_sums = {}
+                uncompress_file(tgz_file, package_folder, scope=str(pref.ref), file_sums=file_sums,
+                                data_filter=data_filter)
+            # Opt-in, the packages already in the servers could have manifests that don't match
+            check_manifest = self._cache.new_config.get("core.download:check_manifest",
+                                                        check_type=bool, default=False)
+            if check_manifest:  # The md5s were computed while extracting, nothing is read again
+                file_sums[CONANINFO] = md5sum(zipped_files[CONANINFO])  # Not in the tgz
+                _check_manifest(pref, remote, zipped_files[CONAN_MANIFEST], file_sums)
             mkdir(package_folder)  # Just in case it doesn't exist, because uncompress did nothing
             for file_name, file_path in zipped_files.items():  # copy CONANINFO and CONANMANIFEST
                 shutil.move(file_path, os.path.join(package_folder, file_name))
@@ -173,6 +207,10 @@ class RemoteManager(object):
     def search_recipes(self, remote, pattern):
         return self._call_remote(remote, "search", pattern)
 
+    def get_recipe_versions(self, name, remote):
+        """ all the references (without revision) of a recipe name in the remote """
+        return self._call_remote(remote, "get_recipe_versions", name)
+
     def search_packages(self, remote, ref):
         packages = self._call_remote(remote, "search_packages", ref)
         # Avoid serializing conaninfo in server side
@@ -207,19 +245,33 @@ class RemoteManager(object):
 
     def get_latest_package_reference(self, pref, remote, info=None) -> PkgReference:
         assert pref.revision is None, "get_latest_package_reference of a reference with revision"
-        # These headers are useful to know what configurations are being requested in the server
-        headers = None
-        if info:
-            headers = {}
-            settings = [f'{k}={v}' for k, v in info.settings.items()]
-            if settings:
-                headers['Conan-PkgID-Settings'] = ';'.join(settings)
-            options = [f'{k}={v}' for k, v in info.options.serialize().items()
-                       if k in ("shared", "fPIC", "header_only")]
-            if options:
-                headers['Conan-PkgID-Options'] = ';'.join(options)
+        headers = self._package_headers(info) if info else None
         return self._call_remote(remote, "get_latest_package_reference", pref, headers=headers)
 
+    def get_latest_packages_references(self, prefs, remote):
+        """ the latest revision of many packages at once, prefs is {pref: info}. Returns
+        {pref: latest_pref}, with None values for the packages not found in the remote. The
+        packages that the user can't read are not in the result
+        """
+        assert all(p.revision is None for p in prefs), \
+            "get_latest_packages_references of references with revision"
+        prefs = {pref: self._package_headers(info) if info else None
+                 for pref, info in prefs.items()}
+        return self._call_remote(remote, "get_latest_packages_references", prefs)
+
+    @staticmethod
+    def _package_headers(info):
+        # These headers are useful to know what configurations are being requested in the server
+        headers = {}
+        settings = [f'{k}={v}' for k, v in info.settings.items()]
+        if settings:
+            headers['Conan-PkgID-Settings'] = ';'.join(settings)
+        options = [f'{k}={v}' for k, v in info.options.serialize().items()
+                   if k in ("shared", "fPIC", "header_only")]
+        if options:
+            headers['Conan-PkgID-Options'] = ';'.join(options)
+        return headers
+
     def get_recipe_revision_reference(self, ref, remote) -> bool:
         assert ref.revision is not None, "recipe_exists needs a revision"
         return self._call_remote(remote, "get_recipe_revision_reference", ref)
@@ -248,7 +300,26 @@ class RemoteManager(object):
             raise ConanException(exc, remote=remote)
 
 
-def uncompress_file(src_path, dest_folder, scope=None):
+def _check_manifest(pref, remote, manifest_path, file_sums):
+    """ the md5 of the files, computed while extracting them, must match the manifest ones
+    """
+    manifest = FileTreeManifest.loads(load(manifest_path))
+    for file_name, file_md5 in manifest.file_sums.items():
+        extracted_md5 = file_sums.get(file_name)
+        if extracted_md5 is None:
+            raise ConanException(f"Corrupted {pref} in '{remote.name}' remote: '{file_name}' "
+                                 f"of the {CONAN_MANIFEST} is missing")
+        if extracted_md5 != file_md5:
+            raise ConanException(f"Corrupted {pref} in '{remote.name}' remote: '{file_name}' "
+                                 f"checksum doesn't match the {CONAN_MANIFEST} one")
+
+
+def _pop_archive(zipped_files, tgz_name, tzst_name):
+    # The server can store the .tgz or the .tzst archive, only one of them is downloaded
+    return zipped_files.pop(tgz_name, None) or zipped_files.pop(tzst_name, None)
+
+
+def uncompress_file(src_path, dest_folder, scope=None, file_sums=None, data_filter=False):
     try:
         filesize = os.path.getsize(src_path)
         big_file = filesize > 10000000  # 10 MB
@@ -256,7 +327,8 @@ def uncompress_file(src_path, dest_folder, scope=None):
             hs = human_size(filesize)
             ConanOutput(scope=scope).info(f"Decompressing {hs} {os.path.basename(src_path)}")
         with open(src_path, mode='rb') as file_handler:
-            tar_extract(file_handler, dest_folder)
+            tar_extract(file_handler, dest_folder, file_sums=file_sums,
+                        compression=archive_compression(src_path), data_filter=data_filter)
     except Exception as e:
         error_msg = "Error while extracting downloaded file '%s' to %s\n%s\n"\
                     % (src_path, dest_folder, str(e))
@@ -8,10 +8,12 @@ Flow:
     Directly invoke a REST method in RestApiClient, example: get_conan.
     if receives AuthenticationException (not open method) will ask user for login and password
     and will invoke RestApiClient.get_token() (with LOGIN_RETRIES retries) and retry to call
-    get_conan with the new token.
+    get_conan with the new token. With parallel threads, only the first one asks for the login
+    and the others wait for it and reuse the new token.
 """
 
 import hashlib
+import threading
 from uuid import getnode as get_mac
 
 from conan.api.output import ConanOutput
@@ -28,6 +30,7 @@ class ConanApiAuthManager(object):
         self._cache = cache
         self._rest_client_factory = rest_client_factory
         self._localdb = cache.localdb
+        self._lock = threading.Lock()  # The login and the token refresh of the parallel threads
 
     def call_rest_api_method(self, remote, method_name, *args, **kwargs):
         """Handles AuthenticationException and request user to input a user and a password"""
@@ -43,32 +46,38 @@ class ConanApiAuthManager(object):
         except ForbiddenException as e:
             raise ForbiddenException(f"Permission denied for user: '{user}': {e}")
         except AuthenticationException:
-            # User valid but not enough permissions
-            if user is None or token is None:
-                # token is None when you change user with user command
-                # Anonymous is not enough, ask for a user
-                ConanOutput().info('Please log in to "%s" to perform this action. '
-                                   'Execute "conan remote login" command.' % remote.name)
-                return self._retry_with_new_token(user, remote, method_name, *args, **kwargs)
-            elif token and refresh_token:
-                # If we have a refresh token try to refresh the access token
-                try:
-                    self._authenticate(remote, user, None)
-                except AuthenticationException:
-                    # logger.info("Cannot refresh the token, cleaning and retrying: {}".format(exc))
-                    self._clear_user_tokens_in_db(user, remote)
-                return self.call_rest_api_method(remote, method_name, *args, **kwargs)
-            else:
-                # Token expired or not valid, so clean the token and repeat the call
-                # (will be anonymous call but exporting who is calling)
-                # logger.info("Token expired or not valid, cleaning the saved token and retrying")
+            # Only one thread at a time logs in or refreshes the token, the others wait for it
+            with self._lock:
+                if self._localdb.get_login(remote.url)[1] == token:
+                    self._renew_token(user, token, refresh_token, remote)
+                # else: another thread already got a new token meanwhile, just use it
+            return self.call_rest_api_method(remote, method_name, *args, **kwargs)
+
+    def _renew_token(self, user, token, refresh_token, remote):
+        # User valid but not enough permissions
+        if user is None or token is None:
+            # token is None when you change user with user command
+            # Anonymous is not enough, ask for a user
+            ConanOutput().info('Please log in to "%s" to perform this action. '
+                               'Execute "conan remote login" command.' % remote.name)
+            self._get_new_token(user, remote)
+        elif token and refresh_token:
+            # If we have a refresh token try to refresh the access token
+            try:
+                self._authenticate(remote, user, None)
+            except AuthenticationException:
+                # logger.info("Cannot refresh the token, cleaning and retrying: {}".format(exc))
                 self._clear_user_tokens_in_db(user, remote)
-                return self.call_rest_api_method(remote, method_name, *args, **kwargs)
+        else:
+            # Token expired or not valid, so clean the token and repeat the call
+            # (will be anonymous call but exporting who is calling)
+            # logger.info("Token expired or not valid, cleaning the saved token and retrying")
+            self._clear_user_tokens_in_db(user, remote)
 
-    def _retry_with_new_token(self, user, remote, method_name, *args, **kwargs):
+    def _get_new_token(self, user, remote):
         """Try LOGIN_RETRIES to obtain a password from user input for which
         we can get a valid token from api_client. If a token is returned,
-        credentials are stored in localdb and rest method is called"""
+        credentials are stored in localdb"""
         for _ in range(LOGIN_RETRIES):
             creds = RemoteCredentials(self._cache)
             input_user, input_password = creds.auth(remote.name)
@@ -82,7 +91,7 @@ class ConanApiAuthManager(object):
                     out.error('Wrong password for user "%s"' % user)
                     out.info('You can change username with "conan remote login <remote> <username>"')
             else:
-                return self.call_rest_api_method(remote, method_name, *args, **kwargs)
+                return
 
         raise AuthenticationException("Too many failed login attempts, bye!")
 
@@ -42,6 +42,10 @@ class ClientV2Router:
             query = "?%s" % urlencode(params)
         return self.base_url + "%s%s" % (self.routes.common_search, query)
 
+    def recipe_versions(self, name):
+        """URL to list all the references of a recipe name"""
+        return self.base_url + self.routes.recipe_versions.format(name=name)
+
     def search_packages(self, ref):
         """URL search packages for a recipe"""
         route = self.routes.common_search_packages_revision \
@@ -100,6 +104,10 @@ class ClientV2Router:
         assert pref.ref.revision is not None, "Cannot get the latest package without RREV"
         return self.base_url + _format_pref(self.routes.package_revision_latest, pref)
 
+    def packages_latest(self):
+        """URL to get the latest revisions of many packages"""
+        return self.base_url + self.routes.common_packages_latest
+
     def recipe_latest(self, ref):
         """Get the latest of a recipe"""
         assert ref.revision is None, "for_recipe_latest shouldn't receive RREV"
@@ -7,8 +7,9 @@ import platform
 import requests
 import urllib3
 from jinja2 import Template
-from requests.adapters import HTTPAdapter
+from requests.adapters import HTTPAdapter, DEFAULT_POOLSIZE
 
+from conan.api.output import ConanOutput
 from conans import __version__ as client_version
 from conans.errors import ConanException
 
@@ -22,6 +23,8 @@ logging.captureWarnings(True)
 
 DEFAULT_TIMEOUT = (30, 60)  # connect, read timeouts
 INFINITE_TIMEOUT = -1
+# Files of a package downloaded concurrently by RestV2Methods._download_and_save_files()
+PARALLEL_FILES_PER_DOWNLOAD = 3
 
 
 class URLCredentials:
@@ -73,17 +76,12 @@ class URLCredentials:
 class ConanRequester(object):
 
     def __init__(self, config, cache_folder=None):
-        # TODO: Make all this lazy, to avoid fully configuring Requester, for every api call
-        #  even if it doesn't use it
-        # FIXME: Trick for testing when requests is mocked
-        if hasattr(requests, "Session"):
-            self._http_requester = requests.Session()
-            adapter = HTTPAdapter(max_retries=self._get_retries(config))
-            self._http_requester.mount("http://", adapter)
-            self._http_requester.mount("https://", adapter)
-        else:
-            self._http_requester = requests
-
+        # The http session is created lazily, it keeps the connections alive for the next calls
+        # of the same ConanAPI, until it is closed
+        self._session = None
+        self._session_pid = None
+        self._stats_reported = {}  # {host_url: (opened, requests)} already in the output
+        self._config = config
         self._url_creds = URLCredentials(cache_folder)
         self._timeout = config.get("core.net.http:timeout", default=DEFAULT_TIMEOUT)
         self._no_proxy_match = config.get("core.net.http:no_proxy_match", check_type=list)
@@ -93,9 +91,86 @@ class ConanRequester(object):
         self._clean_system_proxy = config.get("core.net.http:clean_system_proxy", default=False,
                                               check_type=bool)
 
+        self._max_retries = config.get("core.net.http:max_retries", default=2, check_type=int)
+        self._pool_size = self._get_pool_size(config)
+
+    @property
+    def _http_requester(self):
+        # FIXME: Trick for testing when requests is mocked, it can be mocked only for some calls
+        if not hasattr(requests, "Session"):
+            return requests
+        # A forked process (parallel builds) never reuses the connections of its parent
+        if self._session is None or self._session_pid != os.getpid():
+            self._session_pid = os.getpid()
+            self._session = self._new_session()
+            self._stats_reported = {}
+        return self._session
+
+    def _new_session(self):
+        session = requests.Session()
+        # urllib3 keeps a pool per host, each one with up to pool_size connections
+        adapter = HTTPAdapter(pool_maxsize=self._pool_size,
+                              max_retries=self._get_retries(self._max_retries))
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def close(self):
+        """ closes the kept-alive connections, a new session is created if it is used again
+        """
+        if self._session is not None and self._session_pid == os.getpid():
+            self._session.close()
+        self._session = None
+
+    @staticmethod
+    def _get_pool_size(config):
+        """ the connections kept alive per host must be enough for all the concurrent transfers,
+        otherwise the extra connections are discarded and opened again for every request
+        """
+        download = config.get("core.download:parallel", default=1, check_type=int)
+        files = PARALLEL_FILES_PER_DOWNLOAD
+        if config.get("core.download:chunked_threshold", check_type=int) is not None:
+            # The package archive is downloaded in several concurrent ranges
+            files += config.get("core.download:chunked_parallel", default=4, check_type=int) - 1
+        upload = config.get("core.upload:parallel", default=1, check_type=int)
+        fetch = config.get("core.graph:parallel_fetch", default=1, check_type=int)
+        return max(DEFAULT_POOLSIZE, download * files, upload, fetch)
+
+    def _requests_stats(self):
+        # {host_url: (opened, requests)} since the session was created
+        result = {}
+        if self._session is None or self._session_pid != os.getpid():
+            return result
+        adapters = {id(a): a for a in self._session.adapters.values()}.values()
+        for adapter in adapters:
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools[key]
+                url = f"{pool.scheme}://{pool.host}:{pool.port}"
+                prev_opened, prev_requests = result.get(url, (0, 0))
+                result[url] = prev_opened + pool.num_connections, prev_requests + pool.num_requests
+        return result
+
+    def connections_stats(self):
+        """ returns {host_url: (opened, reused)} connections of the http session, since the last
+        output_connections_stats(), so every command reports only its own connections
+        """
+        result = {}
+        for url, (opened, requests_count) in self._requests_stats().items():
+            prev_opened, prev_requests = self._stats_reported.get(url, (0, 0))
+            opened, requests_count = opened - prev_opened, requests_count - prev_requests
+            if requests_count:
+                result[url] = opened, requests_count - opened
+        return result
+
+    def output_connections_stats(self):
+        output = ConanOutput()
+        for url, (opened, reused) in sorted(self.connections_stats().items()):
+            output.debug(f"HTTP connections to {url}: {opened} opened, {reused} reused")
+        self._stats_reported = self._requests_stats()
+
     @staticmethod
-    def _get_retries(config):
-        retry = config.get("core.net.http:max_retries", default=2, check_type=int)
+    def _get_retries(retry):
         if retry == 0:
             return 0
         retry_status_code_set = {
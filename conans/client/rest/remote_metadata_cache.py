@@ -0,0 +1,68 @@
+import json
+import os
+import time
+import uuid
+
+from conans.util.files import load, mkdir, rmdir, save
+from conans.util.sha import sha1
+
+
+class RemoteMetadataCache:
+    """ Persistent cache of the json responses of the remotes for the revisions listings and search
+    queries. A response is reused without querying the remote during ``ttl`` seconds, after them it
+    is revalidated with a conditional request (If-None-Match) using the ETag of the response.
+    The responses depend on the permissions of the user, so they are also keyed by the auth token
+
+    <folder>/<sha1(remote_url)>/<sha1(token + url)>.json
+    """
+
+    def __init__(self, folder, ttl):
+        self._folder = folder
+        self._ttl = ttl
+
+    def _remote_folder(self, remote_url):
+        return os.path.join(self._folder, sha1(remote_url.encode()))
+
+    def _path(self, remote_url, url, token):
+        key = "{}\n{}".format(token or "", url)
+        return os.path.join(self._remote_folder(remote_url), sha1(key.encode()) + ".json")
+
+    def get(self, remote_url, url, token):
+        """ returns (result, etag), the result is None if it has to be checked with the remote
+        """
+        try:
+            entry = json.loads(load(self._path(remote_url, url, token)))
+        except Exception:  # Not existing or broken by a concurrent write, just query again
+            return None, None
+        if entry["url"] != url:
+            return None, None
+        if time.time() - entry["time"] < self._ttl:
+            return entry["result"], entry["etag"]
+        return None, entry["etag"]
+
+    def revalidated(self, remote_url, url, token):
+        """ the remote answered 304 Not modified, the stored result is fresh again
+        """
+        path = self._path(remote_url, url, token)
+        try:
+            entry = json.loads(load(path))
+        except Exception:
+            return None
+        self._save(path, entry["url"], entry["etag"], entry["result"])
+        return entry["result"]
+
+    def store(self, remote_url, url, token, etag, result):
+        self._save(self._path(remote_url, url, token), url, etag, result)
+
+    @staticmethod
+    def _save(path, url, etag, result):
+        mkdir(os.path.dirname(path))
+        tmp_path = "{}.{}".format(path, uuid.uuid4().hex)
+        save(tmp_path, json.dumps({"url": url, "etag": etag, "time": time.time(),
+                                   "result": result}))
+        os.replace(tmp_path, path)  # Atomic, concurrent processes can read it
+
+    def invalidate(self, remote_url):
+        """ The revisions in the remote changed (upload, remove), all its responses are outdated
+        """
+        rmdir(self._remote_folder(remote_url))
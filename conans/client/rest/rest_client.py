@@ -1,19 +1,22 @@
-from conans import CHECKSUM_DEPLOY, REVISIONS, OAUTH_TOKEN
+from conans import CHECKSUM_DEPLOY, REVISIONS, OAUTH_TOKEN, BULK_PACKAGES_LATEST, RECIPE_VERSIONS, \
+    ZSTD_ARCHIVES
 from conans.client.rest.rest_client_v2 import RestV2Methods
-from conans.errors import AuthenticationException, ConanException
+from conans.errors import AuthenticationException, ConanException, NotFoundException, \
+    ForbiddenException
 
 
 class RestApiClientFactory(object):
 
-    def __init__(self, requester, config):
+    def __init__(self, requester, config, metadata_cache=None):
         self._requester = requester
         self._config = config
+        self._metadata_cache = metadata_cache
         self._cached_capabilities = {}
 
     def new(self, remote, token, refresh_token, custom_headers):
         tmp = RestApiClient(remote, token, refresh_token, custom_headers,
                             self._requester, self._config,
-                            self._cached_capabilities)
+                            self._cached_capabilities, self._metadata_cache)
         return tmp
 
 
@@ -23,7 +26,7 @@ class RestApiClient(object):
     """
 
     def __init__(self, remote, token, refresh_token, custom_headers, requester,
-                 config, cached_capabilities):
+                 config, cached_capabilities, metadata_cache=None):
 
         # Set to instance
         self._token = token
@@ -37,6 +40,7 @@ class RestApiClient(object):
 
         # This dict is shared for all the instances of RestApiClient
         self._cached_capabilities = cached_capabilities
+        self._metadata_cache = metadata_cache
 
     def _capable(self, capability, user=None, password=None):
         capabilities = self._cached_capabilities.get(self._remote_url)
@@ -57,7 +61,7 @@ class RestApiClient(object):
         checksum_deploy = self._capable(CHECKSUM_DEPLOY)
         return RestV2Methods(self._remote_url, self._token, self._custom_headers,
                              self._requester, self._config, self._verify_ssl,
-                             checksum_deploy)
+                             checksum_deploy, self._metadata_cache)
 
     def get_recipe(self, ref, dest_folder, metadata, only_metadata):
         return self._get_api().get_recipe(ref, dest_folder, metadata, only_metadata)
@@ -65,8 +69,9 @@ class RestApiClient(object):
     def get_recipe_sources(self, ref, dest_folder):
         return self._get_api().get_recipe_sources(ref, dest_folder)
 
-    def get_package(self, pref, dest_folder, metadata, only_metadata):
-        return self._get_api().get_package(pref, dest_folder, metadata, only_metadata)
+    def get_package(self, pref, dest_folder, metadata, only_metadata, extraction=None):
+        return self._get_api().get_package(pref, dest_folder, metadata, only_metadata,
+                                           extraction=extraction)
 
     def upload_recipe(self, ref, files_to_upload):
         return self._get_api().upload_recipe(ref, files_to_upload)
@@ -105,6 +110,13 @@ class RestApiClient(object):
     def search_packages(self, reference):
         return self._get_api().search_packages(reference)
 
+    def get_recipe_versions(self, name):
+        api = self._get_api()
+        if self._capable(RECIPE_VERSIONS):
+            return api.get_recipe_versions(name)
+        # Fallback for servers not implementing it, searching all the recipes
+        return [r for r in api.search(f"{name}/*") if r.name == name]
+
     def remove_recipe(self, ref):
         return self._get_api().remove_recipe(ref)
 
@@ -117,6 +129,9 @@ class RestApiClient(object):
     def server_capabilities(self):
         return self._get_api().server_capabilities()
 
+    def accepts_zstd(self):
+        return self._capable(ZSTD_ARCHIVES)
+
     def get_recipe_revisions_references(self, ref):
         return self._get_api().get_recipe_revisions_references(ref)
 
@@ -129,6 +144,23 @@ class RestApiClient(object):
     def get_latest_package_reference(self, pref, headers):
         return self._get_api().get_latest_package_reference(pref, headers=headers)
 
+    def get_latest_packages_references(self, prefs):
+        """ prefs is {pref: headers}, the headers are only sent in the per-package requests
+        """
+        api = self._get_api()
+        if self._capable(BULK_PACKAGES_LATEST):
+            return api.get_latest_packages_references(list(prefs))
+        # Fallback for servers not implementing the bulk request
+        result = {}
+        for pref, headers in prefs.items():
+            try:
+                result[pref] = api.get_latest_package_reference(pref, headers=headers)
+            except NotFoundException:
+                result[pref] = None
+            except (ForbiddenException, AuthenticationException):
+                pass  # As the bulk request, an error of one package doesn't fail the others
+        return result
+
     def get_recipe_revision_reference(self, ref):
         return self._get_api().get_recipe_revision_reference(ref)
 
@@ -38,13 +38,15 @@ def get_exception_from_error(error_code):
 
 class RestCommonMethods(object):
 
-    def __init__(self, remote_url, token, custom_headers, requester, config, verify_ssl):
+    def __init__(self, remote_url, token, custom_headers, requester, config, verify_ssl,
+                 metadata_cache=None):
         self.token = token
         self.remote_url = remote_url
         self.custom_headers = custom_headers
         self.requester = requester
         self._config = config
         self.verify_ssl = verify_ssl
+        self._metadata_cache = metadata_cache
 
     @property
     def auth(self):
@@ -150,9 +152,19 @@ class RestCommonMethods(object):
 
         return [cap.strip() for cap in server_capabilities.split(",") if cap]
 
-    def get_json(self, url, data=None, headers=None):
+    def get_json(self, url, data=None, headers=None, cached=False):
+        """ cached=True for the revisions listings and search results, that can be served by the
+        remote metadata cache if it is enabled
+        """
         req_headers = self.custom_headers.copy()
         req_headers.update(headers or {})
+        metadata_cache = self._metadata_cache if cached and not data else None
+        if metadata_cache is not None:
+            result, etag = metadata_cache.get(self.remote_url, url, self.token)
+            if result is not None:
+                return result
+            if etag:
+                req_headers["If-None-Match"] = etag
         if data:  # POST request
             req_headers.update({'Content-type': 'application/json',
                                 'Accept': 'application/json'})
@@ -167,6 +179,13 @@ class RestCommonMethods(object):
                                           verify=self.verify_ssl,
                                           stream=True)
 
+        if response.status_code == 304 and metadata_cache is not None:  # Not modified
+            result = metadata_cache.revalidated(self.remote_url, url, self.token)
+            if result is not None:
+                return result
+            # The cached entry was removed meanwhile, query it again
+            return self.get_json(url, headers=headers)
+
         if response.status_code != 200:  # Error message is text
             response.charset = "utf-8"  # To be able to access ret.text (ret.content are bytes)
             raise get_exception_from_error(response.status_code)(response_to_str(response))
@@ -183,21 +202,30 @@ class RestCommonMethods(object):
             raise ConanException("Remote responded with broken json: %s" % content)
         if not isinstance(result, dict):
             raise ConanException("Unexpected server response %s" % result)
+        if metadata_cache is not None:
+            metadata_cache.store(self.remote_url, url, self.token, response.headers.get("ETag"),
+                                 result)
         return result
 
+    def _invalidate_metadata_cache(self):
+        if self._metadata_cache is not None:
+            self._metadata_cache.invalidate(self.remote_url)
+
     def upload_recipe(self, ref, files_to_upload):
         if files_to_upload:
             self._upload_recipe(ref, files_to_upload)
+            self._invalidate_metadata_cache()
 
     def upload_package(self, pref, files_to_upload):
         self._upload_package(pref, files_to_upload)
+        self._invalidate_metadata_cache()
 
     def search(self, pattern=None, ignorecase=True):
         """
         the_files: dict with relative_path: content
         """
         url = self.router.search(pattern, ignorecase)
-        response = self.get_json(url)["results"]
+        response = self.get_json(url, cached=True)["results"]
         # We need to filter the "_/_" user and channel from Artifactory
         ret = []
         for reference in response:
@@ -217,5 +245,5 @@ class RestCommonMethods(object):
     def search_packages(self, ref):
         """Client is filtering by the query"""
         url = self.router.search_packages(ref)
-        package_infos = self.get_json(url)
+        package_infos = self.get_json(url, cached=True)
         return package_infos
@@ -11,18 +11,21 @@ from conans.client.rest.rest_client_common import RestCommonMethods, get_excepti
 from conans.errors import ConanException, NotFoundException, PackageNotFoundException, \
     RecipeNotFoundException, AuthenticationException, ForbiddenException
 from conans.model.package_ref import PkgReference
-from conans.paths import EXPORT_SOURCES_TGZ_NAME
+from conans.model.recipe_ref import RecipeReference
+from conans.paths import EXPORT_SOURCES_TGZ_NAME, PACKAGE_TGZ_NAME, EXPORT_TGZ_NAME, \
+    EXPORT_TZST_NAME, PACKAGE_TZST_NAME
 from conans.util.dates import from_iso8601_to_timestamp
+from conans.util.files import zstd_available
 from conans.util.thread import ExceptionThread
 
 
 class RestV2Methods(RestCommonMethods):
 
     def __init__(self, remote_url, token, custom_headers, requester, config, verify_ssl,
-                 checksum_deploy=False):
+                 checksum_deploy=False, metadata_cache=None):
 
         super(RestV2Methods, self).__init__(remote_url, token, custom_headers, requester,
-                                            config, verify_ssl)
+                                            config, verify_ssl, metadata_cache)
         self._checksum_deploy = checksum_deploy
 
     @property
@@ -43,9 +46,10 @@ class RestV2Methods(RestCommonMethods):
         result = {}
 
         if not only_metadata:
-            accepted_files = ["conanfile.py", "conan_export.tgz", "conanmanifest.txt",
-                              "metadata/sign"]
+            accepted_files = ["conanfile.py", "conan_export.tgz", "conan_export.tzst",
+                              "conanmanifest.txt", "metadata/sign"]
             files = [f for f in server_files if any(f.startswith(m) for m in accepted_files)]
+            files = _select_archive(files, EXPORT_TGZ_NAME, EXPORT_TZST_NAME)
             # If we didn't indicated reference, server got the latest, use absolute now, it's safer
             urls = {fn: self.router.recipe_file(ref, fn) for fn in files}
             self._download_and_save_files(urls, dest_folder, files, parallel=True)
@@ -74,19 +78,23 @@ class RestV2Methods(RestCommonMethods):
         ret = {fn: os.path.join(dest_folder, fn) for fn in files}
         return ret
 
-    def get_package(self, pref, dest_folder, metadata, only_metadata):
+    def get_package(self, pref, dest_folder, metadata, only_metadata, extraction=None):
         url = self.router.package_snapshot(pref)
         data = self._get_file_list_json(url)
         server_files = data["files"]
         result = {}
         # Download only known files, but not metadata (except sign)
         if not only_metadata:  # Retrieve package first, then metadata
-            accepted_files = ["conaninfo.txt", "conan_package.tgz", "conanmanifest.txt",
-                              "metadata/sign"]
+            accepted_files = ["conaninfo.txt", "conan_package.tgz", "conan_package.tzst",
+                              "conanmanifest.txt", "metadata/sign"]
             files = [f for f in server_files if any(f.startswith(m) for m in accepted_files)]
+            files = _select_archive(files, PACKAGE_TGZ_NAME, PACKAGE_TZST_NAME)
             # If we didn't indicated reference, server got the latest, use absolute now, it's safer
             urls = {fn: self.router.package_file(pref, fn) for fn in files}
-            self._download_and_save_files(urls, dest_folder, files, scope=str(pref.ref))
+            extractions = {PACKAGE_TGZ_NAME: extraction,
+                           PACKAGE_TZST_NAME: extraction} if extraction else None
+            self._download_and_save_files(urls, dest_folder, files, scope=str(pref.ref),
+                                          extractions=extractions)
             result.update({fn: os.path.join(dest_folder, fn) for fn in files})
 
         if metadata:
@@ -155,7 +163,11 @@ class RestV2Methods(RestCommonMethods):
                                  % ", ".join(failed))
 
     def _download_and_save_files(self, urls, dest_folder, files, parallel=False, scope=None,
-                                 metadata=False):
+                                 metadata=False, extractions=None):
+        """
+        :param extractions: optional {filename: StreamExtraction} of the files to be extracted
+            while they are downloaded
+        """
         # Take advantage of filenames ordering, so that conan_package.tgz and conan_export.tgz
         # can be < conanfile, conaninfo, and sent always the last, so smaller files go first
         retry = self._config.get("core.download:retry", check_type=int, default=2)
@@ -167,17 +179,18 @@ class RestV2Methods(RestCommonMethods):
             resource_url = urls[filename]
             abs_path = os.path.join(dest_folder, filename)
             os.makedirs(os.path.dirname(abs_path), exist_ok=True)  # filename in subfolder must exist
+            extraction = (extractions or {}).get(filename)
             if parallel:
                 kwargs = {"url": resource_url, "file_path": abs_path, "retry": retry,
                           "retry_wait": retry_wait, "verify_ssl": self.verify_ssl,
-                          "auth": self.auth, "metadata": metadata}
+                          "auth": self.auth, "metadata": metadata, "extraction": extraction}
                 thread = ExceptionThread(target=downloader.download, kwargs=kwargs)
                 threads.append(thread)
                 thread.start()
             else:
                 downloader.download(url=resource_url, file_path=abs_path, auth=self.auth,
                                     verify_ssl=self.verify_ssl, retry=retry, retry_wait=retry_wait,
-                                    metadata=metadata)
+                                    metadata=metadata, extraction=extraction)
         for t in threads:
             t.join()
         for t in threads:  # Need to join all before raising errors
@@ -186,6 +199,7 @@ class RestV2Methods(RestCommonMethods):
     def remove_all_packages(self, ref):
         """ Remove all packages from the specified reference"""
         self.check_credentials()
+        self._invalidate_metadata_cache()
         assert ref.revision is not None, "remove_packages needs RREV"
 
         url = self.router.remove_all_packages(ref)
@@ -206,6 +220,7 @@ class RestV2Methods(RestCommonMethods):
 
     def remove_packages(self, prefs):
         self.check_credentials()
+        self._invalidate_metadata_cache()
         for pref in prefs:
             if not pref.revision:
                 prevs = self.get_package_revisions_references(pref)
@@ -225,6 +240,7 @@ class RestV2Methods(RestCommonMethods):
     def remove_recipe(self, ref):
         """ Remove a recipe and packages """
         self.check_credentials()
+        self._invalidate_metadata_cache()
         if ref.revision is None:
             # Remove all the RREVs
             refs = self.get_recipe_revisions_references(ref)
@@ -272,7 +288,7 @@ class RestV2Methods(RestCommonMethods):
 
     def get_recipe_revisions_references(self, ref):
         url = self.router.recipe_revisions(ref)
-        tmp = self.get_json(url)["revisions"]
+        tmp = self.get_json(url, cached=True)["revisions"]
         remote_refs = []
         for item in tmp:
             _tmp = copy.copy(ref)
@@ -284,9 +300,16 @@ class RestV2Methods(RestCommonMethods):
             assert "This shoudln't be happening, get_recipe_revisions_references"
         return remote_refs
 
+    def get_recipe_versions(self, name):
+        """ all the references (without revision) of a recipe name
+        """
+        url = self.router.recipe_versions(name)
+        results = self.get_json(url, cached=True)["results"]
+        return [RecipeReference.loads(r) for r in results]
+
     def get_latest_recipe_reference(self, ref):
         url = self.router.recipe_latest(ref)
-        data = self.get_json(url)
+        data = self.get_json(url, cached=True)
         remote_ref = copy.copy(ref)
         remote_ref.revision = data.get("revision")
         remote_ref.timestamp = from_iso8601_to_timestamp(data.get("time"))
@@ -294,7 +317,7 @@ class RestV2Methods(RestCommonMethods):
 
     def get_package_revisions_references(self, pref, headers=None):
         url = self.router.package_revisions(pref)
-        tmp = self.get_json(url, headers=headers)["revisions"]
+        tmp = self.get_json(url, headers=headers, cached=True)["revisions"]
         remote_prefs = [PkgReference(pref.ref, pref.package_id, item.get("revision"),
                         from_iso8601_to_timestamp(item.get("time"))) for item in tmp]
 
@@ -307,8 +330,43 @@ class RestV2Methods(RestCommonMethods):
 
     def get_latest_package_reference(self, pref: PkgReference, headers):
         url = self.router.package_latest(pref)
-        data = self.get_json(url, headers=headers)
+        data = self.get_json(url, headers=headers, cached=True)
         remote_pref = copy.copy(pref)
         remote_pref.revision = data.get("revision")
         remote_pref.timestamp = from_iso8601_to_timestamp(data.get("time"))
         return remote_pref
+
+    def get_latest_packages_references(self, prefs):
+        """ returns {pref: latest_pref}, latest_pref is None if the package doesn't exist. The
+        packages that the server didn't answer (not allowed to read them) are not in the result
+        """
+        url = self.router.packages_latest()
+        data = self.get_json(url, data={"packages": [p.repr_notime() for p in prefs]})
+        data = data["packages"]
+        result = {}
+        for pref in prefs:
+            try:
+                item = data[pref.repr_notime()]
+            except KeyError:
+                continue
+            if item is not None:
+                item = PkgReference(pref.ref, pref.package_id, item.get("revision"),
+                                    from_iso8601_to_timestamp(item.get("time")))
+            result[pref] = item
+        return result
+
+
+def _select_archive(files, tgz_name, tzst_name):
+    """ The server can store the .tgz, the .tzst or both compressed archives of a revision, only
+    one of them is downloaded. The zstd one is preferred, as it is much faster to decompress, but
+    it requires the optional 'zstandard' Python package
+    """
+    if tzst_name not in files:
+        return files
+    if zstd_available():
+        return [f for f in files if f != tgz_name]
+    if tgz_name in files:
+        return [f for f in files if f != tzst_name]
+    raise ConanException(f"The server only has the '{tzst_name}' zstd compressed file, "
+                         "install the 'zstandard' Python package to decompress it: "
+                         "'pip install zstandard'")
@@ -122,49 +122,65 @@ class ConanFile:
         self.cpp = Infos()
         self.layouts = Layouts()
 
-    def serialize(self):
+    def serialize(self, fields=None):
+        """ fields: if defined, only these fields are computed
+        """
+        def wanted(field):
+            return fields is None or field in fields
+
         result = {}
 
         for a in ("name", "user", "channel", "url", "license",
                   "author", "description", "homepage", "build_policy", "upload_policy",
                   "revision_mode", "provides", "deprecated", "win_bash", "win_bash_run",
                   "default_options", "options_description"):
-            v = getattr(self, a, None)
-            result[a] = v
+            if wanted(a):
+                v = getattr(self, a, None)
+                result[a] = v
 
-        result["version"] = str(self.version) if self.version is not None else None
-        result["topics"] = list(self.topics) if self.topics is not None else None
-        result["package_type"] = str(self.package_type)
+        if wanted("version"):
+            result["version"] = str(self.version) if self.version is not None else None
+        if wanted("topics"):
+            result["topics"] = list(self.topics) if self.topics is not None else None
+        if wanted("package_type"):
+            result["package_type"] = str(self.package_type)
 
         settings = self.settings
-        if settings is not None:
+        if settings is not None and wanted("settings"):
             result["settings"] = settings.serialize() if isinstance(settings, Settings) else list(settings)
 
-        result["options"] = self.options.serialize()
-        result["options_definitions"] = self.options.possible_values
+        if wanted("options"):
+            result["options"] = self.options.serialize()
+        if wanted("options_definitions"):
+            result["options_definitions"] = self.options.possible_values
 
-        if self.generators is not None:
+        if self.generators is not None and wanted("generators"):
             result["generators"] = list(self.generators)
-        if self.license is not None:
+        if self.license is not None and wanted("license"):
             result["license"] = list(self.license) if not isinstance(self.license, str) else self.license
 
-        result["requires"] = self.requires.serialize()
-
-        if hasattr(self, "python_requires"):
-            result["python_requires"] = self.python_requires.serialize()
-        else:
-            result["python_requires"] = None
-        result["system_requires"] = self.system_requires
-
-        result["recipe_folder"] = self.recipe_folder
-        result["source_folder"] = self.source_folder
-        result["build_folder"] = self.build_folder
-        result["generators_folder"] = self.generators_folder
-        result["package_folder"] = self.package_folder
-
-        result["cpp_info"] = self.cpp_info.serialize()
-        result["conf_info"] = self.conf_info.serialize()
-        result["label"] = self.display_name
+        if wanted("requires"):
+            result["requires"] = self.requires.serialize()
+
+        if wanted("python_requires"):
+            if hasattr(self, "python_requires"):
+                result["python_requires"] = self.python_requires.serialize()
+            else:
+                result["python_requires"] = None
+        if wanted("system_requires"):
+            result["system_requires"] = self.system_requires
+
+        for a in ("recipe_folder", "source_folder", "build_folder", "generators_folder",
+                  "package_folder"):
+            if wanted(a):
+                result[a] = getattr(self, a)
+
+        if wanted("cpp_info"):
+            result["cpp_info"] = self.cpp_info.serialize()
+        if wanted("conf_info"):
+            result["conf_info"] = self.conf_info.serialize()
+        if wanted("label"):
+            result["label"] = self.display_name
         return result
 
     @property
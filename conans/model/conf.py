@@ -19,11 +19,20 @@ BUILT_IN_CONFS = {
     "core.version_ranges:resolve_prereleases": "Whether version ranges can resolve to pre-releases or not",
     "core.upload:retry": "Number of retries in case of failure when uploading to Conan server",
     "core.upload:retry_wait": "Seconds to wait between upload attempts to Conan server",
+    "core.upload:parallel": "Number of concurrent threads to check and upload recipes and packages",
+    "core.upload:compression_format": "Format to compress uploaded artifacts: 'gzip' (default) or 'zstd'. The gzip one is used for the remotes that don't declare the zstd capability, older Conan clients can't download the zstd files",
     "core.download:parallel": "Number of concurrent threads to download packages",
     "core.download:retry": "Number of retries in case of failure when downloading from Conan server",
     "core.download:retry_wait": "Seconds to wait between download attempts from Conan server",
     "core.download:download_cache": "Define path to a file download cache",
+    "core.download:chunked_threshold": "Size in bytes from which the package files are downloaded in concurrent byte ranges. If not defined, they are downloaded in a single stream",
+    "core.download:tar_data_filter": "Reject the members of the downloaded archives outside the destination folder, device files, etc. (Python tarfile 'data' filter). Disabled by default, it can reject packages that were uploaded before",
+    "core.download:check_manifest": "Check that the md5 of the files of the downloaded packages, computed while extracting them, match the package conanmanifest.txt ones. Disabled by default, it can reject packages that were uploaded before",
+    "core.download:chunked_parallel": "Number of concurrent byte ranges of the chunked downloads (default 4)",
+    "core.build:parallel_jobs": "Number of packages to build from source concurrently in separate forked processes (not in Windows or macOS, nor while other threads are running in the process, like in multithreaded applications using Conan as a library). Only the JSON serializable attributes set in build() are available in package_info()",
+    "core.graph:parallel_fetch": "Number of concurrent threads to retrieve recipes and check binaries in remotes while computing the graph",
     "core.cache:storage_path": "Absolute path where the packages and database are stored",
+    "core.cache:db_wal": "Use the sqlite write-ahead log (WAL) journal for the cache database, faster with concurrent processes. Not supported in network filesystems (NFS, SMB)",
     # Sources backup
     "core.sources:download_cache": "Folder to store the sources backup",
     "core.sources:download_urls": "List of URLs to download backup sources from",
@@ -43,8 +52,10 @@ BUILT_IN_CONFS = {
     "core.net.http:cacert_path": "Path containing a custom Cacert file",
     "core.net.http:client_cert": "Path or tuple of files containing a client cert (and key)",
     "core.net.http:clean_system_proxy": "If defined, the proxies system env-vars will be discarded",
+    "core.net.http:metadata_cache_ttl": "Seconds that the revisions and search results of the remotes are reused from the cache without revalidating them with the remote. If not defined, they are not cached",
     # Gzip compression
     "core.gzip:compresslevel": "The Gzip compression level for Conan artifacts (default=9)",
+    "core.gzip:parallel": "Number of concurrent threads to compress Conan artifacts for upload",
     # Tools
     "tools.android:ndk_path": "Argument for the CMAKE_ANDROID_NDK",
     "tools.android:cmake_legacy_toolchain": "Define to explicitly pass ANDROID_USE_LEGACY_TOOLCHAIN_FILE in CMake toolchain",
@@ -68,6 +79,9 @@ BUILT_IN_CONFS = {
     "tools.cmake:cmake_program": "Path to CMake executable",
     "tools.cmake:install_strip": "Add --strip to cmake.install()",
     "tools.deployer:symlinks": "Set to False to disable deployers copying symlinks",
+    "tools.deployer:mode": "Deploy the packages files as 'hardlink' or 'reflink' (copy-on-write clone) when possible, or 'symlink' the whole package folder, instead of copying them. The hardlinks and symlinks share the files with the Conan cache, modifying them modifies the cache",
+    "tools.files.copy:parallel": "Number of concurrent threads to copy the files of copy() (default 1)",
+    "tools.files.copy:link": "Copy the files of copy() as 'hardlink' or 'reflink' (copy-on-write clone) when possible. Only the files copied from the build folder to the package folder are hardlinked, they are shared with the build folder and modifying them modifies both",
     "tools.files.download:retry": "Number of retries in case of failure when downloading",
     "tools.files.download:retry_wait": "Seconds to wait between download attempts",
     "tools.files.download:verify": "If set, overrides recipes on whether to perform SSL verification for their downloaded files. Only recommended to be set while testing",
@@ -1,10 +1,17 @@
+import json
 import os
+import platform
+import time
 from collections import defaultdict
+from multiprocessing.pool import ThreadPool
 
-from conans.paths import CONAN_MANIFEST, EXPORT_SOURCES_TGZ_NAME, EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME
+from conans.paths import CONAN_MANIFEST, EXPORT_SOURCES_TGZ_NAME, EXPORT_TGZ_NAME, \
+    PACKAGE_TGZ_NAME, EXPORT_TZST_NAME, PACKAGE_TZST_NAME
 from conans.util.dates import timestamp_now, timestamp_to_str
 from conans.util.files import load, md5, md5sum, save, gather_files
 
+_HASH_THREADS = min(8, os.cpu_count() or 1)
+
 
 class FileTreeManifest(object):
 
@@ -85,28 +92,45 @@ class FileTreeManifest(object):
                 output.info("%s %d '%s' %s%s" % (suffix, len(files), ext, file_or_files, files_str))
 
     @classmethod
-    def create(cls, folder, exports_sources_folder=None):
+    def create(cls, folder, exports_sources_folder=None, hashes_cache=None):
         """ Walks a folder and create a FileTreeManifest for it, reading file contents
         from disk, and capturing current time
+        :param hashes_cache: optional path of a ManifestHashesCache file, to not hash again the
+            files that didn't change since the last time. Not used in Windows
         """
         files, _ = gather_files(folder)
         # The folders symlinks are discarded for the manifest
-        for f in (PACKAGE_TGZ_NAME, EXPORT_TGZ_NAME, CONAN_MANIFEST, EXPORT_SOURCES_TGZ_NAME):
+        for f in (PACKAGE_TGZ_NAME, EXPORT_TGZ_NAME, CONAN_MANIFEST, EXPORT_SOURCES_TGZ_NAME,
+                  PACKAGE_TZST_NAME, EXPORT_TZST_NAME):
             files.pop(f, None)
 
-        file_dict = {}
-        for name, filepath in files.items():
-            # For a symlink: md5 of the pointing path, no matter if broken, relative or absolute.
-            value = md5(os.readlink(filepath)) if os.path.islink(filepath) else md5sum(filepath)
-            file_dict[name] = value
-
         if exports_sources_folder:
             export_files, _ = gather_files(exports_sources_folder)
             # The folders symlinks are discarded for the manifest
-            for name, filepath in export_files.items():
-                # For a symlink: md5 of the pointing path, no matter if broken, relative or absolute.
-                value = md5(os.readlink(filepath)) if os.path.islink(filepath) else md5sum(filepath)
-                file_dict["export_source/%s" % name] = value
+            files.update({"export_source/%s" % name: filepath
+                          for name, filepath in export_files.items()})
+
+        cache = ManifestHashesCache(hashes_cache) if hashes_cache and \
+            ManifestHashesCache.supported() else None
+        file_dict = {}
+        to_hash = {}
+        stats = {}
+        for name, filepath in files.items():
+            if os.path.islink(filepath):
+                # For a symlink: md5 of the pointing path, no matter if broken, relative or absolute
+                file_dict[name] = md5(os.readlink(filepath))
+                continue
+            value = None
+            if cache:
+                value, stats[name] = cache.get(name, filepath)
+            if value is None:
+                to_hash[name] = filepath
+            else:
+                file_dict[name] = value
+
+        file_dict.update(_md5sums(to_hash))
+        if cache:
+            cache.save(stats, file_dict)
 
         date = timestamp_now()
 
@@ -128,3 +152,77 @@ class FileTreeManifest(object):
             if h != h2:
                 result[f] = h2, h
         return result
+
+
+def _md5sums(files):
+    """ the md5 of the {name: filepath} files, computed in several threads, as hashlib and the
+    file reads release the GIL
+    """
+    if len(files) < 2:
+        return {name: md5sum(filepath) for name, filepath in files.items()}
+    threads = min(len(files), _HASH_THREADS)
+    pool = ThreadPool(threads)
+    try:
+        sums = pool.map(md5sum, files.values())
+    finally:
+        pool.close()
+        pool.join()
+    return dict(zip(files.keys(), sums))
+
+
+class ManifestHashesCache:
+    """ The md5 of the files of a manifest, stored in a json file next to the folder, so the files
+    are not read and hashed again if they didn't change. A file is considered unchanged if its
+    size, inode, modification and status change times are the same. As the ctime can't be set by
+    the users (like the mtime), modifying the contents always invalidates the entry.
+
+    In Windows the st_ctime is the creation time of the file, not the status change time, so
+    rewriting a file in place and restoring its size and mtime would not be detected. The cache
+    is not used there, all the files are hashed.
+    """
+    _racy_time = 2 * 10**9  # ns, files modified right before hashing them are not cached
+
+    def __init__(self, path):
+        self._path = path
+        try:
+            self._entries = json.loads(load(path))
+        except Exception:  # Missing or broken, it is just a cache
+            self._entries = {}
+
+    @staticmethod
+    def supported():
+        return platform.system() != "Windows"
+
+    @staticmethod
+    def _stat(filepath):
+        st = os.stat(filepath)
+        return [st.st_size, st.st_ino, st.st_mtime_ns, st.st_ctime_ns]
+
+    def get(self, name, filepath):
+        """ returns (md5, stat), the md5 is None if the file has to be hashed again. The stat is
+        taken before hashing, so a file modified while it is hashed doesn't look unchanged later
+        """
+        stat = self._stat(filepath)
+        entry = self._entries.get(name)
+        if entry is None or entry[:-1] != stat:
+            return None, stat
+        return entry[-1], stat
+
+    def save(self, stats, file_sums):
+        # Only the current files, the entries of the removed ones are discarded
+        limit = time.time_ns() - self._racy_time
+        entries = {}
+        for name, stat in stats.items():
+            # A file modified in the same clock tick, after hashing it, would look unchanged
+            if max(stat[2], stat[3]) < limit:
+                entries[name] = stat + [file_sums[name]]
+        if entries == self._entries:
+            return
+        # Atomic, other concurrent processes might be reading it
+        tmp_path = "%s.%s.tmp" % (self._path, os.getpid())
+        try:
+            save(tmp_path, json.dumps(entries))
+            os.replace(tmp_path, self._path)
+        except OSError:  # Read-only caches, etc. it is just a cache
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
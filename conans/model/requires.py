@@ -9,6 +9,10 @@ from conans.model.version_range import VersionRange
 class Requirement:
     """ A user definition of a requires in a conanfile
     """
+    __slots__ = ("ref", "_headers", "_libs", "_build", "_run", "_visible", "_transitive_headers",
+                 "_transitive_libs", "_test", "_package_id_mode", "_force", "_override", "_direct",
+                 "options", "overriden_ref", "override_ref", "is_test", "skip", "_version_range")
+
     def __init__(self, ref, *, headers=None, libs=None, build=False, run=None, visible=None,
                  transitive_headers=None, transitive_libs=None, test=None, package_id_mode=None,
                  force=None, override=None, direct=None, options=None):
@@ -33,6 +37,7 @@ class Requirement:
         self.override_ref = None  # to store if the requirement has been overriden (store new ref)
         self.is_test = test  # to store that it was a test, even if used as regular requires too
         self.skip = False
+        self._version_range = None  # (expression, VersionRange) not parsed again for each check
 
     @property
     def files(self):  # require needs some files in dependency package
@@ -139,7 +144,7 @@ class Requirement:
         self._package_id_mode = value
 
     def __repr__(self):
-        return repr(self.__dict__)
+        return repr({k: getattr(self, k) for k in self.__slots__ if k != "_version_range"})
 
     def __str__(self):
         traits = 'build={}, headers={}, libs={}, '  \
@@ -169,7 +174,9 @@ class Requirement:
         """
         version = repr(self.ref.version)
         if version.startswith("[") and version.endswith("]"):
-            return VersionRange(version[1:-1])
+            if self._version_range is None or self._version_range[0] != version:
+                self._version_range = version, VersionRange(version[1:-1])
+            return self._version_range[1]
 
     @property
     def alias(self):
@@ -4,10 +4,15 @@ class RestRoutes(object):
     common_authenticate = "users/authenticate"
     oauth_authenticate = "users/token"
     common_check_credentials = "users/check_credentials"
+    common_packages_latest = "conans/packages/latest"
 
     def __init__(self):
         self.base = 'conans'
 
+    @property
+    def recipe_versions(self):
+        return self.base + '/{name}/versions'
+
     @property
     def recipe(self):
         return self.base + '/{name}/{version}/{username}/{channel}'
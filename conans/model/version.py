@@ -1,4 +1,4 @@
-from functools import total_ordering
+from functools import lru_cache, total_ordering
 
 from conans.errors import ConanException
 
@@ -54,28 +54,11 @@ class Version:
     def __init__(self, value, qualifier=False):
         value = str(value)
         self._value = value
-        self._build = None
-        self._pre = None
         self._qualifier = qualifier  # it is a prerelease or build qualifier, not a main version
-
-        if not qualifier:
-            items = value.rsplit("+", 1)  # split for build
-            if len(items) == 2:
-                value, build = items
-                self._build = Version(build, qualifier=True)  # This is a nested version by itself
-
-            # split for pre-release, from the left, semver allows hyphens in identifiers :(
-            items = value.split("-", 1)
-            if len(items) == 2:
-                value, pre = items
-                self._pre = Version(pre, qualifier=True)  # This is a nested version by itself
-
-        items = value.split(".")
-        items = [_VersionItem(item) for item in items]
-        self._items = tuple(items)
-        while items and items[-1].value == 0:
-            del items[-1]
-        self._nonzero_items = tuple(items)
+        # The parsing of the same string is shared, the graphs create the same versions many times
+        self._build, self._pre, self._items, self._nonzero_items, self._key = \
+            _parse_version(value, qualifier)
+        self._hash = hash((self._nonzero_items, self._pre, self._build))
 
     def bump(self, index):
         """
@@ -112,6 +95,14 @@ class Version:
         v += "-"  # Exclude prereleases
         return Version(v)
 
+    @property
+    def ordered(self):
+        """ :meta private:
+        It is compared with a precomputed key. The ordered versions are totally ordered among them,
+        some items mixing digits and letters, like "1a", are not, and they can't be bisected
+        """
+        return self._key is not None
+
     @property
     def pre(self):
         return self._pre
@@ -164,11 +155,13 @@ class Version:
         if not isinstance(other, Version):
             other = Version(other, self._qualifier)
 
+        if self._key is not None and other._key is not None:
+            return self._key == other._key
         return (self._nonzero_items, self._pre, self._build) ==\
                (other._nonzero_items, other._pre, other._build)
 
     def __hash__(self):
-        return hash((self._nonzero_items, self._pre, self._build))
+        return self._hash
 
     def __lt__(self, other):
         if other is None:
@@ -176,6 +169,8 @@ class Version:
         if not isinstance(other, Version):
             other = Version(other)
 
+        if self._key is not None and other._key is not None:
+            return self._key < other._key
         if self._pre:
             if other._pre:  # both are pre-releases
                 return (self._nonzero_items, self._pre, self._build) < \
@@ -193,3 +188,55 @@ class Version:
                     return self._nonzero_items < other._nonzero_items
             else:  # None of them is pre-release
                 return (self._nonzero_items, self._build) < (other._nonzero_items, other._build)
+
+
+def _item_key(item):
+    """ The comparison key of a _VersionItem, ints go before strings, because a string is compared
+    with the str() of an int. It is None for the strings that can be ordered before some ints, like
+    "1a" or "*", those are compared item by item
+    """
+    value = item.value
+    if isinstance(value, int):
+        return 1, value
+    if value == "":
+        return 0, value
+    if value[0] > "9":
+        return 2, value
+    return None
+
+
+@lru_cache(maxsize=8192)
+def _parse_version(value, qualifier):
+    """ returns (build, pre, items, nonzero_items, key) of a version string
+    The key is a plain tuple that orders as Version.__lt__, so comparing 2 versions does not need
+    to compare the _VersionItem and nested pre-release and build versions one by one
+    """
+    build = pre = None
+    if not qualifier:
+        items = value.rsplit("+", 1)  # split for build
+        if len(items) == 2:
+            value, build = items
+            build = Version(build, qualifier=True)  # This is a nested version by itself
+
+        # split for pre-release, from the left, semver allows hyphens in identifiers :(
+        items = value.split("-", 1)
+        if len(items) == 2:
+            value, pre = items
+            pre = Version(pre, qualifier=True)  # This is a nested version by itself
+
+    items = value.split(".")
+    items = [_VersionItem(item) for item in items]
+    main_items = tuple(items)
+    while items and items[-1].value == 0:
+        del items[-1]
+    nonzero_items = tuple(items)
+
+    key = tuple(_item_key(item) for item in nonzero_items)
+    if None in key or (pre is not None and pre._key is None) or \
+            (build is not None and build._key is None):
+        key = None
+    else:
+        # The pre-releases go before the regular version with the same main items
+        key = (key, 0 if pre is not None else 1, pre._key if pre is not None else (),
+               (build._key,) if build is not None else ())
+    return build, pre, main_items, nonzero_items, key
@@ -1,3 +1,5 @@
+import operator
+from bisect import bisect_left, bisect_right
 from collections import namedtuple
 from typing import Optional
 
@@ -6,6 +8,8 @@ from conans.model.recipe_ref import Version
 
 
 _Condition = namedtuple("_Condition", ["operator", "version"])
+_OPERATORS = {">": operator.gt, "<": operator.lt, ">=": operator.ge, "<=": operator.le,
+              "=": operator.eq}
 
 
 class _ConditionSet:
@@ -17,6 +21,14 @@ class _ConditionSet:
         for e in expressions:
             e = e.strip()
             self.conditions.extend(self._parse_expression(e))
+        # Compiled once, the conditions are checked for every candidate version of the range
+        self._checks = [(_OPERATORS[c.operator], c.version) for c in self.conditions]
+        upper_bounds = [(c.version, c.operator != "<") for c in self.conditions
+                        if c.operator in ("<", "<=", "=")]
+        # (version, inclusive) no version above it can be valid, None if not bounded
+        self.upper_bound = None
+        if upper_bounds and all(v.ordered for v, _ in upper_bounds):
+            self.upper_bound = min(upper_bounds)
 
     @staticmethod
     def _parse_expression(expression):
@@ -71,22 +83,9 @@ class _ConditionSet:
                     return False
             elif conf_resolve_prepreleases is False:
                 return False
-        for condition in self.conditions:
-            if condition.operator == ">":
-                if not version > condition.version:
-                    return False
-            elif condition.operator == "<":
-                if not version < condition.version:
-                    return False
-            elif condition.operator == ">=":
-                if not version >= condition.version:
-                    return False
-            elif condition.operator == "<=":
-                if not version <= condition.version:
-                    return False
-            elif condition.operator == "=":
-                if not version == condition.version:
-                    return False
+        for check, condition_version in self._checks:
+            if not check(version, condition_version):
+                return False
         return True
 
 
@@ -115,6 +114,7 @@ class VersionRange:
         self.condition_sets = []
         for alternative in version_expr.split("||"):
             self.condition_sets.append(_ConditionSet(alternative, prereleases))
+        self._contained = {}  # {(version, resolve_prerelease): bool} the same checks repeat a lot
 
     def __str__(self):
         return self._expression
@@ -130,8 +130,30 @@ class VersionRange:
         :return: Whether the version is inside the range
         """
         assert isinstance(version, Version), type(version)
-        for condition_set in self.condition_sets:
-            if condition_set._valid(version, resolve_prerelease):
-                return True
-        return False
+        key = version, resolve_prerelease
+        result = self._contained.get(key)
+        if result is None:
+            result = any(condition_set._valid(version, resolve_prerelease)
+                         for condition_set in self.condition_sets)
+            self._contained[key] = result
+        return result
+
+    def latest_index(self, versions, resolve_prerelease: Optional[bool], ordered=True):
+        """
+        Index of the latest version of <versions> inside the range, or None
+
+        :param versions: list of Version, sorted in ascending order
+        :param resolve_prerelease: as in ``contains()``
+        :param ordered: The versions are totally ordered (``Version.ordered``), so the versions
+        above the upper bound of the range can be skipped with a binary search
+        """
+        end = len(versions)
+        if ordered:
+            bounds = [c.upper_bound for c in self.condition_sets]
+            if None not in bounds:
+                bound, inclusive = max(bounds)
+                end = (bisect_right if inclusive else bisect_left)(versions, bound)
+        for index in range(end - 1, -1, -1):
+            if self.contains(versions[index], resolve_prerelease):
+                return index
 
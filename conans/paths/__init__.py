@@ -60,4 +60,6 @@ CONANINFO = "conaninfo.txt"
 PACKAGE_TGZ_NAME = "conan_package.tgz"
 EXPORT_TGZ_NAME = "conan_export.tgz"
 EXPORT_SOURCES_TGZ_NAME = "conan_sources.tgz"
+PACKAGE_TZST_NAME = "conan_package.tzst"
+EXPORT_TZST_NAME = "conan_export.tzst"
 DATA_YML = "conandata.yml"
@@ -1,5 +1,6 @@
-from conans import REVISIONS
+from conans import REVISIONS, BULK_PACKAGES_LATEST, RECIPE_VERSIONS, ZSTD_ARCHIVES
 
 COMPLEX_SEARCH_CAPABILITY = "complex_search"
 
-SERVER_CAPABILITIES = [COMPLEX_SEARCH_CAPABILITY, REVISIONS]  # Server is always with revisions
+SERVER_CAPABILITIES = [COMPLEX_SEARCH_CAPABILITY, REVISIONS, BULK_PACKAGES_LATEST,
+                       RECIPE_VERSIONS, ZSTD_ARCHIVES]  # Server is always with revisions
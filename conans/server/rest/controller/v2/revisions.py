@@ -1,8 +1,15 @@
+import json
+
+from bottle import request, response, HTTPResponse
+
+from conans.errors import RequestErrorException
+from conans.model.package_ref import PkgReference
 from conans.model.recipe_ref import RecipeReference
 from conans.server.rest.bottle_routes import BottleRoutes
 from conans.server.rest.controller.v2 import get_package_ref
 from conans.server.service.v2.service_v2 import ConanServiceV2
 from conans.util.dates import from_timestamp_to_iso8601
+from conans.util.sha import sha1
 
 
 class RevisionsController(object):
@@ -21,7 +28,7 @@ class RevisionsController(object):
             conan_reference = RecipeReference(name, version, username, channel)
             conan_service = ConanServiceV2(app.authorizer, app.server_store)
             revs = conan_service.get_recipe_revisions_references(conan_reference, auth_user)
-            return _format_revs_return(revs)
+            return _etag_response(_format_revs_return(revs))
 
         @app.route(r.recipe_latest, method="GET")
         def get_latest_recipe_reference(name, version, username, channel, auth_user):
@@ -30,7 +37,7 @@ class RevisionsController(object):
             conan_reference = RecipeReference(name, version, username, channel)
             conan_service = ConanServiceV2(app.authorizer, app.server_store)
             rev = conan_service.get_latest_revision(conan_reference, auth_user)
-            return _format_rev_return(rev)
+            return _etag_response(_format_rev_return(rev))
 
         @app.route(r.package_revisions, method="GET")
         def get_package_revisions_references(name, version, username, channel, package_id, auth_user,
@@ -40,7 +47,7 @@ class RevisionsController(object):
                                                 revision, p_revision=None)
             conan_service = ConanServiceV2(app.authorizer, app.server_store)
             prefs = conan_service.get_package_revisions_references(package_reference, auth_user)
-            return _format_prefs_return(prefs)
+            return _etag_response(_format_prefs_return(prefs))
 
         @app.route(r.package_revision_latest, method="GET")
         def get_latest_package_reference(name, version, username, channel, package_id, auth_user,
@@ -51,7 +58,34 @@ class RevisionsController(object):
                                                 revision, p_revision=None)
             conan_service = ConanServiceV2(app.authorizer, app.server_store)
             pref = conan_service.get_latest_package_reference(package_reference, auth_user)
-            return _format_pref_return(pref)
+            return _etag_response(_format_pref_return(pref))
+
+        @app.route(r.common_packages_latest, method="POST")
+        def get_latest_packages_references(auth_user):
+            """ Gets a JSON with the latest revisions of the packages
+            {"packages": ["pkg/0.1@user/channel#rrev:pkgid", ...]} in the request body, null
+            for the packages that don't exist, and missing the ones the user can't read
+            """
+            try:
+                prefs = [PkgReference.loads(p) for p in request.json["packages"]]
+            except Exception as e:
+                raise RequestErrorException(f"Invalid packages latest request: {e}")
+            conan_service = ConanServiceV2(app.authorizer, app.server_store)
+            prefs = conan_service.get_latest_packages_references(prefs, auth_user)
+            return {"packages": {pref.repr_notime(): _format_pref_return(latest) if latest else None
+                                 for pref, latest in prefs.items()}}
+
+
+def _etag_response(result):
+    """ The revisions listings have an ETag, so clients can revalidate their cached listings
+    with If-None-Match, getting a 304 without content if they didn't change
+    """
+    etag = '"{}"'.format(sha1(json.dumps(result, sort_keys=True).encode()))
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match and etag in [e.strip() for e in if_none_match.split(",")]:
+        raise HTTPResponse(status=304, headers={"ETag": etag})
+    response.set_header("ETag", etag)
+    return result
 
 
 def _format_rev_return(rev):
@@ -24,6 +24,12 @@ class SearchControllerV2(object):
             references = [repr(ref) for ref in search_service.search(pattern, ignore_case)]
             return {"results": references}
 
+        @app.route(r.recipe_versions, method=["GET"])
+        def recipe_versions(name, auth_user):
+            search_service = SearchService(app.authorizer, app.server_store, auth_user)
+            references = [repr(ref) for ref in search_service.search_versions(name)]
+            return {"results": references}
+
         @app.route(r.common_search_packages, method=["GET"])
         @app.route(r.common_search_packages_revision, method=["GET"])
         def search_packages(name, version, username, channel, auth_user, revision=None):
@@ -98,6 +98,24 @@ class SearchService(object):
 
             return sorted(ret)
 
+    def search_versions(self, name):
+        """ All the references of a recipe name, without the expensive search of all the
+        recipes in the server
+        """
+        basedir = os.path.join(self._server_store.store, name)
+        refs = set()
+        for subdir in list_folder_subdirs(basedir=basedir, level=4):  # version/user/channel/rrev
+            version, user, channel = [d if d != "_" else None for d in subdir.split("/")[:3]]
+            refs.add(RecipeReference(name, version, user, channel))
+        result = []
+        for ref in sorted(refs):
+            try:
+                self._authorizer.check_read_conan(self._auth_user, ref)
+                result.append(ref)
+            except ForbiddenException:
+                pass
+        return result
+
     def search(self, pattern=None, ignorecase=True):
         """ Get all the info about any package
             Attributes:
@@ -3,7 +3,8 @@ import os
 
 from bottle import FileUpload, static_file
 
-from conans.errors import RecipeNotFoundException, PackageNotFoundException, NotFoundException
+from conans.errors import RecipeNotFoundException, PackageNotFoundException, NotFoundException, \
+    ForbiddenException, AuthenticationException
 from conans.paths import CONAN_MANIFEST
 from conans.model.package_ref import PkgReference
 from conans.server.service.mime import get_mime_type
@@ -81,6 +82,19 @@ class ConanServiceV2:
             raise PackageNotFoundException(pref)
         return _pref
 
+    def get_latest_packages_references(self, prefs, auth_user):
+        """ returns {pref: latest_pref}, latest_pref is None if the package doesn't exist. The
+        packages that the user can't read are not in the result, so the others still get an answer
+        """
+        result = {}
+        for pref in prefs:
+            try:
+                self._authorizer.check_read_conan(auth_user, pref.ref)
+            except (ForbiddenException, AuthenticationException):
+                continue
+            result[pref] = self._server_store.get_last_package_revision(pref)
+        return result
+
     # PACKAGE METHODS
     def get_package_file_list(self, pref, auth_user):
         self._authorizer.check_read_conan(auth_user, pref.ref)
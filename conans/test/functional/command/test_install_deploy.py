@@ -318,6 +318,77 @@ def test_deploy_overwrite():
     assert "bye" in header
 
 
+@pytest.mark.parametrize("mode", [None, "hardlink", "reflink"])
+def test_deploy_mode_up_to_date(mode):
+    """ the packages already deployed are not deployed again, unless the package changes
+    """
+    c = TestClient()
+    c.save({"conanfile.py": GenConanfile("pkg", "1.0").with_package_file("include/hi.h", "hi")})
+    c.run("create .")
+    install = "install --requires=pkg/1.0 --deployer=full_deploy --output-folder=output"
+    if mode:
+        install += f" -c tools.deployer:mode={mode}"
+    c.run(install)
+    assert "is up to date" not in c.out
+    header = os.path.join(c.current_folder, "output/full_deploy/host/pkg/1.0/include/hi.h")
+    assert c.load(header) == "hi"
+    pkg_folder = c.get_latest_pkg_layout(c.get_latest_package_reference("pkg/1.0")).package()
+    assert os.path.samefile(header, os.path.join(pkg_folder, "include/hi.h")) == \
+           (mode == "hardlink")
+
+    c.run(install)
+    assert "is up to date" in c.out
+    assert c.load(header) == "hi"
+
+    # A file that is not in the package is removed, the deploy is an exact copy of the package
+    extra = os.path.join(c.current_folder, "output/full_deploy/host/pkg/1.0/include/extra.h")
+    save(extra, "extra")
+    c.run(install)
+    assert "is up to date" not in c.out
+    assert not os.path.exists(extra)
+    c.run(install)
+    assert "is up to date" in c.out
+
+    if mode == "hardlink":
+        # A copy can't share the files with the package, it is deployed again
+        c.run("install --requires=pkg/1.0 --deployer=full_deploy --output-folder=output")
+        assert "is up to date" not in c.out
+        assert not os.path.samefile(header, os.path.join(pkg_folder, "include/hi.h"))
+
+    # modify the package
+    c.save({"conanfile.py": GenConanfile("pkg", "1.0").with_package_file("include/hi.h", "bye")})
+    c.run("create .")
+    c.run(install)
+    assert "is up to date" not in c.out
+    assert c.load(header) == "bye"
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="Symlinks need admin privileges")
+def test_deploy_mode_symlink():
+    c = TestClient()
+    c.save({"conanfile.py": GenConanfile("pkg", "1.0").with_package_file("include/hi.h", "hi")})
+    c.run("create .")
+    c.run("install --requires=pkg/1.0 --deployer=direct_deploy --output-folder=output "
+          "-c tools.deployer:mode=symlink -g CMakeDeps")
+    deploy_folder = os.path.join(c.current_folder, "output/direct_deploy/pkg")
+    pkg_folder = c.get_latest_pkg_layout(c.get_latest_package_reference("pkg/1.0")).package()
+    assert os.path.islink(deploy_folder)
+    assert os.path.realpath(deploy_folder) == os.path.realpath(pkg_folder)
+    host_arch = c.get_default_host_profile().settings['arch']
+    cmake = c.load(f"output/pkg-release-{host_arch}-data.cmake")
+    assert "${CMAKE_CURRENT_LIST_DIR}/direct_deploy/pkg" in cmake
+
+    c.run("install --requires=pkg/1.0 --deployer=direct_deploy --output-folder=output "
+          "-c tools.deployer:mode=symlink")
+    assert "is up to date" in c.out
+
+    # Going back to a copy replaces the symlink, without touching the package
+    c.run("install --requires=pkg/1.0 --deployer=direct_deploy --output-folder=output")
+    assert not os.path.islink(deploy_folder)
+    assert c.load(os.path.join(deploy_folder, "include/hi.h")) == "hi"
+    assert c.load(os.path.join(pkg_folder, "include/hi.h")) == "hi"
+
+
 def test_deploy_editable():
     """ when deploying something that is editable, with the full_deploy built-in, it will copy the
     editable files as-is, but it doesn't fail at this moment
@@ -177,6 +177,43 @@ class TestJsonOutput:
         graph = json.loads(client.stdout)
         assert graph["graph"]["nodes"]["0"]["settings"]["build_type"] == "Debug"
 
+    def test_json_streamed(self):
+        # The streamed json is the same as the json.dumps() of the whole graph
+        client = TestClient()
+        client.save({"dep/conanfile.py": GenConanfile("dep", "0.1").with_setting("build_type"),
+                     "conanfile.py": GenConanfile("pkg", "0.1").with_setting("build_type")
+                                                               .with_requires("dep/0.1")})
+        client.run("export dep")
+        client.run("graph info . --format=json")
+        graph = json.loads(client.stdout)
+        assert client.stdout == json.dumps(graph, indent=4) + "\n"
+        assert graph["graph"]["nodes"]["1"]["ref"].startswith("dep/0.1#")
+        client.run("graph info . --format=json --filter=settings --package-filter=dep*")
+        graph = json.loads(client.stdout)
+        assert client.stdout == json.dumps(graph, indent=4) + "\n"
+        assert graph["graph"]["nodes"] == {"1": {"ref": graph["graph"]["nodes"]["1"]["ref"],
+                                                 "settings": {"build_type": "Release"}}}
+
+    def test_json_compact(self):
+        client = TestClient()
+        client.save({"dep/conanfile.py": GenConanfile("dep", "0.1").with_setting("build_type"),
+                     "conanfile.py": GenConanfile("pkg", "0.1").with_setting("build_type")
+                                                               .with_requires("dep/0.1")})
+        client.run("export dep")
+        client.run("graph info . --format=json")
+        nodes = json.loads(client.stdout)["graph"]["nodes"]
+        client.run("graph info . --format=json --compact")
+        graph = json.loads(client.stdout)["graph"]
+        interned = graph["interned"]
+        assert interned["settings"] == [{"build_type": "Release"}]
+        for id_, node in graph["nodes"].items():
+            assert node["settings"] == 0
+            for field, blocks in interned.items():
+                node[field] = blocks[node[field]]
+            assert node == nodes[id_]
+        client.run("graph info . --compact", assert_error=True)
+        assert "The --compact output is only for the 'json' format" in client.out
+
 
 class TestAdvancedCliOutput:
     """ Testing more advanced fields output, like SCM or PYTHON-REQUIRES
@@ -1,7 +1,26 @@
+import os
+import platform
 import textwrap
+import threading
+import time
 import unittest
 
+import pytest
+from mock import patch
+
+from conans.client.installer import BinaryInstaller, _wait_any
 from conans.test.utils.tools import GenConanfile, TestClient
+from conans.util.files import save
+
+
+@pytest.fixture(autouse=True)
+def _ignore_previous_threads():
+    # Other tests of this process can leave threads running (test servers), those would disable
+    # the parallel builds, only the threads started by these tests are taken into account
+    previous = set(threading.enumerate())
+    with patch("threading.active_count",
+               lambda: len(set(threading.enumerate()) - previous) + 1):
+        yield
 
 
 class InstallParallelTest(unittest.TestCase):
@@ -31,3 +50,196 @@ class InstallParallelTest(unittest.TestCase):
         self.assertIn("Downloading binary packages in %s parallel threads" % threads, client.out)
         for i in range(counter):
             self.assertIn("pkg%s/0.1@user/testing: Package installed" % i, client.out)
+
+
+@pytest.mark.skipif(platform.system() in ("Windows", "Darwin"), reason="Requires fork()")
+def test_parallel_builds():
+    client = TestClient()
+    conanfile = textwrap.dedent("""
+        import os
+        from conan import ConanFile
+
+        class Pkg(ConanFile):
+            version = "0.1"
+
+            def build(self):
+                self.output.info("Building my package!")
+                self.run("echo Output from a subprocess")
+                for dep in self.dependencies.values():
+                    assert os.path.exists(os.path.join(dep.package_folder, "conaninfo.txt"))
+                    self.output.info(f"Dependency {dep.ref} in {dep.cpp_info.libs}")
+
+            def package_info(self):
+                self.cpp_info.libs = [self.name]
+        """)
+    client.save({"conanfile.py": conanfile})
+    client.run("export . --name=liba")
+    client.run("export . --name=libb")
+    client.save({"conanfile.py": conanfile + "    requires = 'liba/0.1', 'libb/0.1'"})
+    client.run("export . --name=libc")
+
+    client.save_home({"global.conf": "core.build:parallel_jobs=2"})
+    client.run("install --requires=libc/0.1 --build=missing")
+    assert "Building packages in 2 parallel jobs" in client.out
+    for name in ("liba", "libb", "libc"):
+        assert f"{name}/0.1: Building from source in a parallel job" in client.out
+        # The output of every package is shown together, when it finishes
+        log = client.out.split(f"{name}/0.1: Building my package!")[1]
+        assert log.splitlines()[2] == "Output from a subprocess"
+        assert f"{name}/0.1: Package folder" in log.split("Building my package!")[0]
+    assert "libc/0.1: Dependency liba/0.1 in ['liba']" in client.out
+    assert "libc/0.1: Dependency libb/0.1 in ['libb']" in client.out
+    assert client.out.index("libb/0.1: Package folder") < client.out.index("libc/0.1: Building my")
+
+    client.run("install --requires=libc/0.1")
+    assert "libc/0.1: Already installed!" in client.out
+    assert "Building from source" not in client.out
+
+
+@pytest.mark.skipif(platform.system() in ("Windows", "Darwin"), reason="Requires fork()")
+def test_parallel_builds_error():
+    client = TestClient()
+    client.save({"liba/conanfile.py": GenConanfile("liba", "0.1"),
+                 "libb/conanfile.py": GenConanfile("libb", "0.1").with_build_msg("Building!")
+                                                                 .with_requires("liba/0.1"),
+                 "libc/conanfile.py": textwrap.dedent("""
+                    from conan import ConanFile
+                    class Pkg(ConanFile):
+                        name = "libc"
+                        version = "0.1"
+                        def build(self):
+                            raise Exception("Broken build!")
+                    """)})
+    client.run("export liba")
+    client.run("export libb")
+    client.run("export libc")
+    client.save_home({"global.conf": "core.build:parallel_jobs=4"})
+    client.run("install --requires=libb/0.1 --requires=libc/0.1 --build=missing",
+               assert_error=True)
+    assert "libc/0.1: Error in build() method, line 7" in client.out
+    assert "Broken build!" in client.out
+    # The build of liba, started at the same time than the failing libc, is finished
+    assert "liba/0.1: Package folder" in client.out
+
+
+@pytest.mark.skipif(platform.system() in ("Windows", "Darwin"), reason="Requires fork()")
+def test_parallel_builds_package_info_once():
+    """ the package_info() and its hooks run only once, in the parent process, not in the job
+    """
+    client = TestClient()
+    client.save({"conanfile.py": GenConanfile().with_package_info(cpp_info={"libs": ["mylib"]},
+                                                                  env_info={})})
+    client.run("export . --name=liba --version=0.1")
+    client.run("export . --name=libb --version=0.1")
+    hook = textwrap.dedent("""
+        def pre_package_info(conanfile):
+            conanfile.output.info("Hello")
+        """)
+    save(os.path.join(client.cache.hooks_path, "my_hook", "hook_my_hook.py"), hook)
+    client.save_home({"global.conf": "core.build:parallel_jobs=2"})
+    client.run("install --requires=liba/0.1 --requires=libb/0.1 --build=missing")
+    assert "liba/0.1: Building from source in a parallel job" in client.out
+    hook_msg = "[HOOK - my_hook/hook_my_hook.py] pre_package_info(): Hello"
+    assert client.out.count(f"liba/0.1: {hook_msg}") == 1
+    assert client.out.count(f"libb/0.1: {hook_msg}") == 1
+
+
+@pytest.mark.skipif(platform.system() in ("Windows", "Darwin"), reason="Requires fork()")
+def test_parallel_builds_build_state():
+    """ the attributes set in build() are available in the package_info() of the parent process
+    """
+    client = TestClient()
+    conanfile = textwrap.dedent("""
+        from conan import ConanFile
+
+        class Pkg(ConanFile):
+            version = "0.1"
+
+            def build(self):
+                self._built_libs = [self.name, "extra"]
+
+            def package_info(self):
+                self.output.info(f"Built libs: {self._built_libs}")
+        """)
+    client.save({"conanfile.py": conanfile})
+    client.run("export . --name=liba")
+    client.run("export . --name=libb")
+    client.save_home({"global.conf": "core.build:parallel_jobs=2"})
+    client.run("install --requires=liba/0.1 --requires=libb/0.1 --build=missing")
+    assert "liba/0.1: Building from source in a parallel job" in client.out
+    assert "liba/0.1: Built libs: ['liba', 'extra']" in client.out
+    assert "libb/0.1: Built libs: ['libb', 'extra']" in client.out
+
+
+def test_parallel_builds_threads():
+    """ never fork() while other threads are running, the packages are built sequentially
+    """
+    client = TestClient()
+    client.save({"conanfile.py": GenConanfile("liba", "0.1")})
+    client.run("export .")
+    client.save_home({"global.conf": "core.build:parallel_jobs=2"})
+    stop = threading.Event()
+    thread = threading.Thread(target=stop.wait)
+    thread.start()
+    try:
+        client.run("install --requires=liba/0.1 --build=missing")
+    finally:
+        stop.set()
+        thread.join()
+    assert "'core.build:parallel_jobs' can't be used while other threads are running" \
+           in client.out
+    assert "Building from source in a parallel job" not in client.out
+    assert "liba/0.1: Package folder" in client.out
+
+
+@pytest.mark.skipif(platform.system() in ("Windows", "Darwin"), reason="Requires fork()")
+def test_wait_only_build_jobs():
+    # Other child processes finishing before the build jobs are not reaped by the installer
+    other = os.fork()
+    if not other:
+        os._exit(0)
+    job = os.fork()
+    if not job:
+        time.sleep(0.2)
+        os._exit(0)
+    assert _wait_any([job]) == job
+    assert os.waitpid(other, 0)[0] == other
+
+
+def test_download_while_building():
+    """ the packages are installed as soon as their download finishes, while other packages are
+    still downloading in background
+    """
+    client = TestClient(default_server_user=True)
+    client.save({"liba/conanfile.py": GenConanfile("liba", "0.1"),
+                 "libb/conanfile.py": GenConanfile("libb", "0.1").with_requires("liba/0.1")})
+    client.run("create liba")
+    client.run("create libb")
+    client.run("upload * -r default -c")
+    client.run("remove * -c")
+    client.run("remove liba/0.1:* -c -r default")
+    client.save_home({"global.conf": "core.download:parallel=2"})
+
+    events = []
+    liba_installed = threading.Event()
+    download_pkg = BinaryInstaller._download_pkg
+    handle_package = BinaryInstaller._handle_package
+
+    def _download_pkg(installer, package):
+        liba_installed.wait(timeout=10)
+        download_pkg(installer, package)
+        events.append(f"downloaded {package.nodes[0].ref}")
+
+    def _handle_package(installer, package, *args):
+        handle_package(installer, package, *args)
+        events.append(f"installed {package.nodes[0].ref}")
+        liba_installed.set()
+
+    with patch.object(BinaryInstaller, "_download_pkg", _download_pkg), \
+            patch.object(BinaryInstaller, "_handle_package", _handle_package):
+        client.run("install --requires=libb/0.1 --build=missing:liba*")
+    assert events == ["installed liba/0.1", "downloaded libb/0.1", "installed libb/0.1"]
+    client.assert_listed_binary({"liba/0.1": ("da39a3ee5e6b4b0d3255bfef95601890afd80709",
+                                              "Build"),
+                                 "libb/0.1": ("37d930404fed1874e8c142c4d3fb7741669233b0",
+                                              "Download (default)")})
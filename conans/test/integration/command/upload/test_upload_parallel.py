@@ -1,3 +1,4 @@
+import os
 import textwrap
 
 import pytest
@@ -6,9 +7,9 @@ from requests import ConnectionError
 
 from conans.test.assets.genconanfile import GenConanfile
 from conans.test.utils.tools import TestClient, NO_SETTINGS_PACKAGE_ID, TestRequester
+from conans.util.files import load
 
 
-@pytest.mark.xfail(reason="Upload parallel not migrated yet")
 def test_upload_parallel_error():
     """Cause an error in the parallel transfer and see some message"""
 
@@ -17,7 +18,7 @@ def test_upload_parallel_error():
 
         def put(self, *args, **kwargs):
             if any(ref in args[0] for ref in self.fail_on):
-                raise ConnectionError("Connection fails with lib2 and lib4 references!")
+                raise ConnectionError("Connection fails with lib1 and lib3 references!")
             else:
                 return super(FailOnReferencesUploader, self).put(*args, **kwargs)
 
@@ -26,29 +27,61 @@ def test_upload_parallel_error():
     client.run('remote login default admin -p password')
     for index in range(4):
         client.run('create . --name=lib{} --version=1.0 --user=user --channel=channel'.format(index))
-    client.run('upload lib* --parallel -c -r default --retry-wait=0', assert_error=True)
-    assert "Connection fails with lib2 and lib4 references!" in client.out
-    assert "Execute upload again to retry upload the failed files" in client.out
+    client.save_home({"global.conf": "core.upload:parallel=4\ncore.upload:retry_wait=0"})
+    client.run('upload lib* -c -r default', assert_error=True)
+    assert "Uploading artifacts in 4 parallel threads" in client.out
+    assert "Connection fails with lib1 and lib3 references!" in client.out
 
 
-@pytest.mark.xfail(reason="Upload parallel not migrated yet")
-def test_upload_parallel_success():
-    """Upload 2 packages in parallel with success"""
+def test_upload_parallel_check_error():
+    """An error checking the server existing packages is raised"""
 
-    client = TestClient(default_server_user=True)
+    class FailOnReferencesChecker(TestRequester):
+        def get(self, *args, **kwargs):
+            if "lib1" in args[0]:
+                raise ConnectionError("Connection fails checking lib1!")
+            return super(FailOnReferencesChecker, self).get(*args, **kwargs)
+
+    client = TestClient(requester_class=FailOnReferencesChecker, default_server_user=True)
     client.save({"conanfile.py": GenConanfile()})
-    client.run('create . --name=lib0 --version=1.0 --user=user --channel=channel')
-    assert "lib0/1.0@user/channel: Package '{}' created".format(NO_SETTINGS_PACKAGE_ID) in client.out
-    client.run('create . --name=lib1 --version=1.0 --user=user --channel=channel')
-    assert "lib1/1.0@user/channel: Package '{}' created".format(NO_SETTINGS_PACKAGE_ID) in client.out
     client.run('remote login default admin -p password')
-    client.run('upload lib* --parallel -c -r default')
-    assert "Uploading lib0/1.0@user/channel to remote 'default'" in client.out
-    assert "Uploading lib1/1.0@user/channel to remote 'default'" in client.out
-    client.run('search lib0/1.0@user/channel -r default')
-    assert "lib0/1.0@user/channel" in client.out
-    client.run('search lib1/1.0@user/channel -r default')
-    assert "lib1/1.0@user/channel" in client.out
+    for index in range(4):
+        client.run(f'create . --name=lib{index} --version=1.0')
+    client.save_home({"global.conf": "core.upload:parallel=4\ncore.upload:retry_wait=0"})
+    client.run('upload lib* -c -r default', assert_error=True)
+    assert "Connection fails checking lib1!" in client.out
+    assert "Uploading artifacts" not in client.out
+
+
+def test_upload_parallel_success():
+    """Upload several recipes and packages in parallel with success"""
+
+    client = TestClient(default_server_user=True)
+    client.save({"conanfile.py": GenConanfile().with_settings("build_type")})
+    for index in range(3):
+        for build_type in ("Release", "Debug"):
+            client.run(f'create . --name=lib{index} --version=1.0 --user=user --channel=channel '
+                       f'-s build_type={build_type}')
+    client.save_home({"global.conf": "core.upload:parallel=4"})
+    client.run('upload lib* -c -r default')
+    assert "Uploading artifacts in 4 parallel threads" in client.out
+    out = str(client.out)
+    for index in range(3):
+        ref = f"lib{index}/1.0@user/channel"
+        # The packages of a recipe are always uploaded after it
+        recipe_upload = out.index(f"Uploading recipe '{ref}#")
+        assert out.count(f"Uploading package '{ref}#") == 2
+        assert out.index(f"Uploading package '{ref}#") > recipe_upload
+    client.run('list lib*/1.0@user/channel:* -r default')
+    for index in range(3):
+        assert f"lib{index}/1.0@user/channel" in client.out
+    assert client.out.count("build_type: Debug") == 3
+    assert client.out.count("build_type: Release") == 3
+
+    client.run('upload lib* -c -r default')
+    assert "Uploading recipe" not in client.out
+    assert "Uploading package" not in client.out
+    assert client.out.count("already in server, skipping upload") == 9
 
 
 @pytest.mark.xfail(reason="Upload parallel not migrated yet")
@@ -91,3 +124,27 @@ def test_beat_character_long_upload():
     assert "Compressing package...%&$Uploading conan_package.tgz -> pkg/0.1@user/stable" in out
     assert "%&$Uploading conan_export.tgz" in out
     assert "%&$Uploading conaninfo.txt" in out
+
+
+def test_upload_parallel_compression():
+    client = TestClient(default_server_user=True)
+    client.save({"conanfile.py": GenConanfile().with_exports_sources("*")
+                                               .with_package_file("include/header.h", "header"),
+                 "source.cpp": "source"})
+    for index in range(3):
+        client.run(f"create . --name=lib{index} --version=1.0")
+    client.save({"global.conf": "core.gzip:parallel=4"}, path=client.cache.cache_folder)
+    client.run("upload * -c -r default")
+    assert "Compressing artifacts in 4 parallel threads" in client.out
+    for index in range(3):
+        assert f"lib{index}/1.0: Compressing conan_sources.tgz" in client.out
+        assert f"lib{index}/1.0:{NO_SETTINGS_PACKAGE_ID}: Compressing conan_package.tgz" \
+               in client.out
+
+    client.run("remove * -c")
+    client.run("install --requires=lib1/1.0 --build=missing")
+    client.run("install --requires=lib2/1.0 --build=lib2/*")
+    assert "lib2/1.0: Copying sources to build folder" in client.out
+    package_folder = client.get_latest_pkg_layout(client.get_latest_package_reference(
+        "lib1/1.0")).package()
+    assert load(os.path.join(package_folder, "include", "header.h")) == "header"
@@ -1,9 +1,14 @@
 import os
 
+import pytest
+from mock import patch
+
+from conans import ZSTD_ARCHIVES
 from conans.model.recipe_ref import RecipeReference
 from conans.test.assets.genconanfile import GenConanfile
 from conans.test.utils.test_files import uncompress_packaged_files
-from conans.test.utils.tools import TestClient
+from conans.test.utils.tools import TestClient, TestServer
+from conans.util.files import zstd_available
 
 
 def test_reuse_uploaded_tgz():
@@ -89,3 +94,77 @@ def test_upload_only_tgz_if_needed():
     folder = uncompress_packaged_files(server_paths, pref)
     libraries = os.listdir(os.path.join(folder, "lib"))
     assert len(libraries) == 1
+
+
+@pytest.mark.skipif(not zstd_available(), reason="Requires the 'zstandard' package")
+def test_upload_zstd():
+    server = TestServer(users={"admin": "password"}, server_capabilities=[ZSTD_ARCHIVES])
+    client = TestClient(servers={"default": server}, inputs=["admin", "password"])
+    conanfile = GenConanfile("pkg", "0.1").with_exports("*").with_package_file("lib/file.lib",
+                                                                               "File")
+    client.save({"conanfile.py": conanfile,
+                 "file.txt": "contents"})
+    client.run("create .")
+    client.save_home({"global.conf": "core.upload:compression_format=zstd"})
+    client.run("upload * -r default -c")
+    assert "Compressing conan_export.tzst" in client.out
+    assert "Compressing conan_package.tzst" in client.out
+
+    other_client = TestClient(servers=client.servers)
+    other_client.run("install --requires=pkg/0.1")
+    pref = other_client.get_latest_package_reference("pkg/0.1")
+    package_folder = other_client.get_latest_pkg_layout(pref).package()
+    assert open(os.path.join(package_folder, "lib", "file.lib")).read() == "File"
+    export_folder = other_client.get_latest_ref_layout(pref.ref).export()
+    assert open(os.path.join(export_folder, "file.txt")).read() == "contents"
+
+    # Without zstandard, the client can't decompress the zstd files
+    other_client.run("remove * -c")
+    with patch("conans.client.rest.rest_client_v2.zstd_available", return_value=False):
+        other_client.run("install --requires=pkg/0.1", assert_error=True)
+    assert "The server only has the 'conan_export.tzst' zstd compressed file" in other_client.out
+
+    # With the gzip ones too, the zstd ones are used only if zstandard is installed
+    client.save_home({"global.conf": ""})
+    client.run("upload * -r default -c --force")
+    assert "Compressing conan_package.tgz" in client.out
+    other_client.run("install --requires=pkg/0.1")
+    download_folder = other_client.get_latest_pkg_layout(pref).download_package()
+    assert os.listdir(download_folder) == ["conan_package.tzst"]
+    other_client.run("remove * -c")
+    with patch("conans.client.rest.rest_client_v2.zstd_available", return_value=False):
+        other_client.run("install --requires=pkg/0.1")
+    assert os.listdir(download_folder) == ["conan_package.tgz"]
+
+
+@pytest.mark.skipif(not zstd_available(), reason="Requires the 'zstandard' package")
+def test_upload_zstd_remote_not_capable():
+    """ the remotes that don't declare the zstd capability, like old servers, get the gzip files
+    """
+    client = TestClient(default_server_user=True)
+    client.save({"conanfile.py": GenConanfile("pkg", "0.1")})
+    client.run("create .")
+    client.save_home({"global.conf": "core.upload:compression_format=zstd"})
+    client.run("upload * -r default -c")
+    assert "WARN: The remote 'default' doesn't accept zstd compressed files, the artifacts " \
+           "will be compressed with gzip" in client.out
+    assert "Compressing conan_package.tgz" in client.out
+    assert "tzst" not in client.out
+    other_client = TestClient(servers=client.servers)
+    with patch("conans.client.rest.rest_client_v2.zstd_available", return_value=False):
+        other_client.run("install --requires=pkg/0.1")
+    assert "pkg/0.1: Package installed" in other_client.out
+
+
+def test_upload_zstd_not_available():
+    client = TestClient(default_server_user=True)
+    client.save({"conanfile.py": GenConanfile("pkg", "0.1")})
+    client.run("create .")
+    client.save_home({"global.conf": "core.upload:compression_format=zstd"})
+    with patch("conans.client.cmd.uploader.zstd_available", return_value=False):
+        client.run("upload * -r default -c")
+    assert "The 'zstandard' Python package is not installed" in client.out
+    assert "Compressing conan_package.tgz" in client.out
+    client.save_home({"global.conf": "core.upload:compression_format=bzip2"})
+    client.run("upload * -r default -c", assert_error=True)
+    assert "Unknown value 'bzip2' for 'core.upload:compression_format'" in client.out
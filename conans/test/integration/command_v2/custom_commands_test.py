@@ -15,10 +15,16 @@ class TestCustomCommands:
         command_file_path = os.path.join(client.cache_folder, 'extensions',
                                          'commands', 'cmd_mycommand.py')
         client.save({f"{command_file_path}": mycommand})
-        # Call to any other command, it will fail loading the custom command
+        # Custom commands are only loaded when used, or for the help of all commands
         client.run("list *")
+        assert "Error loading custom command" not in client.out
+        client.run("-h")
+        assert "ERROR: Error loading custom command 'cmd_mycommand.py': " \
+               "No module named 'this_doesnt_exist'" in client.out
+        client.run("mycommand", assert_error=True)
         assert "ERROR: Error loading custom command 'cmd_mycommand.py': " \
                "No module named 'this_doesnt_exist'" in client.out
+        assert "ERROR: Unknown command 'mycommand'" in client.out
         # But it won't break the whole conan and you can still use the rest of it
         client.run("config home")
         assert client.cache_folder in client.out
@@ -35,8 +41,7 @@ class TestCustomCommands:
         command_file_path = os.path.join(client.cache_folder, 'extensions',
                                          'commands', 'mycompany', 'cmd_mycommand.py')
         client.save({f"{command_file_path}": mycommand})
-        # Call to any other command, it will fail loading the custom command,
-        client.run("list *")
+        client.run("mycompany:mycommand", assert_error=True)
         assert "ERROR: Error loading custom command mycompany.cmd_mycommand" in client.out
         # But it won't break the whole conan and you can still use the rest of it
         client.run("config home")
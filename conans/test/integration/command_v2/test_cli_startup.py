@@ -0,0 +1,56 @@
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+import conan
+from conans.test.utils.test_files import temp_folder
+
+
+def _run_conan(home, args):
+    # A new interpreter, to check the modules that are actually imported to run a command
+    code = textwrap.dedent(f"""
+        import json
+        import sys
+        from conan.cli.cli import main
+        try:
+            main({args!r})
+        except SystemExit:
+            pass
+        modules = [m for m in sys.modules if m.startswith("conan.cli.commands.")]
+        print(json.dumps(modules))
+        """)
+    env = os.environ.copy()
+    env["CONAN_HOME"] = home
+    conan_root = os.path.dirname(os.path.dirname(os.path.abspath(conan.__file__)))
+    env["PYTHONPATH"] = os.pathsep.join([conan_root, env.get("PYTHONPATH", "")])
+    output = subprocess.check_output([sys.executable, "-c", code], env=env,
+                                     stderr=subprocess.DEVNULL)
+    return json.loads(output.decode().splitlines()[-1])
+
+
+def test_cli_imports_only_the_command():
+    """ Running a command imports its module, not the ones of all the commands of the CLI
+    """
+    home = temp_folder()
+    _run_conan(home, ["config", "home"])  # The first run initializes the Conan home
+    modules = _run_conan(home, ["config", "home"])
+    assert modules == ["conan.cli.commands.config"]
+
+    modules = _run_conan(home, ["version"])
+    # version uses the list formatter
+    assert sorted(modules) == ["conan.cli.commands.list", "conan.cli.commands.version"]
+
+    modules = _run_conan(home, ["--help"])
+    assert "conan.cli.commands.install" in modules
+
+
+def test_cli_command_help_imports_only_the_command():
+    """ The help of a command doesn't need the modules of the other commands, only "conan --help"
+    that lists all of them
+    """
+    home = temp_folder()
+    _run_conan(home, ["config", "home"])
+    assert _run_conan(home, ["install", "--help"]) == ["conan.cli.commands.install"]
+    assert _run_conan(home, ["list", "-h"]) == ["conan.cli.commands.list"]
@@ -0,0 +1,94 @@
+import os
+from unittest import mock
+
+from conan.api.conan_api import ConanAPI
+from conan.internal.cache.home_paths import HomePaths
+from conan.internal.conan_app import ConanApp
+from conans.client.cache.cache import ClientCache
+from conans.client.rest.conan_requester import ConanRequester
+from conans.test.utils.test_files import temp_folder
+from conans.util.env import environment_update
+from conans.util.files import save
+
+
+def test_app_state_reused():
+    """ consecutive calls to the same ConanAPI reuse the configuration, http sessions, plugins...
+    unless the home files are modified
+    """
+    folder = temp_folder()
+    api = ConanAPI(cache_folder=folder)
+    app = ConanApp(api)
+    app2 = ConanApp(api)
+    assert app.requester is app2.requester
+    assert app.cache is app2.cache
+    assert app.remote_manager is app2.remote_manager
+    # The caches of every command are not shared
+    assert app.loader is not app2.loader
+    assert app.range_resolver is not app2.range_resolver
+
+    save(os.path.join(folder, "global.conf"), "core.net.http:timeout=42")
+    app3 = ConanApp(api)
+    assert app3.requester is not app.requester
+    assert api.config.get("core.net.http:timeout", check_type=int) == 42
+    assert ConanApp(api).cache is app3.cache
+
+    hook = os.path.join(HomePaths(folder).hooks_path, "hook_my.py")
+    save(hook, "def pre_export(conanfile):\n    pass\n")
+    app4 = ConanApp(api)
+    assert app4.cache is not app3.cache
+    assert "pre_export" in app4.hook_manager.hooks
+
+    api.reinit()
+    assert ConanApp(api).cache is not app4.cache
+
+
+def test_app_state_released():
+    """ the http sessions of a state are closed when it is replaced or invalidated, and the
+    database connections when it is invalidated
+    """
+    folder = temp_folder()
+    api = ConanAPI(cache_folder=folder)
+    ConanApp(api)
+    with mock.patch.object(ConanRequester, "close") as close, \
+            mock.patch.object(ClientCache, "close") as close_db:
+        ConanApp(api)
+        assert close.call_count == 0
+        save(os.path.join(folder, "global.conf"), "core.net.http:timeout=42")
+        ConanApp(api)
+        assert close.call_count == 1
+        # The database connections can be in use by other threads, they are reused
+        assert close_db.call_count == 0
+        api.reinit()
+        assert close.call_count == 2
+        assert close_db.call_count == 1
+
+
+def test_app_state_global_conf_inputs():
+    """ the files included by global.conf and the environment variables are also watched
+    """
+    folder = temp_folder()
+    save(os.path.join(folder, "global.conf"),
+         '{% include "timeout.conf" %}\n'
+         'core.net.http:timeout={{ os.getenv("MY_RETRY_WAIT", "1") }}')
+    save(os.path.join(folder, "timeout.conf"), "core.download:retry=3")
+    api = ConanAPI(cache_folder=folder)
+    app = ConanApp(api)
+    assert app.cache.new_config.get("core.download:retry", check_type=int) == 3
+    assert ConanApp(api).cache is app.cache
+
+    save(os.path.join(folder, "timeout.conf"), "core.download:retry=42")
+    app = ConanApp(api)
+    assert app.cache.new_config.get("core.download:retry", check_type=int) == 42
+
+    with environment_update({"MY_RETRY_WAIT": "7"}):
+        app2 = ConanApp(api)
+        assert app2.cache is not app.cache
+        assert app2.cache.new_config.get("core.net.http:timeout", check_type=int) == 7
+
+
+def test_app_home_folder():
+    # The previous ConanApp(cache_folder) still works, without reusing anything
+    folder = temp_folder()
+    app = ConanApp(folder)
+    assert app.cache_folder == folder
+    assert ConanApp(folder).cache is not app.cache
@@ -1,7 +1,9 @@
 # coding=utf-8
 
 import os
+import threading
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import mock
 from mock import Mock, MagicMock
@@ -62,3 +64,58 @@ class ConanRequesterHeadersTests(unittest.TestCase):
             requester.get(url="aaa", headers={"User-Agent": "MyUserAgent"})
             headers = requester._http_requester.get.call_args[1]["headers"]
             self.assertEqual("MyUserAgent", headers["User-Agent"])
+
+
+class ConanRequesterPoolTests(unittest.TestCase):
+    def test_pool_size(self):
+        config = ConfDefinition()
+        requester = ConanRequester(config)
+        self.assertEqual(requester._pool_size, 10)
+        config.update("core.download:parallel", 32)
+        config.update("core.upload:parallel", 16)
+        requester = ConanRequester(config)
+        self.assertEqual(requester._pool_size, 96)
+        adapter = requester._http_requester.get_adapter("https://myremote")
+        self.assertEqual(adapter._pool_maxsize, 96)
+
+    def test_connections_reused(self):
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+
+            def do_GET(self):
+                self.send_response(200)
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"ok")
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            url = "http://127.0.0.1:{}".format(server.server_address[1])
+            config = ConfDefinition()
+            config.update("core.download:parallel", 7)
+            requester = ConanRequester(config)
+            for _ in range(4):
+                requester.get(url)
+            self.assertEqual(requester.connections_stats()[url], (1, 3))
+            # Every output reports only the connections since the previous one
+            requester.output_connections_stats()
+            self.assertEqual(requester.connections_stats(), {})
+            requester.get(url)
+            self.assertEqual(requester.connections_stats()[url], (0, 1))
+            # Another requester, like the one of another ConanAPI, has its own connections
+            other = ConanRequester(config)
+            other.get(url)
+            self.assertEqual(other.connections_stats()[url], (1, 0))
+            # Closed, the connections are released, and opened again if it is used again
+            requester.close()
+            self.assertEqual(requester.connections_stats(), {})
+            requester.get(url)
+            self.assertEqual(requester.connections_stats()[url], (1, 0))
+        finally:
+            server.shutdown()
+            server.server_close()
@@ -0,0 +1,84 @@
+import yaml
+
+from conan.api.conan_api import ConanAPI
+from conans.client.conf import default_settings_yml
+from conans.client.graph.install_graph import InstallGraph
+from conans.model.profile import Profile
+from conans.model.settings import Settings
+from conans.test.integration.graph.core.graph_manager_base import GraphManagerTest
+from conans.test.utils.tools import GenConanfile
+
+
+class TestGraphBenchmark(GraphManagerTest):
+    """ synthetic graphs of real recipes in the cache, checking the graph load, the binaries
+    evaluation and the ordering. Small sizes, the big sizes of the ordering alone are in the
+    unittests test_graph_ordering.py
+    """
+
+    def _load(self, consumer):
+        profile_host = Profile()
+        profile_host.settings["os"] = "Linux"
+        profile_build = Profile()
+        profile_build.settings["os"] = "Windows"
+        cache_settings = Settings(yaml.safe_load(default_settings_yml))
+        profile_host.process_settings(cache_settings)
+        profile_build.process_settings(cache_settings)
+        conan_api = ConanAPI(cache_folder=self.cache_folder)
+
+        deps_graph = conan_api.graph.load_graph_consumer(consumer, None, None, None, None,
+                                                         profile_host, profile_build, None, None,
+                                                         None)
+        deps_graph.report_graph_error()
+        conan_api.graph.analyze_binaries(deps_graph, ["missing"], remotes=[])
+        levels = deps_graph.by_levels()
+        install_order = InstallGraph(deps_graph).install_order()
+        return deps_graph, levels, install_order
+
+    def test_deep_chain(self):
+        size = 60
+        self.recipe_cache("pkg0/0.1")
+        for i in range(1, size):
+            self.recipe_cache(f"pkg{i}/0.1", [f"pkg{i - 1}/0.1"])
+        consumer = self.recipe_consumer("app/0.1", [f"pkg{size - 1}/0.1"])
+        deps_graph, levels, install_order = self._load(consumer)
+
+        assert len(deps_graph.nodes) == size + 1
+        assert [[n.ref.name for n in level] for level in levels] == \
+               [[f"pkg{i}"] for i in range(size)] + [["app"]]
+        assert [[n.ref.name for n in level] for level in install_order] == \
+               [[f"pkg{i}"] for i in range(size)]
+
+    def test_wide_diamond(self):
+        width = 60
+        self.recipe_cache("base/0.1")
+        for i in range(width):
+            self.recipe_cache(f"middle{i}/0.1", ["base/0.1"])
+        self.recipe_cache("top/0.1", [f"middle{i}/0.1" for i in range(width)])
+        consumer = self.recipe_consumer("app/0.1", ["top/0.1"])
+        deps_graph, levels, install_order = self._load(consumer)
+
+        assert len(deps_graph.nodes) == width + 3
+        assert [len(level) for level in levels] == [1, width, 1, 1]
+        assert [n.ref.name for n in levels[1]] == sorted(f"middle{i}" for i in range(width))
+        assert [len(level) for level in install_order] == [1, width, 1]
+
+    def test_build_requires(self):
+        libs, tools = 30, 5
+        for t in range(tools):
+            self.recipe_cache(f"tool{t}/0.1")
+        for i in range(libs):
+            conanfile = GenConanfile().with_tool_requires(*[f"tool{t}/0.1" for t in range(tools)])
+            if i:
+                conanfile.with_requires(f"lib{i - 1}/0.1")
+            self.recipe_conanfile(f"lib{i}/0.1", conanfile)
+        consumer = self.recipe_consumer("app/0.1", [f"lib{libs - 1}/0.1"])
+        deps_graph, levels, install_order = self._load(consumer)
+
+        # Every lib has its own tool nodes in the build context, but they are the same packages
+        assert len(deps_graph.nodes) == 1 + libs * (1 + tools)
+        assert [n.ref.name for n in levels[0]] == \
+               [f"tool{t}" for t in range(tools) for _ in range(libs)]
+        assert [[n.ref.name for n in level] for level in levels[1:]] == \
+               [[f"lib{i}"] for i in range(libs)] + [["app"]]
+        assert [[n.ref.name for n in level] for level in install_order] == \
+               [[f"tool{t}" for t in range(tools)]] + [[f"lib{i}"] for i in range(libs)]
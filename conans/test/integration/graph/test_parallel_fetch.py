@@ -0,0 +1,161 @@
+import json
+import textwrap
+from collections import OrderedDict
+from unittest import mock
+
+import pytest
+
+from conans import BULK_PACKAGES_LATEST
+from conans.errors import ForbiddenException
+from conans.test.assets.genconanfile import GenConanfile
+from conans.test.utils.tools import TestClient, TestServer, TestRequester
+
+
+def _upload_diamond(client):
+    # app -> pkgb -> pkga
+    #    \-> pkgc -/
+    client.save({"pkga/conanfile.py": GenConanfile("pkga", "0.1").with_settings("build_type"),
+                 "pkgb/conanfile.py": GenConanfile("pkgb", "0.1").with_settings("build_type")
+                                                                 .with_requires("pkga/0.1"),
+                 "pkgc/conanfile.py": GenConanfile("pkgc", "0.1").with_settings("build_type")
+                                                                 .with_requires("pkga/0.1"),
+                 "app/conanfile.py": GenConanfile("app", "0.1").with_requires("pkgb/0.1",
+                                                                              "pkgc/0.1")})
+    client.run("export pkga")
+    client.run("export pkgb")
+    client.run("export pkgc")
+    client.run("upload * -c -r=default")
+    client.run("remove * -c")
+
+
+def test_parallel_fetch_same_graph():
+    client = TestClient(default_server_user=True)
+    _upload_diamond(client)
+    client.run("graph info app --format=json")
+    sequential = json.loads(client.stdout)
+    client.run("remove * -c")
+
+    client.save({"global.conf": "core.graph:parallel_fetch=4"}, path=client.cache.cache_folder)
+    client.run("graph info app --format=json")
+    parallel = json.loads(client.stdout)
+    assert parallel == sequential
+    for pkg in ("pkga", "pkgb", "pkgc"):
+        assert f"{pkg}/0.1: Downloaded recipe revision" in client.out
+
+
+@pytest.mark.parametrize("override", [True, False])
+def test_parallel_fetch_overrides(override):
+    # The recipes replaced by downstream overrides or forces are not retrieved
+    client = TestClient(default_server_user=True)
+    client.save({"pkga/conanfile.py": GenConanfile("pkga"),
+                 "pkgb/conanfile.py": GenConanfile("pkgb", "0.1").with_requires("pkga/0.1")})
+    client.run("export pkga --version=0.1")
+    client.run("export pkga --version=0.2")
+    client.run("export pkgb")
+    client.run("upload * -c -r=default")
+    client.run("remove * -c")
+
+    requirement = {"override": True} if override else {"force": True}
+    client.save({"global.conf": "core.graph:parallel_fetch=4"}, path=client.cache.cache_folder)
+    client.save({"conanfile.py": GenConanfile("app", "0.1").with_requires("pkgb/0.1")
+                .with_requirement("pkga/0.2", **requirement)})
+    client.run("graph info .")
+    assert "pkga/0.2: Downloaded recipe revision" in client.out
+    assert "pkga/0.1: Downloaded recipe revision" not in client.out
+
+
+def test_parallel_fetch_missing():
+    client = TestClient(default_server_user=True)
+    client.save({"global.conf": "core.graph:parallel_fetch=4"}, path=client.cache.cache_folder)
+    client.save({"conanfile.py": GenConanfile("app", "0.1").with_requires("pkga/0.1")})
+    client.run("graph info .", assert_error=True)
+    assert "ERROR: Package 'pkga/0.1' not resolved: Unable to find 'pkga/0.1' in remotes" \
+           in client.out
+
+
+@pytest.mark.parametrize("capabilities", [[], [BULK_PACKAGES_LATEST]])
+def test_parallel_fetch_binaries(capabilities):
+    server = TestServer(users={"admin": "password"}, server_capabilities=capabilities)
+    client = TestClient(servers={"default": server}, inputs=["admin", "password"])
+    _upload_diamond(client)
+    client.run("install app --build=missing")
+    client.run("upload * -c -r=default")
+    client.run("remove * -c")
+
+    client.save({"global.conf": "core.graph:parallel_fetch=4"}, path=client.cache.cache_folder)
+    client.run("install app")
+    for pkg in ("pkga", "pkgb", "pkgc"):
+        assert f"{pkg}/0.1: Package installed" in client.out
+    client.run("install app -s build_type=Debug", assert_error=True)
+    assert "ERROR: Missing prebuilt package for 'pkga/0.1', 'pkgb/0.1', 'pkgc/0.1'" in client.out
+
+
+def test_parallel_fetch_binaries_error():
+    # The error of a concurrent request is not assigned to all its packages, they are queried
+    # again one by one, and an error of one of them doesn't fail the others
+    client = TestClient(default_server_user=True)
+    _upload_diamond(client)
+    client.run("install app --build=missing")
+    client.run("upload * -c -r=default")
+    client.run("remove * -c")
+    client.save({"global.conf": "core.graph:parallel_fetch=4"}, path=client.cache.cache_folder)
+    with mock.patch("conans.client.remote_manager.RemoteManager.get_latest_packages_references",
+                    side_effect=ForbiddenException("Permission denied")):
+        client.run("install app")
+    for pkg in ("pkga", "pkgb", "pkgc"):
+        assert f"{pkg}/0.1: Package installed" in client.out
+
+
+def test_parallel_fetch_first_remote():
+    # Without update, the next remotes are only queried for the packages missing in the previous
+    class RequesterClass(TestRequester):
+        def get(self, url, *args, **kwargs):
+            print(f"GET: {url}")
+            return super(RequesterClass, self).get(url, *args, **kwargs)
+
+        def post(self, url, *args, **kwargs):
+            print(f"POST: {url}")
+            return super(RequesterClass, self).post(url, *args, **kwargs)
+
+    servers = OrderedDict()
+    servers["default"] = TestServer(server_capabilities=[BULK_PACKAGES_LATEST])
+    servers["other"] = TestServer(server_capabilities=[BULK_PACKAGES_LATEST])
+    client = TestClient(servers=servers, requester_class=RequesterClass,
+                        inputs=["admin", "password", "admin", "password"])
+    client.save({"pkga/conanfile.py": GenConanfile("pkga", "0.1"),
+                 "pkgb/conanfile.py": GenConanfile("pkgb", "0.1")})
+    client.run("create pkga")
+    client.run("create pkgb")
+    client.run("upload * -c -r=default")
+    client.run("upload * -c -r=other")
+    client.run("remove * -c")
+
+    client.save({"global.conf": "core.graph:parallel_fetch=4"}, path=client.cache.cache_folder)
+    client.run("install --requires=pkga/0.1 --requires=pkgb/0.1")
+    assert "pkga/0.1: Package installed" in client.out
+    assert "pkgb/0.1: Package installed" in client.out
+    other = servers["other"].fake_url
+    assert not any(line.startswith(f"POST: {other}") or line.startswith(f"GET: {other}")
+                   for line in str(client.out).splitlines())
+
+
+def test_parallel_fetch_compatible_binaries():
+    client = TestClient(default_server_user=True)
+    conanfile = textwrap.dedent("""
+        from conan import ConanFile
+        class Pkg(ConanFile):
+            settings = "build_type"
+            def compatibility(self):
+                return [{"settings": [("build_type", v)]} for v in ("Debug", "RelWithDebInfo")]
+        """)
+    client.save({"conanfile.py": conanfile})
+    client.run("create . --name=pkg --version=0.1 -s build_type=RelWithDebInfo")
+    package_id = client.created_package_id("pkg/0.1")
+    client.run("upload * -c -r=default")
+    client.run("remove * -c")
+
+    client.save({"global.conf": "core.graph:parallel_fetch=4"}, path=client.cache.cache_folder)
+    client.run("install --requires=pkg/0.1 -s build_type=Release")
+    assert "Compatible configurations not found in cache, checking servers" in client.out
+    assert f"Using compatible package '{package_id}'" in client.out
+    client.assert_listed_binary({"pkg/0.1": (package_id, "Download (default)")})
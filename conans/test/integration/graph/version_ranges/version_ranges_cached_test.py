@@ -3,10 +3,11 @@ from collections import OrderedDict
 import pytest
 from mock import patch
 
+from conans import RECIPE_VERSIONS
 from conans.client.remote_manager import RemoteManager
 from conans.model.recipe_ref import RecipeReference
 from conans.test.assets.genconanfile import GenConanfile
-from conans.test.utils.tools import TestClient, TestServer
+from conans.test.utils.tools import TestClient, TestServer, TestRequester
 
 
 class TestVersionRangesCache:
@@ -15,7 +16,7 @@ class TestVersionRangesCache:
     def _setup(self):
         self.counters = {"server0": 0, "server1": 0}
 
-    def _mocked_search_recipes(self, remote, pattern, ignorecase=True):
+    def _mocked_get_recipe_versions(self, name, remote):
         packages = {
             "server0": [RecipeReference.loads("liba/1.0.0"),
                         RecipeReference.loads("liba/1.1.0")],
@@ -60,7 +61,8 @@ class TestVersionRangesCache:
         # should call only once to server0
         self.counters["server0"] = 0
         self.counters["server1"] = 0
-        with patch.object(RemoteManager, "search_recipes", new=self._mocked_search_recipes):
+        with patch.object(RemoteManager, "get_recipe_versions",
+                          new=self._mocked_get_recipe_versions):
             client.run("create . --update")
             assert self.counters["server0"] == 1
             assert self.counters["server1"] == 1
@@ -100,3 +102,25 @@ def test_prefer_cache_version():
     c.run("install consumer --update")
     assert "pkg/1.1" in c.out
     assert "pkg/1.0" not in c.out
+
+
+def test_resolve_remote_recipe_versions():
+    """ the remote ranges are resolved with the versions of the recipe name, not a search
+    """
+    class RequesterClass(TestRequester):
+        def get(self, url, **kwargs):
+            print(f"URL: {url}")
+            return super(RequesterClass, self).get(url, **kwargs)
+
+    server = TestServer(server_capabilities=[RECIPE_VERSIONS])
+    c = TestClient(servers={"default": server}, inputs=["admin", "password"],
+                   requester_class=RequesterClass)
+    c.save({"conanfile.py": GenConanfile("pkg")})
+    for version in ("1.0", "1.1", "2.0"):
+        c.run(f"create . --version={version}")
+    c.run("upload * -c -r=default")
+    c.run("remove * -c")
+    c.run('install --requires="pkg/[>=1 <2]"')
+    assert "/v2/conans/pkg/versions" in c.out
+    assert "/v2/conans/search" not in c.out
+    assert "pkg/1.1: Retrieving package" in c.out
@@ -1,5 +1,6 @@
 import json
 import os
+import shutil
 
 import pytest
 from requests import Response
@@ -7,8 +8,9 @@ from requests import Response
 from requests.exceptions import ConnectionError
 
 from conans.test.assets.genconanfile import GenConanfile
+from conans.test.utils.test_files import temp_folder
 from conans.test.utils.tools import TestClient, TestRequester, TestServer
-from conans.util.files import save
+from conans.util.files import save, load, chdir, gzopen_without_timestamps
 
 
 class TestBrokenDownload:
@@ -34,6 +36,49 @@ class TestBrokenDownload:
         assert "Error while extracting downloaded file" in client.out
         assert not os.path.exists(client.get_latest_ref_layout(pref.ref).export())
 
+    def test_corrupt_package_file(self, setup):
+        """ the md5 of the files computed while extracting the conan_package.tgz must match the
+        package conanmanifest.txt
+        """
+        client, pref = setup
+        server = client.servers["default"]
+        path = server.test_server.server_store.package(pref)
+        manifest = os.path.join(path, "conanmanifest.txt")
+        save(manifest, load(manifest) + "include/header.h: 12345\n")
+        tmp = temp_folder()
+        save(os.path.join(tmp, "include", "header.h"), "header")
+        with chdir(tmp):
+            with gzopen_without_timestamps("conan_package.tgz", mode="w") as tgz:
+                tgz.add("include")
+        shutil.copy(os.path.join(tmp, "conan_package.tgz"), os.path.join(path,
+                                                                         "conan_package.tgz"))
+        client.save_home({"global.conf": "core.download:check_manifest=True"})
+        client.run("install --requires=hello/0.1", assert_error=True)
+        assert f"ERROR: Corrupted hello/0.1:{pref.package_id} in 'default' remote: " \
+               "'include/header.h' checksum doesn't match the conanmanifest.txt one" in client.out
+        client.run("list *:*")
+        assert pref.package_id not in client.out
+
+    def test_missing_package_file(self, setup):
+        """ a truncated conan_package.tgz without some of the files of the conanmanifest.txt
+        """
+        client, pref = setup
+        server = client.servers["default"]
+        path = server.test_server.server_store.package(pref)
+        manifest = os.path.join(path, "conanmanifest.txt")
+        save(manifest, load(manifest) + "include/header.h: 12345\n")
+        client.save_home({"global.conf": "core.download:check_manifest=True"})
+        client.run("install --requires=hello/0.1", assert_error=True)
+        assert f"ERROR: Corrupted hello/0.1:{pref.package_id} in 'default' remote: " \
+               "'include/header.h' of the conanmanifest.txt is missing" in client.out
+        client.run("list *:*")
+        assert pref.package_id not in client.out
+        # The check is opt-in, by default the packages are installed as they always were
+        client.save_home({"global.conf": ""})
+        client.run("install --requires=hello/0.1")
+        client.run("list *:*")
+        assert pref.package_id in client.out
+
     def test_remove_conaninfo(self, setup):
         """
         if the conaninfo is removed, it is considered at least a broken package by the client
@@ -1,8 +1,11 @@
+import os
 import unittest
 
 from requests import Response
 
+from conans.test.assets.genconanfile import GenConanfile
 from conans.test.utils.tools import TestClient, TestServer, TestRequester
+from conans.util.files import load
 
 myconan1 = """
 from conan import ConanFile
@@ -45,3 +48,21 @@ class DownloadTest(unittest.TestCase):
         assert "ERROR: Package 'foo/bar' not resolved" in client2.out
         assert "This server is under maintenance" in client2.out
         assert "not found" not in client2.out
+
+
+def test_download_chunked():
+    client = TestClient(default_server_user=True)
+    contents = os.urandom(200000).hex()  # Not very compressible, conan_package.tgz > 100KB
+    client.save({"conanfile.py": GenConanfile("pkg", "0.1").with_package_file("data.txt",
+                                                                              contents)})
+    client.run("create .")
+    client.run("upload * -r=default -c")
+    client.run("remove * -c")
+    client.save_home({"global.conf": "core.download:chunked_threshold=100000\n"
+                                     "core.download:chunked_parallel=3"})
+    client.run("install --requires=pkg/0.1")
+    assert "conan_package.tgz in 3 parallel ranges" in client.out
+    assert "conaninfo.txt in" not in client.out
+    pref = client.get_latest_package_reference("pkg/0.1")
+    package_folder = client.get_latest_pkg_layout(pref).package()
+    assert load(os.path.join(package_folder, "data.txt")) == contents
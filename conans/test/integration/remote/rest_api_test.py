@@ -194,6 +194,39 @@ class RestApiTest(unittest.TestCase):
         for sha in ["1", "2", "3", "4", "5"]:
             self.assertFalse(os.path.exists(folders[sha]))
 
+    def test_get_latest_packages_references(self):
+        ref = RecipeReference.loads("MyThirdConan/3.0.0@private_user/testing#myreciperev")
+        self._upload_recipe(ref)
+        for sha in ["1", "2"]:
+            self._upload_package(PkgReference(ref, sha, "mypackagerev"), {CONANINFO: ""})
+
+        prefs = [PkgReference(ref, sha) for sha in ["1", "2", "3"]]
+        # The bulk request, implemented by the server
+        latest = self.api._get_api().get_latest_packages_references(prefs)
+        self.assertEqual(["mypackagerev", "mypackagerev", None],
+                         [p.revision if p else None for p in latest.values()])
+        self.assertIsNotNone(latest[prefs[0]].timestamp)
+        # The server doesn't declare the capability, so per-package requests fallback
+        fallback = self.api.get_latest_packages_references({p: None for p in prefs})
+        self.assertEqual(latest, fallback)
+
+    def test_get_recipe_versions(self):
+        for ref in ["MyVersions/1.0@private_user/testing#rrev1",
+                    "MyVersions/1.0@private_user/testing#rrev2",
+                    "MyVersions/2.0@private_user/testing#rrev1",
+                    "MyVersions/3.0@private_user/stable#rrev1",
+                    "MyVersionsOther/1.0@private_user/testing#rrev1"]:
+            self._upload_recipe(RecipeReference.loads(ref))
+
+        expected = ["MyVersions/1.0@private_user/testing", "MyVersions/2.0@private_user/testing",
+                    "MyVersions/3.0@private_user/stable"]
+        # The versions request, implemented by the server
+        versions = self.api._get_api().get_recipe_versions("MyVersions")
+        self.assertEqual(expected, sorted(repr(r) for r in versions))
+        # The server doesn't declare the capability, so the search fallback
+        versions = self.api.get_recipe_versions("MyVersions")
+        self.assertEqual(expected, sorted(repr(r) for r in versions))
+
     def _upload_package(self, package_reference, base_files=None):
 
         files = {"conanfile.py": GenConanfile("3").with_requires("1", "12").with_exports("*"),
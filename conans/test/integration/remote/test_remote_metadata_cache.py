@@ -0,0 +1,62 @@
+from conans.test.assets.genconanfile import GenConanfile
+from conans.test.utils.tools import TestClient, TestRequester, TestServer
+
+
+class RequesterClass(TestRequester):
+
+    def get(self, url, headers=None, **kwargs):
+        response = super(RequesterClass, self).get(url, headers=headers, **kwargs)
+        if "/latest" in url:
+            print(f"LATEST: {url} If-None-Match: {(headers or {}).get('If-None-Match')} "
+                  f"STATUS: {response.status_code}")
+        return response
+
+
+def test_remote_metadata_cache():
+    c = TestClient(requester_class=RequesterClass, default_server_user=True)
+    c.save({"conanfile.py": GenConanfile("pkg", "0.1")})
+    c.run("create .")
+    c.run("upload * -r=default -c")
+    c.save_home({"global.conf": "core.net.http:metadata_cache_ttl=1000"})
+
+    c.run("install --requires=pkg/0.1 --update")
+    assert "LATEST: " in c.out
+    c.run("install --requires=pkg/0.1 --update")
+    assert "LATEST: " not in c.out  # served by the cache
+    c.assert_listed_binary({"pkg/0.1": ("da39a3ee5e6b4b0d3255bfef95601890afd80709", "Cache")})
+
+    # Expired, revalidated with the ETag of the previous response
+    c.save_home({"global.conf": "core.net.http:metadata_cache_ttl=0"})
+    c.run("install --requires=pkg/0.1 --update")
+    assert "If-None-Match: None" not in c.out
+    assert "STATUS: 304" in c.out
+    assert "STATUS: 200" not in c.out
+
+    # An upload invalidates the cached responses of that remote
+    c.save_home({"global.conf": "core.net.http:metadata_cache_ttl=1000"})
+    c.save({"conanfile.py": GenConanfile("pkg", "0.1").with_class_attribute("myattr = 1")})
+    c.run("create .")
+    new_rrev = c.exported_recipe_revision()
+    c.run("upload * -r=default -c")
+    c.run("remove * -c")
+    c.run("install --requires=pkg/0.1 --update")
+    assert f"pkg/0.1#{new_rrev} - Downloaded (default)" in c.out
+
+
+def test_remote_metadata_cache_users():
+    # The responses depend on the permissions of each user, they are not shared
+    server = TestServer([("*/*@*/*", "admin")], [("*/*@*/*", "admin")],
+                        users={"admin": "password", "other": "password"})
+    c = TestClient(requester_class=RequesterClass, servers={"default": server})
+    c.save({"conanfile.py": GenConanfile("pkg", "0.1")})
+    c.run("create .")
+    c.run("remote login default admin -p password")
+    c.run("upload * -r=default -c")
+    c.save_home({"global.conf": "core.net.http:metadata_cache_ttl=1000"})
+    c.run("install --requires=pkg/0.1 --update")
+    assert "LATEST: " in c.out
+
+    c.run("remote login default other -p password")
+    c.run("install --requires=pkg/0.1 --update", assert_error=True)
+    assert "LATEST: " in c.out
+    assert "Permission denied" in c.out
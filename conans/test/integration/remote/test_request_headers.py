@@ -1,3 +1,5 @@
+import pytest
+
 from conans.test.assets.genconanfile import GenConanfile
 from conans.test.utils.tools import TestClient, TestRequester
 
@@ -9,8 +11,12 @@ class RequesterClass(TestRequester):
         return super(RequesterClass, self).get(url, headers=headers, **kwargs)
 
 
-def test_request_info_headers():
+@pytest.mark.parametrize("parallel_fetch", [None, 4])
+def test_request_info_headers(parallel_fetch):
     c = TestClient(requester_class=RequesterClass, default_server_user=True)
+    if parallel_fetch:
+        c.save({"global.conf": f"core.graph:parallel_fetch={parallel_fetch}"},
+               path=c.cache.cache_folder)
     conanfile = GenConanfile("pkg", "0.1").with_settings('os', 'arch', 'compiler') \
                                           .with_shared_option(False)
     c.save({'conanfile.py': conanfile})
@@ -1,3 +1,4 @@
+import threading
 import unittest
 
 import mock
@@ -114,3 +115,36 @@ class TestTokenRefresh(unittest.TestCase):
             self.assertEqual(self.localdb.user, "myuser")
             self.assertEqual(self.localdb.access_token, "refreshed_access_token")
             self.assertEqual(self.localdb.refresh_token, "refresh_token")
+
+    def test_parallel_login(self):
+        """ the threads that fail to authenticate at the same time wait for the first one to log
+        in, and reuse its token, the user is asked only once
+        """
+        barrier = threading.Barrier(4)
+        get = RequesterWithTokenMock.get
+
+        def requester_get(requester, url, **kwargs):
+            if not kwargs["auth"].token:
+                barrier.wait(timeout=10)  # All the threads are rejected before any logs in
+            return get(requester, url, **kwargs)
+
+        errors = []
+
+        def call():
+            try:
+                self.auth_manager.call_rest_api_method(self.remote, "get_recipe", self.ref, ".",
+                                                       metadata=None, only_metadata=False)
+            except Exception as e:
+                errors.append(e)
+
+        with mock.patch("conans.client.rest.remote_credentials.UserInput.request_login",
+                        return_value=("myuser", "mypassword")) as request_login, \
+                mock.patch.object(RequesterWithTokenMock, "get", requester_get):
+            threads = [threading.Thread(target=call) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(request_login.call_count, 1)
+        self.assertEqual(self.localdb.access_token, "access_token")
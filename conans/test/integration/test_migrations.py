@@ -9,6 +9,17 @@ from conans.test.utils.tools import TestClient
 from conans.util.files import save, load
 
 
+def _get_indexes(cache_folder):
+    db = os.path.join(cache_folder, 'p', 'cache.sqlite3')
+    connection = sqlite3.connect(db, isolation_level=None, timeout=1, check_same_thread=False)
+    try:
+        r = connection.execute("SELECT name FROM sqlite_master WHERE type = 'index' "
+                               "AND name NOT LIKE 'sqlite_autoindex%'")
+        return sorted(row[0] for row in r.fetchall())
+    finally:
+        connection.close()
+
+
 def _drop_lru_column(cache_folder):
     db = os.path.join(cache_folder, 'p', 'cache.sqlite3')
     connection = sqlite3.connect(db, isolation_level=None, timeout=1, check_same_thread=False)
@@ -45,9 +56,15 @@ def test_migration_profile_checker_plugin(plugin_path, string_replace, new_strin
     contents = contents.replace(string_replace, new_string)
     save(profile_plugin_path, contents)
 
+    assert _get_indexes(t.cache.cache_folder) == []
+
     # Trigger the migrations
     t.run("-v")
     assert "WARN: Running 2.0.14 Cache DB migration to add LRU column" in t.out
+    assert "WARN: Running 2.0.14 Cache DB migration to add indexes" in t.out
+    assert _get_indexes(t.cache.cache_folder) == ["packages_reference_rrev_build_id_idx",
+                                                  "packages_reference_rrev_pkgid_timestamp_idx",
+                                                  "recipes_reference_timestamp_idx"]
     assert f"Migration: Successfully updated {os.path.basename(plugin_path)}" in t.out
     contents = load(profile_plugin_path)
     # Our changes are removed!!!
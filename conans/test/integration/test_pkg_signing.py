@@ -56,3 +56,29 @@ def test_pkg_sign():
     assert "Verifying ref:  pkg/0.1" in c.out
     assert "VERIFYING  conanfile.py" not in c.out  # It doesn't re-verify previous contents
     assert "VERIFYING  conan_sources.tgz" in c.out
+
+
+def test_pkg_sign_verify_before_extract():
+    """ the package files are not extracted to the package folder before verifying them
+    """
+    c = TestClient(default_server_user=True)
+    c.save({"conanfile.py": GenConanfile("pkg", "0.1").with_package_file("myfile", "mycontents!")})
+    signer = textwrap.dedent(r"""
+        import os
+
+        def sign(ref, artifacts_folder, signature_folder):
+            pass
+
+        def verify(ref, artifacts_folder, signature_folder, files):
+            package_folder = os.path.join(os.path.dirname(artifacts_folder), "p")
+            if ":" in str(ref):
+                print("Extracted before verify: ", os.path.exists(package_folder))
+                raise Exception("Wrong signature")
+        """)
+    save(os.path.join(c.cache.plugins_path, "sign", "sign.py"), signer)
+    c.run("create .")
+    c.run("upload * -r=default -c")
+    c.run("remove * -c")
+    c.run("install --requires=pkg/0.1", assert_error=True)
+    assert "Extracted before verify:  False" in c.out
+    assert "Wrong signature" in c.out
@@ -0,0 +1,127 @@
+import os
+import sqlite3
+import threading
+
+import pytest
+
+from conan.internal.cache.db.cache_database import CacheDatabase
+from conans.model.package_ref import PkgReference
+from conans.model.recipe_ref import RecipeReference
+from conans.test.utils.test_files import temp_folder
+
+
+def _connection(db):
+    with db._recipes.db_connection() as connection:
+        return connection
+
+
+def test_connection_reuse():
+    folder = temp_folder()
+    db_file = os.path.join(folder, "cache.sqlite3")
+    db = CacheDatabase(db_file)
+    connection = _connection(db)
+    assert _connection(db) is connection
+    assert _connection(CacheDatabase(db_file)) is connection
+
+    # sqlite3 connections cannot be used from other threads
+    other = []
+    thread = threading.Thread(target=lambda: other.append(_connection(db)))
+    thread.start()
+    thread.join()
+    assert other[0] is not connection
+
+    # If the database is replaced by a new one, the connection is not reused
+    os.rename(db_file, db_file + ".bak")
+    db = CacheDatabase(db_file)
+    assert _connection(db) is not connection
+    assert db.list_references() == []
+
+
+def test_close():
+    """ the connections of all the threads are closed, so the database file can be removed, and
+    they are opened again if the database is used later
+    """
+    db_file = os.path.join(temp_folder(), "cache.sqlite3")
+    db = CacheDatabase(db_file)
+    connection = _connection(db)
+    other = []
+    used = threading.Event()
+    closed = threading.Event()
+
+    def thread_connections():
+        other.append(_connection(db))
+        used.set()
+        closed.wait(timeout=10)
+        other.append(_connection(db))
+
+    thread = threading.Thread(target=thread_connections)
+    thread.start()
+    used.wait(timeout=10)
+    db.update_recipe_lru(RecipeReference.loads("pkg/0.1#rrev%1"))
+    db.close()
+    closed.set()
+    thread.join()
+    for c in (connection, other[0]):
+        with pytest.raises(sqlite3.ProgrammingError):
+            c.execute("SELECT 1")
+    assert other[1] is not other[0]
+    new_connection = _connection(db)
+    assert new_connection is not connection
+    assert db.list_references() == []
+
+
+def test_lru_batched():
+    db = CacheDatabase(os.path.join(temp_folder(), "cache.sqlite3"))
+    ref = RecipeReference.loads("pkg/0.1#rrev%1")
+    pref = PkgReference(ref, "pkgid", "prev", 1)
+    db.create_recipe("path1", ref)
+    db.create_package("path2", pref, None)
+    recipe_lru = db.get_recipe_lru(ref)
+    package_lru = db.get_package_lru(pref)
+    with db._recipes.db_connection() as connection:
+        connection.execute("UPDATE recipes SET lru = 0")
+        connection.execute("UPDATE packages SET lru = 0")
+
+    db.update_recipe_lru(ref)
+    db.update_package_lru(pref)
+    # Not written yet
+    assert db._recipes.get_recipe(ref)["lru"] == 0
+    assert db._packages.get(pref)["lru"] == 0
+    db.flush_lru()
+    assert db._recipes.get_recipe(ref)["lru"] >= recipe_lru
+    assert db._packages.get(pref)["lru"] >= package_lru
+
+
+def test_journal_mode():
+    # The WAL journal is opt-in, it doesn't work in network filesystems
+    db = CacheDatabase(os.path.join(temp_folder(), "cache.sqlite3"))
+    assert _connection(db).execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    db = CacheDatabase(os.path.join(temp_folder(), "cache.sqlite3"), wal=True)
+    assert _connection(db).execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_matching_build_id():
+    db = CacheDatabase(os.path.join(temp_folder(), "cache.sqlite3"))
+    ref = RecipeReference.loads("pkg/0.1#rrev%1")
+    db.create_recipe("path", ref)
+    db.create_package("path1", PkgReference(ref, "pkgid1", "prev1", 1), "build_id")
+    db.create_package("path2", PkgReference(ref, "pkgid2", "prev1", 1), "build_id")
+    db.create_package("path3", PkgReference(ref, "pkgid1", "prev2", 2), "other_build_id")
+    # The latest prev of pkgid1 has a different build_id
+    assert db.get_matching_build_id(ref, "build_id") == PkgReference(ref, "pkgid2", "prev1")
+    assert db.get_matching_build_id(ref, "other_build_id") == PkgReference(ref, "pkgid1",
+                                                                           "prev2")
+    assert db.get_matching_build_id(ref, "missing") is None
+    assert db.get_latest_package_reference(PkgReference(ref, "pkgid1")).revision == "prev2"
+    assert db.exists_prev(PkgReference(ref, "pkgid1", "prev1"))
+    assert not db.exists_prev(PkgReference(ref, "pkgid3"))
+
+
+def test_recipe_versions():
+    db = CacheDatabase(os.path.join(temp_folder(), "cache.sqlite3"))
+    for ref in ["pkg/1.0#rrev1%1", "pkg/1.0#rrev2%2", "pkg/1.10#rrev1%1", "pkg/1.2@user/chan#r%1",
+                "pkga/1.0#rrev1%1", "pkg-other/1.0#rrev1%1", "pk/1.0#rrev1%1"]:
+        db.create_recipe(f"path_{ref}", RecipeReference.loads(ref))
+    assert [repr(r) for r in db.get_recipe_versions("pkg")] == \
+           ["pkg/1.0", "pkg/1.2@user/chan", "pkg/1.10"]
+    assert db.get_recipe_versions("other") == []
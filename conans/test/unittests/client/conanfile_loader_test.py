@@ -4,9 +4,11 @@ import textwrap
 import unittest
 
 import pytest
+from mock import patch
 from parameterized import parameterized
 
-from conans.client.loader import ConanFileLoader, ConanFileTextLoader, load_python_file
+from conans.client.loader import ConanFileLoader, ConanFileTextLoader, load_python_file, \
+    RecipeBytecodeCache
 from conans.errors import ConanException
 from conans.test.utils.test_files import temp_folder
 from conans.util.files import save, chdir
@@ -247,3 +249,41 @@ def append(data):
             self.assertIs(loaded1.myconanlogger.value, loaded2.myconanlogger.value)
         finally:
             sys.path.remove(temp)
+
+
+def test_bytecode_cache():
+    """ the python files of the recipes in the cache are compiled just once, not the ones outside
+    """
+    store = temp_folder()
+    bytecode_folder = os.path.join(store, "pyc")
+    bytecode_cache = RecipeBytecodeCache(store, bytecode_folder)
+    recipe_folder = os.path.join(store, "pkg1234", "e")
+    save(os.path.join(recipe_folder, "conanfile.py"), "from helpers import value\nother = 2")
+    save(os.path.join(recipe_folder, "helpers.py"), "value = 1")
+
+    def _cached_files():
+        return [os.path.join(root, f) for root, _, files in os.walk(bytecode_folder) for f in files]
+
+    def _load(path):
+        with patch("conans.client.loader.compile", side_effect=compile, create=True) as comp:
+            loaded, _ = load_python_file(path, bytecode_cache)
+        return loaded, comp.call_count
+
+    loaded, compiled = _load(os.path.join(recipe_folder, "conanfile.py"))
+    assert (loaded.value, loaded.other, compiled) == (1, 2, 2)
+    assert len(_cached_files()) == 2
+    loaded, compiled = _load(os.path.join(recipe_folder, "conanfile.py"))
+    assert (loaded.value, loaded.other, compiled) == (1, 2, 0)
+
+    # A corrupted file is compiled again
+    for f in _cached_files():
+        save(f, "corrupted")
+    loaded, compiled = _load(os.path.join(recipe_folder, "conanfile.py"))
+    assert (loaded.value, loaded.other, compiled) == (1, 2, 2)
+
+    # Conanfiles out of the cache are never cached
+    consumer = temp_folder()
+    save(os.path.join(consumer, "conanfile.py"), "other = 3")
+    loaded, compiled = _load(os.path.join(consumer, "conanfile.py"))
+    assert (loaded.other, compiled) == (3, 0)
+    assert len(_cached_files()) == 2
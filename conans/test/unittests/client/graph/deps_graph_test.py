@@ -2,10 +2,11 @@ import unittest
 
 from mock import Mock
 
-from conans.client.graph.graph import CONTEXT_HOST
+from conans.client.graph.graph import CONTEXT_HOST, Edge, TransitiveRequirement
 from conans.client.graph.graph_builder import DepsGraph, Node
 from conans.model.conan_file import ConanFile
 from conans.model.recipe_ref import RecipeReference
+from conans.model.requires import Requirement
 
 
 class DepsGraphTest(unittest.TestCase):
@@ -111,3 +112,18 @@ class DepsGraphTest(unittest.TestCase):
         deps.add_edge(n2, n32, None)
         deps.add_edge(n32, n5, None)
         self.assertEqual([[n31, n5], [n32], [n2], [n1]], deps.by_levels())
+
+    def test_compact_nodes(self):
+        """ the graph objects don't have a __dict__, the big graphs have many of them
+        """
+        ref = RecipeReference.loads("hello/1.0@user/stable")
+        require = Requirement(ref)
+        n1 = Node(ref, Mock(), context=CONTEXT_HOST)
+        n2 = Node(ref, Mock(), context=CONTEXT_HOST)
+        edge = Edge(n1, n2, require)
+        transitive = TransitiveRequirement(require, n2)
+        for obj in (require, n1, edge, transitive):
+            self.assertFalse(hasattr(obj, "__dict__"))
+        n1.propagate_downstream(require, n2)
+        self.assertIs(n1.transitive_deps[require].node, n2)
+        self.assertIn("'ref': hello/1.0@user/stable", repr(require))
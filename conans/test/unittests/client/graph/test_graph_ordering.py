@@ -0,0 +1,138 @@
+import random
+
+import pytest
+
+from conans.client.graph.graph import CONTEXT_BUILD, CONTEXT_HOST, DepsGraph, Edge, Node
+from conans.client.graph.install_graph import InstallGraph, _InstallRecipeReference
+from conans.errors import ConanException
+from conans.model.recipe_ref import RecipeReference
+
+
+class _ConanFile:
+    # The ordering only needs the nodes topology, not real conanfiles
+    def __init__(self, name):
+        self.display_name = name
+
+
+def _chain(size):
+    return {i: [i - 1] if i else [] for i in range(size)}, set()
+
+
+def _diamonds(size):
+    """ wide diamonds: every top depends on all the nodes of the middle, that depend on the base
+    """
+    edges = {0: []}
+    middle = list(range(1, size // 2))
+    for i in middle:
+        edges[i] = [0]
+    for i in range(size // 2, size):
+        edges[i] = middle[:50] if i % 2 else middle[-50:]
+    return edges, set()
+
+
+def _build_requires(size):
+    """ a random graph of libraries, all of them tool-requiring some of a few tools
+    """
+    rnd = random.Random(size)
+    tools = list(range(10))
+    edges = {t: [] for t in tools}
+    for i in range(10, size):
+        deps = rnd.sample(range(10, i), min(i - 10, 5))
+        edges[i] = deps + rnd.sample(tools, 3)
+    return edges, set(tools)
+
+
+def _random(size):
+    rnd = random.Random(size)
+    return {i: rnd.sample(range(i), min(i, rnd.randint(0, 8))) for i in range(size)}, set()
+
+
+graphs = {"chain": _chain, "diamonds": _diamonds, "build_requires": _build_requires,
+          "random": _random}
+
+
+def _deps_graph(edges, tools):
+    graph = DepsGraph()
+    nodes = []
+    for i in edges:
+        ref = RecipeReference.loads(f"pkg{i % 97}/{i}.0")
+        context = CONTEXT_BUILD if i in tools else CONTEXT_HOST
+        node = Node(ref, _ConanFile(str(ref)), context=context)
+        graph.add_node(node)
+        nodes.append(node)
+    for i, deps in edges.items():
+        for d in deps:
+            # Not graph.add_edge(), its checks of the nodes are too slow for the big graphs
+            edge = Edge(nodes[i], nodes[d], None)
+            nodes[i].dependencies.append(edge)
+            nodes[d].dependants.append(edge)
+    return graph
+
+
+def _install_graph(edges):
+    install_graph = InstallGraph()
+    refs = [RecipeReference.loads(f"pkg{i}/1.0#rev") for i in edges]
+    for i, deps in edges.items():
+        install_ref = _InstallRecipeReference()
+        install_ref.ref = refs[i]
+        install_ref.depends = [refs[d] for d in deps]
+        install_graph._nodes[refs[i]] = install_ref
+    return install_graph
+
+
+def _by_levels_rescan(graph):
+    # The previous implementation, rescanning all the open nodes for every level
+    result = []
+    opened = dict.fromkeys(graph.nodes)
+    while opened:
+        current_level = [o for o in opened if not any(n in opened for n in o.neighbors())]
+        current_level.sort()
+        result.append(current_level)
+        for item in current_level:
+            opened.pop(item)
+    return result
+
+
+def _install_order_rescan(nodes):
+    levels = []
+    opened = nodes
+    while opened:
+        current_level = [o for o in opened.values() if not any(n in opened for n in o.depends)]
+        levels.append(current_level)
+        opened = {k: v for k, v in opened.items() if v not in current_level}
+    return levels
+
+
+@pytest.mark.parametrize("shape", graphs)
+def test_same_order(shape):
+    edges, tools = graphs[shape](300)
+    graph = _deps_graph(edges, tools)
+    assert graph.by_levels() == _by_levels_rescan(graph)
+    install_graph = _install_graph(edges)
+    assert install_graph.install_order() == _install_order_rescan(install_graph._nodes)
+
+
+def test_install_order_ignores_external_depends():
+    install_graph = _install_graph({0: [], 1: [0], 2: [1]})
+    external = RecipeReference.loads("other/1.0#rev")
+    for install_ref in install_graph._nodes.values():
+        install_ref.depends.append(external)
+    levels = install_graph.install_order()
+    assert [[n.ref.name for n in level] for level in levels] == [["pkg0"], ["pkg1"], ["pkg2"]]
+
+
+
+def test_install_order_loop():
+    install_graph = _install_graph({0: [], 1: [0, 2], 2: [1]})
+    with pytest.raises(ConanException, match="there is a loop in the dependencies of: pkg1/1.0"):
+        install_graph.install_order()
+
+
+@pytest.mark.parametrize("size", [1000, 5000, pytest.param(20000, marks=pytest.mark.slow)])
+@pytest.mark.parametrize("shape", graphs)
+def test_big_graphs_ordering(shape, size):
+    edges, tools = graphs[shape](size)
+    levels = _deps_graph(edges, tools).by_levels()
+    assert sum(len(level) for level in levels) == size
+    levels = _install_graph(edges).install_order()
+    assert sum(len(level) for level in levels) == size
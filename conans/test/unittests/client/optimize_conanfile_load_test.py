@@ -1,5 +1,9 @@
+import os
 import unittest
 
+from mock import patch
+
+from conans.test.assets.genconanfile import GenConanfile
 from conans.test.utils.tools import TestClient
 
 
@@ -41,3 +45,22 @@ class Pkg(ConanFile):
 
         client.run("create . --name=pkg --version=0.1 --user=user --channel=testing -pr=myprofile")
         self.assertIn("build/0.1@user/testing: MyCounter1 2, MyCounter2 1", client.out)
+
+    def test_cached_recipes_bytecode(self):
+        """ the recipes in the cache are compiled once and reused by later commands
+        """
+        client = TestClient()
+        client.save({"conanfile.py": GenConanfile("pkg", "0.1"),
+                     "consumer/conanfile.py": GenConanfile().with_requires("pkg/0.1")})
+        client.run("export .")
+        client.run("install consumer --build=missing")
+        bytecode_folder = client.cache.bytecode_folder
+        cached = [f for _, _, files in os.walk(bytecode_folder) for f in files]
+        self.assertEqual(1, len(cached))  # Only the pkg/0.1 recipe, not the consumer one
+        with patch("conans.client.loader.compile", create=True) as compile_mock:
+            client.run("install consumer")
+        compile_mock.assert_not_called()
+        self.assertIn("pkg/0.1: Already installed!", client.out)
+
+        client.run("cache clean")
+        self.assertFalse(os.path.exists(bytecode_folder))
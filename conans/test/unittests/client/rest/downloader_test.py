@@ -1,12 +1,16 @@
+import io
 import os
 import re
+import tarfile
 import tempfile
 import unittest
 
 import pytest
 
-from conans.client.downloaders.file_downloader import FileDownloader
+from conans.client.downloaders.file_downloader import FileDownloader, StreamExtraction
 from conans.errors import ConanException
+from conans.util.files import gzopen_without_timestamps, load, md5, zstd_available, \
+    zstdopen_without_timestamps
 
 
 class MockResponse(object):
@@ -113,3 +117,120 @@ class DownloaderUnitTest(unittest.TestCase):
         downloader.download("fake_url", file_path=self.target)
         actual_content = open(self.target, "rb").read()
         self.assertEqual(expected_content, actual_content)
+
+    def test_download_checksum(self):
+        content = b"some data"
+        downloader = FileDownloader(requester=MockRequester(content))
+        downloader.download("fake_url", file_path=self.target, md5=md5(content))
+        with pytest.raises(ConanException, match="md5 signature failed for 'target' file"):
+            downloader.download("fake_url", file_path=self.target, md5="1234", overwrite=True)
+        assert not os.path.exists(self.target)
+        # The resumed downloads compute the checksum from the file
+        downloader = FileDownloader(requester=MockRequester(content, chunk_size=4))
+        downloader.download("fake_url", file_path=self.target, md5=md5(content))
+
+    def test_download_chunked(self):
+        content = os.urandom(1000)
+        requester = MockRequester(content)
+        ranges = []
+        get = requester.get
+
+        def _get(*args, **kwargs):
+            ranges.append((kwargs.get("headers") or {}).get("range"))
+            return get(*args, **kwargs)
+
+        requester.get = _get
+        downloader = FileDownloader(requester=requester, chunked_threshold=1000,
+                                    chunked_parallel=3)
+        downloader.download("fake_url", file_path=self.target, md5=md5(content))
+        self.assertEqual(content, open(self.target, "rb").read())
+        # The first range is read from the first request, without range
+        self.assertEqual(sorted(ranges, key=str), [None, "bytes=334-667", "bytes=668-999"])
+
+        # Smaller files are downloaded in a single request
+        ranges.clear()
+        downloader = FileDownloader(requester=requester, chunked_threshold=1001)
+        downloader.download("fake_url", file_path=self.target, md5=md5(content), overwrite=True)
+        self.assertEqual(ranges, [None])
+        self.assertEqual(content, open(self.target, "rb").read())
+
+    def test_download_chunked_changed_file(self):
+        # The ranges of a file that changed in the server have a different total length
+        content = os.urandom(1000)
+        requester = MockRequester(content)
+        changed = MockRequester(content + b"changed")
+
+        def _get(*args, **kwargs):
+            if (kwargs.get("headers") or {}).get("range"):
+                return changed.get(*args, **kwargs)
+            return MockRequester.get(requester, *args, **kwargs)
+
+        requester.get = _get
+        downloader = FileDownloader(requester=requester, chunked_threshold=1000,
+                                    chunked_parallel=3)
+        with pytest.raises(ConanException, match="Error 206 downloading range 334-668"):
+            downloader.download("fake_url", file_path=self.target)
+
+
+def _tgz(files, zstd=False):
+    output = io.BytesIO()
+    if zstd:
+        tgz = zstdopen_without_timestamps("file.tzst", fileobj=output)
+    else:
+        tgz = gzopen_without_timestamps("file.tgz", mode="w", fileobj=output)
+    with tgz:
+        for name, content in files.items():
+            info = tarfile.TarInfo(name=name)
+            info.size = len(content)
+            tgz.addfile(tarinfo=info, fileobj=io.BytesIO(content))
+    return output.getvalue()
+
+
+class TestStreamExtraction:
+    files = {"file.txt": b"contents", "folder/other.h": b"header" * 100000}
+
+    def test_extract(self):
+        tgz = _tgz(self.files)
+        folder = tempfile.mkdtemp()
+        extraction = StreamExtraction(os.path.join(folder, "package"))
+        downloader = FileDownloader(requester=MockRequester(tgz))
+        downloader.download("fake_url", file_path=os.path.join(folder, "pkg.tgz"),
+                            extraction=extraction)
+        assert extraction.file_sums == {n: md5(c) for n, c in self.files.items()}
+        assert load(os.path.join(folder, "package", "file.txt")) == "contents"
+        with open(os.path.join(folder, "pkg.tgz"), "rb") as f:
+            assert f.read() == tgz
+
+    @pytest.mark.skipif(not zstd_available(), reason="Requires the 'zstandard' package")
+    def test_extract_zstd(self):
+        tzst = _tgz(self.files, zstd=True)
+        folder = tempfile.mkdtemp()
+        extraction = StreamExtraction(os.path.join(folder, "package"))
+        downloader = FileDownloader(requester=MockRequester(tzst))
+        downloader.download("fake_url", file_path=os.path.join(folder, "pkg.tzst"),
+                            extraction=extraction)
+        assert extraction.file_sums == {n: md5(c) for n, c in self.files.items()}
+        assert load(os.path.join(folder, "package", "file.txt")) == "contents"
+        assert tzst == _tgz(self.files, zstd=True)  # Deterministic, no timestamps
+
+    def test_resumed(self):
+        tgz = _tgz(self.files)
+        folder = tempfile.mkdtemp()
+        extraction = StreamExtraction(os.path.join(folder, "package"))
+        downloader = FileDownloader(requester=MockRequester(tgz, chunk_size=len(tgz) // 2))
+        downloader.download("fake_url", file_path=os.path.join(folder, "pkg.tgz"),
+                            extraction=extraction)
+        # It has to be extracted from the downloaded file
+        assert extraction.file_sums is None
+        assert not os.path.exists(os.path.join(folder, "package"))
+        with open(os.path.join(folder, "pkg.tgz"), "rb") as f:
+            assert f.read() == tgz
+
+    def test_corrupted(self):
+        folder = tempfile.mkdtemp()
+        extraction = StreamExtraction(os.path.join(folder, "package"))
+        downloader = FileDownloader(requester=MockRequester(b"not a tgz"))
+        downloader.download("fake_url", file_path=os.path.join(folder, "pkg.tgz"),
+                            extraction=extraction)
+        assert extraction.file_sums is None
+        assert not os.path.exists(os.path.join(folder, "package"))
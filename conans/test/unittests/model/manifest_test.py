@@ -1,11 +1,13 @@
+import json
 import os
 import platform
 
+import mock
 import pytest
 
-from conans.model.manifest import FileTreeManifest
+from conans.model.manifest import FileTreeManifest, ManifestHashesCache
 from conans.test.utils.test_files import temp_folder
-from conans.util.files import load, md5, save
+from conans.util.files import load, md5, md5sum, save
 
 
 @pytest.mark.skipif(platform.system() == "Windows", reason="decent symlinks only")
@@ -82,3 +84,88 @@ def test_pycache_included():
     manifest = repr(manifest)
     assert "pythonfile.pyc" in manifest
     assert "__pycache__/damn.py" in manifest
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="The cache is not used in Windows")
+def test_manifest_hashes_cache():
+    """ the files that didn't change are not hashed again
+    """
+    tmp_dir = temp_folder()
+    folder = os.path.join(tmp_dir, "p")
+    hashes = os.path.join(tmp_dir, "hashes.json")
+    files = {"one.txt": "one", "path/to/two.txt": "two", "three.txt": "three"}
+    for filename, content in files.items():
+        save(os.path.join(folder, filename), content)
+    expected = {f: md5(c) for f, c in files.items()}
+
+    # The recently modified files are not cached, as usually are modified right before hashing them
+    manifest = FileTreeManifest.create(folder, hashes_cache=hashes)
+    assert manifest.file_sums == expected
+    assert not os.path.exists(hashes)
+
+    with mock.patch.object(ManifestHashesCache, "_racy_time", -10**10):
+        manifest = FileTreeManifest.create(folder, hashes_cache=hashes)
+        assert manifest.file_sums == expected
+        assert len(json.loads(load(hashes))) == 3
+
+        with mock.patch("conans.model.manifest.md5sum", side_effect=md5sum) as md5sum_mock:
+            manifest = FileTreeManifest.create(folder, hashes_cache=hashes)
+            assert manifest.file_sums == expected
+            assert md5sum_mock.call_count == 0
+
+            # Even if the modification time is kept, the contents are hashed again
+            one = os.path.join(folder, "one.txt")
+            st = os.stat(one)
+            save(one, "ONE")
+            os.utime(one, ns=(st.st_atime_ns, st.st_mtime_ns))
+            os.remove(os.path.join(folder, "three.txt"))
+            manifest = FileTreeManifest.create(folder, hashes_cache=hashes)
+            assert manifest.file_sums == {"one.txt": md5("ONE"), "path/to/two.txt": md5("two")}
+            assert md5sum_mock.call_count == 1
+            assert len(json.loads(load(hashes))) == 2
+
+
+@pytest.mark.skipif(platform.system() == "Windows", reason="The cache is not used in Windows")
+def test_manifest_hashes_cache_modified_while_hashing():
+    """ the stored state of the file is the one before hashing it, not after
+    """
+    tmp_dir = temp_folder()
+    folder = os.path.join(tmp_dir, "p")
+    hashes = os.path.join(tmp_dir, "hashes.json")
+    one = os.path.join(folder, "one.txt")
+    save(one, "one")
+
+    def _modifying_md5sum(filepath):
+        result = md5sum(filepath)
+        save(filepath, "ONE")
+        return result
+
+    with mock.patch.object(ManifestHashesCache, "_racy_time", -10**10):
+        with mock.patch("conans.model.manifest.md5sum", side_effect=_modifying_md5sum):
+            manifest = FileTreeManifest.create(folder, hashes_cache=hashes)
+        assert manifest.file_sums == {"one.txt": md5("one")}
+        manifest = FileTreeManifest.create(folder, hashes_cache=hashes)
+        assert manifest.file_sums == {"one.txt": md5("ONE")}
+
+
+def test_manifest_hashes_cache_windows():
+    """ The ctime of Windows is the creation time, the changes of the files can't be detected
+    """
+    tmp_dir = temp_folder()
+    folder = os.path.join(tmp_dir, "p")
+    hashes = os.path.join(tmp_dir, "hashes.json")
+    save(os.path.join(folder, "one.txt"), "one")
+    with mock.patch.object(ManifestHashesCache, "_racy_time", -10**10):
+        with mock.patch("platform.system", return_value="Windows"):
+            manifest = FileTreeManifest.create(folder, hashes_cache=hashes)
+    assert manifest.file_sums == {"one.txt": md5("one")}
+    assert not os.path.exists(hashes)
+
+
+def test_manifest_parallel_hashing():
+    tmp_dir = temp_folder()
+    files = {"file%s.txt" % i: "contents %s" % i for i in range(50)}
+    for filename, content in files.items():
+        save(os.path.join(tmp_dir, filename), content)
+    manifest = FileTreeManifest.create(tmp_dir)
+    assert manifest.file_sums == {f: md5(c) for f, c in files.items()}
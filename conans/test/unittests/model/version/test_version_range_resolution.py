@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+from conans.model.version import Version
+from conans.model.version_range import VersionRange
+
+
+def _versions():
+    """ a realistic list of versions of a library, with pre-releases, builds and cci versions
+    """
+    result = []
+    for major in range(4):
+        for minor in range(12):
+            for patch in range(6):
+                result.append(f"{major}.{minor}.{patch}")
+            result.append(f"{major}.{minor}")
+            result.append(f"{major}.{minor}.0-rc.1")
+            result.append(f"{major}.{minor}.0-alpha+b{minor}")
+            result.append(f"{major}.{minor}.1+build.{major}")
+    result.extend(f"cci.2023{month:02d}01" for month in range(1, 13))
+    random.Random(42).shuffle(result)
+    return sorted(Version(v) for v in result)
+
+
+ranges = ["*", ">=1.2 <2", "~2.5", "^1.3.1", "2.3.4", "=1.0", ">1 <=2.5.3", "<1.0",
+          ">=3.11.5", "1.2.3 || ~2.1", ">=1.0-alpha <1.0.1, include_prerelease", ">=5",
+          "<0.0.1", "<=2.0.0", ">cci.20230101 <cci.20230601"]
+
+
+def _latest_index_linear(version_range, versions, resolve_prerelease):
+    # The previous resolution, checking all the versions from the latest one
+    for index in range(len(versions) - 1, -1, -1):
+        if version_range.contains(versions[index], resolve_prerelease):
+            return index
+
+
+@pytest.mark.parametrize("resolve_prerelease", [None, True, False])
+@pytest.mark.parametrize("expression", ranges)
+def test_latest_index(expression, resolve_prerelease):
+    versions = _versions()
+    assert all(v.ordered for v in versions)
+    expected = _latest_index_linear(VersionRange(expression), versions, resolve_prerelease)
+    version_range = VersionRange(expression)
+    assert version_range.latest_index(versions, resolve_prerelease) == expected
+    # Not ordered versions are checked one by one
+    assert version_range.latest_index(versions, resolve_prerelease, ordered=False) == expected
+
+
+def test_latest_index_not_ordered():
+    versions = sorted(Version(v) for v in ["1.0", "1.1a", "1.1", "1.2*", "1.10", "2.0"])
+    assert not all(v.ordered for v in versions)
+    assert VersionRange("<1.2").latest_index(versions, None, ordered=False) == \
+           _latest_index_linear(VersionRange("<1.2"), versions, None)
+    assert VersionRange("<1.1a").latest_index(versions, None) == \
+           _latest_index_linear(VersionRange("<1.1a"), versions, None)
+
+
+def test_resolution_checked_versions():
+    """ Resolving the same ranges against the same versions as a big graph does, the bisect and
+    the memoized checks of the VersionRange have to check far less versions than the linear scan
+    """
+    versions = _versions()
+    version_ranges = {expression: VersionRange(expression) for expression in ranges}
+    for expression in ranges * 50:
+        version_ranges[expression].latest_index(versions, None)
+
+    checked = sum(len(r._contained) for r in version_ranges.values())
+    assert checked < len(ranges) * len(versions) / 2
+
+
+def test_sort_parsed_versions():
+    versions = [str(v) for v in _versions()]
+    parsed = [Version(v) for v in versions * 20]
+    assert sorted(parsed[:len(versions)]) == sorted(parsed[-len(versions):])
@@ -127,3 +127,16 @@ class ConanServiceTest(unittest.TestCase):
         self.assertRaises(NotFoundException,
                           self.service.remove_recipe,
                           RecipeReference("Fake", "1.0", "lasote", "stable"), "lasote")
+
+    def test_get_latest_packages_references_permissions(self):
+        """ The packages that the user can't read are not in the result, but don't fail the others
+        """
+        ref2 = RecipeReference.loads("private/1.0@other/testing#%s" % DEFAULT_REVISION)
+        authorizer = BasicAuthorizer([("openssl/*@*/*", "*")], [])
+        service = ConanServiceV2(authorizer, self.server_store)
+        missing = PkgReference(self.ref, "missing")
+        forbidden = PkgReference(ref2, "123123123")
+        result = service.get_latest_packages_references([PkgReference(self.ref, "123123123"),
+                                                         missing, forbidden], "lasote")
+        self.assertEqual(len(result), 2)
+        self.assertIsNone(result[missing])
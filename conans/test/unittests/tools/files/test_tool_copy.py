@@ -1,11 +1,14 @@
 import mock
 import os
 import platform
+import time
 import unittest
 
 import pytest
 
 from conan.tools.files import copy
+from conan.tools.files.copy_pattern import copy_listing_cache
+from conans.test.utils.mocks import ConanFileMock
 from conans.test.utils.test_files import temp_folder
 from conans.util.files import load, save, mkdir
 
@@ -256,3 +259,72 @@ class ToolCopyTest(unittest.TestCase):
                          sorted(os.listdir(os.path.join(dst_folder, "include"))))
         self.assertEqual(sorted(["AttributeStorage.h", "file.h"]),
                          sorted(os.listdir(os.path.join(dst_folder, "include", "sub"))))
+
+    def test_multiple_patterns(self):
+        src_folder = temp_folder()
+        save(os.path.join(src_folder, "include/file.h"), "")
+        save(os.path.join(src_folder, "include/file.hpp"), "")
+        save(os.path.join(src_folder, "include/file.cpp"), "")
+        save(os.path.join(src_folder, "include/test/file_test.h"), "")
+
+        dst_folder = temp_folder()
+        copied = copy(None, ["*.h", "*.hpp", "include/*.h"], src_folder, dst_folder,
+                      excludes="*test*")
+        self.assertEqual(sorted(["file.h", "file.hpp"]),
+                         sorted(os.listdir(os.path.join(dst_folder, "include"))))
+        self.assertEqual(2, len(copied))  # Matching several patterns is copied once
+
+    def test_listing_cache(self):
+        src_folder = temp_folder()
+        save(os.path.join(src_folder, "sub/file.h"), "")
+        # Not modified recently, otherwise its listing is not reused
+        old = time.time() - 10
+        os.utime(os.path.join(src_folder, "sub"), (old, old))
+
+        dst_folder = temp_folder()
+        with copy_listing_cache():
+            with mock.patch("os.scandir", wraps=os.scandir) as scandir:
+                copy(None, "*.h", src_folder, dst_folder)
+                scanned = scandir.call_count
+                copy(None, "*.h", src_folder, dst_folder)
+                self.assertEqual(scanned + 1, scandir.call_count)  # only the modified root
+            # New files are found, the modified folders are listed again
+            save(os.path.join(src_folder, "sub/other.h"), "")
+            copied = copy(None, "*.h", src_folder, os.path.join(dst_folder, "other"))
+        self.assertEqual(sorted(["file.h", "other.h"]),
+                         sorted(os.listdir(os.path.join(dst_folder, "other", "sub"))))
+        self.assertEqual(2, len(copied))
+
+    def test_parallel_hardlink(self):
+        src_folder = temp_folder()
+        for i in range(20):
+            save(os.path.join(src_folder, f"sub{i % 3}/file{i}.txt"), f"hello{i}")
+        save(os.path.join(src_folder, "sub0/file.txt"), "first")
+        save(os.path.join(src_folder, "sub1/file.txt"), "last")
+
+        conanfile = ConanFileMock()
+        conanfile.conf.define("tools.files.copy:parallel", 4)
+        dst_folder = temp_folder()
+        copied = copy(conanfile, "*.txt", src_folder, dst_folder)
+        self.assertEqual(22, len(copied))
+        self.assertEqual("hello7", load(os.path.join(dst_folder, "sub1/file7.txt")))
+        # The last of the files with the same name, as the sequential copy
+        sequential_folder = temp_folder()
+        copy(None, "*.txt", src_folder, sequential_folder, keep_path=False)
+        dst_folder = temp_folder()
+        copy(conanfile, "*.txt", src_folder, dst_folder, keep_path=False)
+        self.assertEqual(load(os.path.join(sequential_folder, "file.txt")),
+                         load(os.path.join(dst_folder, "file.txt")))
+
+        conanfile.conf.define("tools.files.copy:link", "hardlink")
+        dst_folder = temp_folder()
+        # Only the files packaged from the build folder are hardlinked
+        copy(conanfile, "*.txt", src_folder, dst_folder)
+        self.assertFalse(os.path.samefile(os.path.join(src_folder, "sub1/file7.txt"),
+                                          os.path.join(dst_folder, "sub1/file7.txt")))
+        conanfile.folders.set_base_build(src_folder)
+        conanfile.folders.set_base_package(dst_folder)
+        copy(conanfile, "*.txt", src_folder, os.path.join(dst_folder, "pkg"))
+        self.assertEqual("hello7", load(os.path.join(dst_folder, "pkg/sub1/file7.txt")))
+        self.assertTrue(os.path.samefile(os.path.join(src_folder, "sub1/file7.txt"),
+                                         os.path.join(dst_folder, "pkg/sub1/file7.txt")))
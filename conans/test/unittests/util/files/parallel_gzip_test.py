@@ -0,0 +1,49 @@
+import gzip
+import io
+import os
+import random
+from multiprocessing.pool import ThreadPool
+
+import pytest
+
+from conans.util.parallel_gzip import ParallelGzipWriter
+
+
+@pytest.fixture
+def small_blocks(monkeypatch):
+    monkeypatch.setattr(ParallelGzipWriter, "block_size", 64 * 1024)
+    monkeypatch.setattr(ParallelGzipWriter, "max_pending", 3)
+
+
+def _compress(data, threads, compresslevel=9, write_size=10000):
+    output = io.BytesIO()
+    pool = ThreadPool(threads)
+    writer = ParallelGzipWriter("file.tgz", output, compresslevel, pool)
+    for i in range(0, len(data), write_size):
+        writer.write(data[i:i + write_size])
+    writer.close()
+    pool.close()
+    pool.join()
+    return output.getvalue()
+
+
+@pytest.mark.usefixtures("small_blocks")
+@pytest.mark.parametrize("size", [0, 100, 64 * 1024, 1000 * 1000])
+def test_parallel_gzip(size):
+    random.seed(size)
+    data = bytes(random.choice(b"abcdefgh") for _ in range(size))
+    compressed = _compress(data, threads=4)
+    assert gzip.decompress(compressed) == data
+    # Deterministic, not depending on the number of threads or the size of the writes
+    assert _compress(data, threads=1, write_size=size or 1) == compressed
+    # Same header as GzipFile, and similar compression ratio
+    expected = io.BytesIO()
+    with gzip.GzipFile("file.tgz", "wb", 9, expected, mtime=0) as f:
+        f.write(data)
+    assert compressed[:20] == expected.getvalue()[:20]
+    assert len(compressed) < len(expected.getvalue()) * 1.05 + 20
+
+
+def test_compresslevel():
+    data = os.urandom(100) * 1000
+    assert gzip.decompress(_compress(data, threads=2, compresslevel=1)) == data
@@ -4,6 +4,7 @@ import os
 import platform
 import tarfile
 import unittest
+from unittest import mock
 
 import pytest
 
@@ -61,3 +62,43 @@ class TarExtractTest(unittest.TestCase):
             with open(self.tgz_file, 'rb') as file_handler:
                 tar_extract(file_handler, destination_dir)
             check_files(destination_dir)
+
+    @pytest.mark.skipif(not hasattr(tarfile, "data_filter"), reason="Requires extraction filters")
+    def test_outside_destination(self):
+        tgz_file = os.path.join(self.tmp_folder, "evil.tgz")
+        with gzopen_without_timestamps("name", mode="w", fileobj=open(tgz_file, "wb")) as tgz:
+            with open(os.path.join(self.tmp_folder, "ori", "file1"), "rb") as file_handler:
+                tgz.addfile(tarinfo=tarfile.TarInfo(name="../evil"), fileobj=file_handler)
+        destination_dir = os.path.join(self.tmp_folder, "dest")
+        with open(tgz_file, "rb") as file_handler:
+            with pytest.raises(tarfile.OutsideDestinationError):
+                tar_extract(file_handler, destination_dir, data_filter=True)
+        assert not os.path.exists(os.path.join(self.tmp_folder, "evil"))
+        # Without the filter, everything is extracted as it always was
+        os.makedirs(destination_dir, exist_ok=True)
+        with open(tgz_file, "rb") as file_handler:
+            tar_extract(file_handler, destination_dir)
+        assert os.path.exists(os.path.join(self.tmp_folder, "evil"))
+
+    @pytest.mark.skipif(platform.system() == "Windows", reason="Requires Linux or Mac")
+    def test_links(self):
+        # The symlinks to absolute paths are kept. The hardlinks that can't be linked (different
+        # filesystems, etc) are extracted again from the file, it has to be seekable
+        tgz_file = os.path.join(self.tmp_folder, "links.tgz")
+        with gzopen_without_timestamps("name", mode="w", fileobj=open(tgz_file, "wb")) as tgz:
+            with open(os.path.join(self.tmp_folder, "ori", "file1"), "rb") as file_handler:
+                tgz.addfile(tarinfo=tarfile.TarInfo(name="file1"), fileobj=file_handler)
+            info = tarfile.TarInfo(name="hardlink")
+            info.type, info.linkname = tarfile.LNKTYPE, "file1"
+            tgz.addfile(tarinfo=info)
+            info = tarfile.TarInfo(name="symlink")
+            info.type, info.linkname = tarfile.SYMTYPE, self.tmp_folder
+            tgz.addfile(tarinfo=info)
+        destination_dir = os.path.join(self.tmp_folder, "dest")
+        file_sums = {}
+        with open(tgz_file, "rb") as file_handler:
+            with mock.patch("os.link", side_effect=OSError("Cross-device link")):
+                tar_extract(file_handler, destination_dir, file_sums=file_sums)
+        assert os.path.isfile(os.path.join(destination_dir, "hardlink"))
+        assert os.readlink(os.path.join(destination_dir, "symlink")) == self.tmp_folder
+        assert file_sums["hardlink"] == file_sums["file1"]
@@ -222,7 +222,9 @@ class TestRequester:
             kwargs.pop("cert", None)
             kwargs.pop("timeout", None)
             if "data" in kwargs:
-                total_data = kwargs["data"].read()
+                total_data = kwargs["data"]
+                if hasattr(total_data, "read"):
+                    total_data = total_data.read()
                 kwargs["params"] = total_data
                 del kwargs["data"]  # Parameter in test app is called "params"
             if kwargs.get("json"):
@@ -12,6 +12,7 @@ from contextlib import contextmanager
 
 
 from conans.errors import ConanException
+from conans.util.parallel_gzip import ParallelGzipWriter
 
 _DIRTY_FOLDER = ".dirty"
 
@@ -244,10 +245,12 @@ def mkdir(path):
     os.makedirs(path)
 
 
-def gzopen_without_timestamps(name, mode="r", fileobj=None, compresslevel=None, **kwargs):
+def gzopen_without_timestamps(name, mode="r", fileobj=None, compresslevel=None, thread_pool=None,
+                              **kwargs):
     """ !! Method overrided by laso to pass mtime=0 (!=None) to avoid time.time() was
         setted in Gzip file causing md5 to change. Not possible using the
         previous tarfile open because arguments are not passed to GzipFile constructor
+        If a ``thread_pool`` is provided for writing, the compression is done in parallel
     """
 
     if mode not in ("r", "w"):
@@ -255,7 +258,10 @@ def gzopen_without_timestamps(name, mode="r", fileobj=None, compresslevel=None,
 
     try:
         compresslevel = compresslevel if compresslevel is not None else 9  # default Gzip = 9
-        fileobj = gzip.GzipFile(name, mode, compresslevel, fileobj, mtime=0)
+        if thread_pool is not None and mode == "w":
+            fileobj = ParallelGzipWriter(name, fileobj, compresslevel, thread_pool)
+        else:
+            fileobj = gzip.GzipFile(name, mode, compresslevel, fileobj, mtime=0)
     except OSError:
         if fileobj is not None and mode == 'r':
             raise tarfile.ReadError("not a gzip file")
@@ -278,12 +284,131 @@ def gzopen_without_timestamps(name, mode="r", fileobj=None, compresslevel=None,
     return t
 
 
-def tar_extract(fileobj, destination_dir):
-    the_tar = tarfile.open(fileobj=fileobj)
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        raise ConanException("The 'zstandard' Python package is needed for the zstd (.tzst) "
+                             "compressed files, install it with 'pip install zstandard'")
+    return zstandard
+
+
+def zstd_available():
+    try:
+        import zstandard  # noqa
+    except ImportError:
+        return False
+    return True
+
+
+def archive_compression(filename):
+    """ the compression of the Conan archives, "zstd" for the .tzst ones, None for the .tgz (gzip
+    is autodetected when reading)
+    """
+    return "zstd" if filename.endswith(".tzst") else None
+
+
+def zstdopen_without_timestamps(name, fileobj, compresslevel=None):
+    """ opens a tar file for writing to ``fileobj`` compressed with zstd. As the zstd frames do
+    not store timestamps, the same contents always produce the same file, like the tgz ones
+    """
+    zstandard = _zstandard()
+    compressor = zstandard.ZstdCompressor(level=compresslevel if compresslevel is not None else 3)
+    fileobj = compressor.stream_writer(fileobj, closefd=False)
+    try:
+        t = tarfile.TarFile.taropen(name, "w", fileobj, format=tarfile.PAX_FORMAT)
+    except Exception:
+        fileobj.close()
+        raise
+    t._extfileobj = False  # Closing the tar finishes the zstd frame
+    return t
+
+
+class _MD5Reader:
+    """ reads from the tar stream while computing the md5 of the contents read
+    """
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        try:
+            self._md5 = hashlib.md5()
+        except ValueError:  # FIPS error https://github.com/conan-io/conan/issues/7800
+            self._md5 = hashlib.md5(usedforsecurity=False)
+
+    def seek(self, pos):
+        self._fileobj.seek(pos)
+
+    def tell(self):
+        return self._fileobj.tell()
+
+    def read(self, size=None):
+        data = self._fileobj.read(size)
+        self._md5.update(data)
+        return data
+
+    def hexdigest(self):
+        return self._md5.hexdigest()
+
+
+class _ManifestTarFile(tarfile.TarFile):
+    """ computes the same md5 that FileTreeManifest computes for every extracted file while it is
+    written, so it is not necessary to read it again from disk
+    """
+    file_sums = None
+
+    def makefile(self, tarinfo, targetpath):
+        fileobj = self.fileobj
+        self.fileobj = reader = _MD5Reader(fileobj)
+        try:
+            super().makefile(tarinfo, targetpath)
+        finally:
+            self.fileobj = fileobj
+        self.file_sums[tarinfo.name] = reader.hexdigest()
+
+    def makelink(self, tarinfo, targetpath):
+        super().makelink(tarinfo, targetpath)
+        if tarinfo.issym():  # For a symlink: md5 of the pointing path
+            self.file_sums[tarinfo.name] = md5(tarinfo.linkname)
+        elif tarinfo.islnk():  # A hardlink has the contents of the file it links
+            linked_md5 = self.file_sums.get(tarinfo.linkname)
+            if linked_md5 is not None:
+                self.file_sums[tarinfo.name] = linked_md5
+
+
+def _extraction_filter(member, path):
+    """ The tarfile "data" filter: no absolute paths or paths outside the destination, no device
+    files... But the symlinks can point to absolute paths or outside the package, they are stored
+    and extracted as they are, as Conan always did
+    """
+    try:
+        return tarfile.data_filter(member, path)
+    except (tarfile.AbsoluteLinkError, tarfile.LinkOutsideDestinationError):
+        if not member.issym():
+            raise
+        return tarfile.tar_filter(member, path)
+
+
+def tar_extract(fileobj, destination_dir, file_sums=None, compression=None, stream=False,
+                data_filter=False):
+    """ With stream=True the tar is read as a stream, so ``fileobj`` doesn't need to be seekable
+    and it can be extracted while it is being downloaded. The zstd ones are always read as a stream
+    If a ``file_sums`` dict is provided, it is filled with {filename: md5} of the extracted files
+    The gzip compression is autodetected, compression="zstd" has to be explicit
+    With data_filter=True the members outside the destination, device files, etc. are rejected
+    (tarfile "data" filter, when the Python version has it), otherwise everything is extracted
+    """
+    if compression == "zstd":
+        fileobj = _zstandard().ZstdDecompressor().stream_reader(fileobj)
+        stream = True
+    the_tar = _ManifestTarFile.open(fileobj=fileobj, mode="r|*" if stream else "r:*")
+    the_tar.file_sums = file_sums if file_sums is not None else {}
     # NOTE: The errorlevel=2 has been removed because it was failing in Win10, it didn't allow to
     # "could not change modification time", with time=0
     # the_tar.errorlevel = 2  # raise exception if any error
-    the_tar.extractall(path=destination_dir)
+    if hasattr(tarfile, "data_filter"):  # Python >= 3.8.17, 3.9.17, 3.10.12, 3.11.4
+        extraction_filter = _extraction_filter if data_filter else "fully_trusted"
+        the_tar.extractall(path=destination_dir, filter=extraction_filter)
+    else:
+        the_tar.extractall(path=destination_dir)
     the_tar.close()
 
 
@@ -294,6 +419,43 @@ def exception_message_safe(exc):
         return repr(exc)
 
 
+_FICLONE = 0x40049409  # Linux ioctl to clone a file, in copy-on-write filesystems (btrfs, xfs)
+
+
+def _reflink(src, dst):
+    if platform.system() != "Linux":
+        return False
+    import fcntl
+    try:
+        with open(src, "rb") as fsrc:
+            if os.path.lexists(dst):
+                os.remove(dst)  # Not writing through an existing hardlink
+            with open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+    except OSError:
+        return False
+    return True
+
+
+def copy_file(src, dst, link=None):
+    """ shutil.copy2() a file, or with link="hardlink" or "reflink" (copy-on-write clone) when it
+    is possible, falling back to a copy, for example in different filesystems
+    """
+    if link == "hardlink":
+        try:
+            if os.path.lexists(dst):
+                os.remove(dst)
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+    elif link == "reflink":
+        if _reflink(src, dst):
+            shutil.copystat(src, dst)
+            return
+    shutil.copy2(src, dst)
+
+
 def merge_directories(src, dst, excluded=None):
     from conan.tools.files import copy
     copy(None, pattern="*", src=src, dst=dst, excludes=excluded)
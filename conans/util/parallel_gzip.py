@@ -0,0 +1,87 @@
+import os
+import struct
+import zlib
+from collections import deque
+
+
+class ParallelGzipWriter:
+    """ Writable file-like object that compresses in gzip format using several threads, like pigz
+    does: the input is split in blocks that are deflated independently in the given thread_pool,
+    every block using the end of the previous one as dictionary, to not lose compression ratio.
+    The result is a regular, single member, gzip file. It is deterministic, it only depends on the
+    input, the compression level and the block size, not on the number of threads.
+    """
+    block_size = 1024 * 1024
+    max_pending = 64  # Blocks being compressed or waiting to be written, to limit the memory
+    _dict_size = 32 * 1024  # The deflate window
+
+    def __init__(self, name, fileobj, compresslevel, thread_pool):
+        self._fileobj = fileobj
+        self._compresslevel = compresslevel
+        self._thread_pool = thread_pool
+        self._pending = deque()  # AsyncResult of the compressed blocks, in order
+        self._buffer = bytearray()
+        self._last_block = b""
+        self._crc = zlib.crc32(b"")
+        self._size = 0
+        self._write_header(name)
+
+    def _write_header(self, name):
+        # The same header as gzip.GzipFile(name, mtime=0) writes
+        fname = os.path.basename(name).encode("latin-1")
+        if fname.endswith(b".gz"):
+            fname = fname[:-3]
+        flags = 0x08 if fname else 0  # FNAME
+        if self._compresslevel == 9:
+            xfl = 2
+        elif self._compresslevel == 1:
+            xfl = 4
+        else:
+            xfl = 0
+        header = struct.pack("<BBBBLBB", 0x1f, 0x8b, 8, flags, 0, xfl, 255)
+        if fname:
+            header += fname + b"\000"
+        self._fileobj.write(header)
+
+    def tell(self):
+        return self._size
+
+    def write(self, data):
+        self._buffer += data
+        self._crc = zlib.crc32(data, self._crc)
+        self._size += len(data)
+        while len(self._buffer) >= self.block_size:
+            block = bytes(self._buffer[:self.block_size])
+            del self._buffer[:self.block_size]
+            self._compress(block, last=False)
+        return len(data)
+
+    def _compress(self, block, last):
+        args = block, self._last_block[-self._dict_size:], self._compresslevel, last
+        self._pending.append(self._thread_pool.apply_async(_deflate, args))
+        self._last_block = block
+        while self._pending and (len(self._pending) > self.max_pending or
+                                 self._pending[0].ready()):
+            self._fileobj.write(self._pending.popleft().get())
+
+    def close(self):
+        if self._fileobj is None:
+            return
+        self._compress(bytes(self._buffer), last=True)
+        self._buffer = None
+        while self._pending:
+            self._fileobj.write(self._pending.popleft().get())
+        self._fileobj.write(struct.pack("<LL", self._crc, self._size & 0xffffffff))
+        self._fileobj = None
+
+
+def _deflate(block, zdict, compresslevel, last):
+    if zdict:
+        compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS,
+                                      zlib.DEF_MEM_LEVEL, zlib.Z_DEFAULT_STRATEGY, zdict)
+    else:
+        compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS)
+    # The non-final blocks are byte aligned and not marked as the last one, so they can be
+    # concatenated in a single deflate stream
+    return compressor.compress(block) + compressor.flush(zlib.Z_FINISH if last
+                                                         else zlib.Z_SYNC_FLUSH)
@@ -37,6 +37,10 @@ def _generic_algorithm_sum(file_path, algorithm_name):
 
 def check_with_algorithm_sum(algorithm_name, file_path, signature):
     real_signature = _generic_algorithm_sum(file_path, algorithm_name)
+    check_signature(algorithm_name, file_path, signature, real_signature)
+
+
+def check_signature(algorithm_name, file_path, signature, real_signature):
     if real_signature != signature.lower():
         raise ConanException("%s signature failed for '%s' file. \n"
                              " Provided signature: %s  \n"